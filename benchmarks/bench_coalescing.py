@@ -0,0 +1,80 @@
+"""
+Benchmark: concurrent tool calls with single-flight request coalescing
+
+Runs every public tool cold, one at a time (clearing the cache in
+between), then all of them at once through server.call_tool, against a
+local stub server. Concurrent calls share in-flight fetches, so the
+concurrent round should cost about as many upstream requests as the most
+expensive tool alone rather than the sum.
+
+Usage:
+    python benchmarks/bench_coalescing.py [--latency 0.05]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sport_suggest_mcp import client, server, snapshot, tools  # noqa: E402
+from sport_suggest_mcp.cache import get_cache  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+
+CALLS = (
+    ("get_nba_recommendation_data", {"compact": True}),
+    ("get_nba_rosters", {}),
+    ("get_nba_player_rankings", {}),
+    ("get_nba_scores", {}),
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    stub = StubServer(latency=args.latency).start()
+    tools.SITE_API_BASE = stub.site_api_base
+    tools.CORE_API_BASE = stub.core_api_base
+    snapshot.SNAPSHOT_PATH = ""
+    client.configure(rate_limit=0)  # the upstream rate limit is not under test
+
+    print(f"stub latency {args.latency * 1000:.0f} ms\n")
+
+    total = 0
+    for name, arguments in CALLS:
+        get_cache().clear()
+        before = stub.request_count
+        asyncio.run(server.call_tool(name, arguments))
+        requests = stub.request_count - before
+        total += requests
+        print(f"{name:>28}: {requests:4d} requests alone")
+
+    async def all_at_once():
+        await asyncio.gather(*(server.call_tool(name, args) for name, args in CALLS))
+
+    get_cache().clear()
+    before = stub.request_count
+    flights_before = client.get_coalescing_stats()["coalesced"]
+    start = time.perf_counter()
+    asyncio.run(all_at_once())
+    elapsed = time.perf_counter() - start
+
+    print(f"\n{'sum of cold calls':>28}: {total:4d} requests")
+    print(
+        f"{'all concurrently':>28}: {stub.request_count - before:4d} requests"
+        f" in {elapsed:.2f}s"
+    )
+    print(
+        f"{'coalesced':>28}: {client.get_coalescing_stats()['coalesced'] - flights_before:4d}"
+        f" requests, {get_cache().stats()['coalesced']} cache loads"
+    )
+
+    stub.shutdown()
+
+
+if __name__ == "__main__":
+    main()
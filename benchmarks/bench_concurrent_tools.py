@@ -0,0 +1,61 @@
+"""
+Load test: concurrent MCP tool calls, blocking vs offloaded
+
+Fires N get_nba_scores calls at once against a local stub server with
+caching disabled. "blocking" calls the tool directly inside the coroutine
+(the old call_tool behavior), "offloaded" goes through server.call_tool.
+Offloaded calls should finish in about max(latency), blocking ones in
+about sum(latency).
+
+Usage:
+    python benchmarks/bench_concurrent_tools.py [--calls 8] [--latency 0.2]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sport_suggest_mcp import client, server, snapshot, tools  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+
+
+async def blocking_call():
+    return tools.get_nba_scores()
+
+
+async def offloaded_call():
+    return await server.call_tool("get_nba_scores", {})
+
+
+async def run(call, count: int) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(*(call() for _ in range(count)))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.2)
+    args = parser.parse_args()
+
+    stub = StubServer(latency=args.latency).start()
+    tools.SITE_API_BASE = stub.site_api_base
+    client.ENDPOINT_TTLS["scoreboard"] = 0  # every call goes upstream
+    snapshot.SNAPSHOT_PATH = ""
+    client.configure(rate_limit=0)  # the upstream rate limit is not under test
+
+    print(f"{args.calls} concurrent calls, stub latency {args.latency * 1000:.0f} ms\n")
+    for label, call in (("blocking", blocking_call), ("offloaded", offloaded_call)):
+        elapsed = asyncio.run(run(call, args.calls))
+        print(f"{label:>10}: {elapsed:6.2f}s")
+
+    stub.shutdown()
+
+
+if __name__ == "__main__":
+    main()
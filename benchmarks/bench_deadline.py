@@ -0,0 +1,71 @@
+"""
+Benchmark: cold get_nba_recommendation_data against a slow upstream, with and without a deadline
+Shows the bounded tail latency and which sections come back degraded
+
+Every call starts from an empty cache against a stub server with high
+latency and jitter, so without a deadline the call takes as long as the
+slowest fetch chain; with one it returns after about the deadline.
+
+Usage:
+    python benchmarks/bench_deadline.py [--latency 0.4] [--jitter 0.6]
+        [--deadline 1.5] [--iterations 5]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sport_suggest_mcp import client, snapshot, tools  # noqa: E402
+from sport_suggest_mcp.cache import get_cache  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency", type=float, default=0.4)
+    parser.add_argument("--jitter", type=float, default=0.6)
+    parser.add_argument("--deadline", type=float, default=1.5)
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    stub = StubServer(latency=args.latency, jitter=args.jitter).start()
+    tools.SITE_API_BASE = stub.site_api_base
+    tools.CORE_API_BASE = stub.core_api_base
+    snapshot.SNAPSHOT_PATH = ""
+    client.configure(rate_limit=0)  # the upstream rate limit is not under test
+
+    print(
+        f"stub latency {args.latency * 1000:.0f} ms + up to {args.jitter * 1000:.0f} ms"
+        f" jitter, cold cache\n"
+    )
+
+    # A large value stands in for "no deadline"
+    for label, deadline in (("no deadline", 3600), (f"{args.deadline}s", args.deadline)):
+        timings = []
+        degraded = {}
+        for _ in range(args.iterations):
+            get_cache().clear()
+            started = time.perf_counter()
+            result = tools.get_nba_recommendation_data(compact=True, deadline=deadline)
+            timings.append(time.perf_counter() - started)
+            for section, state in json.loads(result)["metadata"].get("degraded", {}).items():
+                key = f"{section}:{state}"
+                degraded[key] = degraded.get(key, 0) + 1
+
+        print(
+            f"{label:>12}: mean {sum(timings) / len(timings):5.2f}s"
+            f"  max {max(timings):5.2f}s  degraded {degraded or 'never'}"
+        )
+
+        # Let late fetches from this round finish before the next cold one
+        time.sleep(args.latency + args.jitter)
+
+    stub.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Microbenchmark: JSON decoding and field projection for a full data refresh
+Decodes one scoreboard slate plus 30 rosters with each parser, whole and projected
+
+A refresh is the full-slate scoreboard fixture plus the roster fixture
+decoded 30 times (one per team), in ESPN's response shapes. For json and
+orjson (if installed) this times decoding alone and decoding followed by
+decode.project with client.ENDPOINT_FIELDS, and measures the tracemalloc
+peak of a refresh plus the memory still held by its results (what the
+cache keeps). Projected scoreboards are checked to parse into the same
+games.
+
+Usage:
+    python benchmarks/bench_decode.py [--iterations 20] [--fixtures DIR]
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sport_suggest_mcp import decode  # noqa: E402
+from sport_suggest_mcp.client import ENDPOINT_FIELDS  # noqa: E402
+from sport_suggest_mcp.scoreboard import parse_event  # noqa: E402
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+TEAMS = 30
+
+
+def refresh(scoreboard: bytes, roster: bytes, project: bool) -> list:
+    """Decode (and optionally project) one scoreboard and TEAMS rosters"""
+    documents = [("scoreboard", scoreboard)] + [("roster", roster)] * TEAMS
+    results = []
+    for endpoint, content in documents:
+        data = decode.loads(content)
+        if project:
+            data = decode.project(data, ENDPOINT_FIELDS[endpoint])
+        results.append(data)
+    return results
+
+
+def measure(scoreboard: bytes, roster: bytes, project: bool, iterations: int):
+    started = time.perf_counter()
+    for _ in range(iterations):
+        refresh(scoreboard, roster, project)
+    per_refresh = (time.perf_counter() - started) / iterations
+
+    tracemalloc.start()
+    kept = refresh(scoreboard, roster, project)
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+
+    return per_refresh, peak, held
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument(
+        "--fixtures",
+        default=str(FIXTURES),
+        help="Directory with scoreboard_full_slate.json and roster_full_team.json",
+    )
+    args = parser.parse_args()
+
+    fixtures = Path(args.fixtures)
+    scoreboard = (fixtures / "scoreboard_full_slate.json").read_bytes()
+    roster = (fixtures / "roster_full_team.json").read_bytes()
+
+    full = decode.loads(scoreboard)
+    projected = decode.project(full, ENDPOINT_FIELDS["scoreboard"])
+    assert [parse_event(e).to_dict() for e in full["events"]] == [
+        parse_event(e).to_dict() for e in projected["events"]
+    ], "projected scoreboard parses differently"
+
+    total_kb = (len(scoreboard) + TEAMS * len(roster)) / 1024
+    print(f"refresh: 1 scoreboard + {TEAMS} rosters, {total_kb:.0f} KB of JSON\n")
+
+    fast = decode.orjson
+    backends = [("json", None)] + ([("orjson", fast)] if fast is not None else [])
+
+    for name, module in backends:
+        decode.orjson = module
+        for project in (False, True):
+            per_refresh, peak, held = measure(
+                scoreboard, roster, project, args.iterations
+            )
+            label = f"{name}{' + project' if project else ''}"
+            print(
+                f"{label:>16}: {per_refresh * 1000:6.2f} ms/refresh,"
+                f" peak {peak / 1024:7.0f} KB, held {held / 1024:7.0f} KB"
+            )
+
+    decode.orjson = fast
+    if fast is None:
+        print("\norjson is not installed - pip install 'sport-suggest-mcp[fast]'")
+
+
+if __name__ == "__main__":
+    main()
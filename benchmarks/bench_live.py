@@ -0,0 +1,84 @@
+"""
+Benchmark: repeated live polling, full scoreboard vs change feed
+
+Polls a local stub scoreboard N times while one live game scores every
+--change-every polls. "full" calls get_nba_scores (scoreboard cache off),
+"delta" calls get_nba_score_updates with the cursor from the previous call,
+once with ETag support on the stub and once without (content hashing).
+
+Usage:
+    python benchmarks/bench_live.py [--polls 200] [--change-every 4]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sport_suggest_mcp import client, live, snapshot, tools  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+
+
+def full_poll(cursor):
+    return tools.get_nba_scores(), None
+
+
+def delta_poll(cursor):
+    result = tools.get_nba_score_updates(cursor)
+    return result, json.loads(result)["cursor"]
+
+
+def run(poll, polls: int, change_every: int, etag: bool = True) -> dict:
+    stub = StubServer(latency=0, etag=etag).start()
+    tools.SITE_API_BASE = stub.site_api_base
+    live._pollers.clear()
+
+    cursor = None
+    returned = 0
+    start = time.perf_counter()
+    for i in range(polls):
+        if i and i % change_every == 0:
+            stub.advance()
+        result, cursor = poll(cursor)
+        returned += len(result)
+    elapsed = time.perf_counter() - start
+
+    stub.shutdown()
+    return {
+        "ms_per_poll": elapsed / polls * 1000,
+        "downloaded": stub.bytes_sent,
+        "returned": returned,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--polls", type=int, default=200)
+    parser.add_argument("--change-every", type=int, default=4)
+    args = parser.parse_args()
+
+    client.ENDPOINT_TTLS["scoreboard"] = 0  # every full poll goes upstream
+    live.MIN_POLL_INTERVAL = 0
+    snapshot.SNAPSHOT_PATH = ""
+    client.configure(rate_limit=0)  # the upstream rate limit is not under test
+
+    print(f"{args.polls} polls, a score change every {args.change_every}\n")
+    modes = (
+        ("full", full_poll, True),
+        ("delta (etag)", delta_poll, True),
+        ("delta (hash)", delta_poll, False),
+    )
+    for label, poll, etag in modes:
+        stats = run(poll, args.polls, args.change_every, etag)
+        print(
+            f"{label:>13}: {stats['ms_per_poll']:6.2f} ms/poll"
+            f"  {stats['downloaded'] / 1024:8.1f} KB downloaded"
+            f"  {stats['returned'] / 1024:8.1f} KB returned"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark: instrumentation overhead
+Times span() itself and warm tool calls with metrics off, on, and on with logging
+
+The span micro-benchmark runs an empty with-block; the tool benchmark
+calls get_nba_rosters (all cache hits) through server.call_tool against a
+local stub server, so any difference is instrumentation cost. Span logs go
+to /dev/null.
+
+Usage:
+    python benchmarks/bench_metrics.py [--iterations 20000]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sport_suggest_mcp import client, metrics, server, snapshot, tools  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+
+SETTINGS = (
+    ("disabled", False, False),
+    ("enabled", True, False),
+    ("enabled + log", True, True),
+)
+
+URL = "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/teams/13/roster"
+
+
+def time_spans(iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        with metrics.upstream_span(URL) as span:
+            span.set(status=200, bytes=1024)
+    return (time.perf_counter() - started) / iterations
+
+
+def time_tool(iterations: int) -> float:
+    async def calls():
+        for _ in range(iterations):
+            await server.call_tool("get_nba_rosters", {})
+
+    started = time.perf_counter()
+    asyncio.run(calls())
+    return (time.perf_counter() - started) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    stub = StubServer(latency=0).start()
+    tools.SITE_API_BASE = stub.site_api_base
+    tools.CORE_API_BASE = stub.core_api_base
+    snapshot.SNAPSHOT_PATH = ""
+    client.configure(rate_limit=0)  # the upstream rate limit is not under test
+    tools.get_nba_rosters()
+
+    sys.stderr = open(os.devnull, "w")
+    tool_iterations = max(args.iterations // 20, 1)
+
+    for label, enabled, log in SETTINGS:
+        metrics.configure(enabled=enabled, log=log)
+        per_span = time_spans(args.iterations)
+        per_call = time_tool(tool_iterations)
+        print(
+            f"{label:>14}: span {per_span * 1e6:6.2f} us,"
+            f" warm get_nba_rosters {per_call * 1e6:7.1f} us"
+        )
+
+    stub.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark: get_nba_recommendation_data payload size and encode time
+
+Builds the recommendation data once from a local stub server, then times
+serialization of the full (indent=2) payload against the compact one
+(with and without a byte budget) and the summary-only one.
+
+Usage:
+    python benchmarks/bench_payload.py [--iterations 200] [--max-bytes 8000]
+"""
+
+import argparse
+import copy
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sport_suggest_mcp import client, snapshot, tools  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+
+
+def full(data):
+    return tools._dump_with_size(data, indent=2)
+
+
+def compact(data, budget=None):
+    return tools._render_compact(tools._compact_recommendation_data(data), budget)
+
+
+def summary(data):
+    return tools._dump_with_size(
+        tools._summary_recommendation_data(data), separators=(",", ":")
+    )
+
+
+def measure(render, data, iterations: int) -> tuple:
+    payload = render(copy.deepcopy(data))
+    copies = [copy.deepcopy(data) for _ in range(iterations)]
+
+    start = time.perf_counter()
+    for item in copies:
+        render(item)
+    elapsed = (time.perf_counter() - start) / iterations
+
+    return len(payload.encode()), elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--max-bytes", type=int, default=8000)
+    args = parser.parse_args()
+
+    stub = StubServer(latency=0).start()
+    tools.SITE_API_BASE = stub.site_api_base
+    tools.CORE_API_BASE = stub.core_api_base
+    snapshot.SNAPSHOT_PATH = ""
+    client.configure(rate_limit=0)  # the upstream rate limit is not under test
+
+    data = tools._build_recommendation_data()
+    stub.shutdown()
+
+    print(f"{data['metadata']['games_count']} games, {args.iterations} iterations\n")
+    modes = (
+        ("full", full),
+        ("compact", compact),
+        (f"compact<={args.max_bytes}", lambda d: compact(d, args.max_bytes)),
+        ("summary", summary),
+    )
+    for label, render in modes:
+        size, elapsed = measure(render, data, args.iterations)
+        print(f"{label:>18}: {size:>8,} bytes  {elapsed * 1000:7.3f} ms/encode")
+
+
+if __name__ == "__main__":
+    main()
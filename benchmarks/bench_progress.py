@@ -0,0 +1,76 @@
+"""
+Benchmark: time to first useful data with MCP progress notifications
+Calls get_nba_recommendation_data over an in-memory MCP session with a progressToken
+
+Each cold call (empty cache) records when each stage's progress
+notification arrives at the client and when the final result does, so the
+games list (in the first notification) can be compared with the full
+payload.
+
+Usage:
+    python benchmarks/bench_progress.py [--latency 0.1] [--iterations 5]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from mcp.shared.memory import create_connected_server_and_client_session  # noqa: E402
+
+from sport_suggest_mcp import client, server, snapshot, tools  # noqa: E402
+from sport_suggest_mcp.cache import get_cache  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+
+
+async def run(iterations: int) -> dict:
+    timings = {}
+
+    async with create_connected_server_and_client_session(server.server) as session:
+        for _ in range(iterations):
+            get_cache().clear()
+            started = time.perf_counter()
+
+            async def on_progress(progress, total, message):
+                stage = message.split(":", 1)[0]
+                timings.setdefault(stage, []).append(time.perf_counter() - started)
+
+            await session.call_tool(
+                "get_nba_recommendation_data",
+                {"compact": True},
+                progress_callback=on_progress,
+            )
+            timings.setdefault("result", []).append(time.perf_counter() - started)
+
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    stub = StubServer(latency=args.latency).start()
+    tools.SITE_API_BASE = stub.site_api_base
+    tools.CORE_API_BASE = stub.core_api_base
+    snapshot.SNAPSHOT_PATH = ""
+    client.configure(rate_limit=0)  # the upstream rate limit is not under test
+
+    print(f"stub latency {args.latency * 1000:.0f} ms, cold cache\n")
+    timings = asyncio.run(run(args.iterations))
+
+    for stage in tools.PROGRESS_STAGES + ("result",):
+        samples = timings.get(stage)
+        if samples:
+            print(f"{stage:>17}: {statistics.median(samples) * 1000:7.1f} ms (median)")
+
+    stub.shutdown()
+
+
+if __name__ == "__main__":
+    main()
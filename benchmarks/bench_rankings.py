@@ -0,0 +1,86 @@
+"""
+Benchmark: player rankings resolution, serial vs concurrent vs indexed
+
+Runs _fetch_rankings_data_structured against a local stub server that adds
+a fixed latency to every request:
+
+- serial: max_in_flight=1, no athlete index (the old one-by-one behavior)
+- concurrent: bounded fan-out over athlete and team $refs, no index
+- indexed: rosters already loaded, so refs resolve from the athlete/team
+  index and only players missing from rosters go to the network
+
+Usage:
+    python benchmarks/bench_rankings.py [--latency 0.05] [--max-in-flight 16]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sport_suggest_mcp import cache, client, snapshot, tools  # noqa: E402
+from sport_suggest_mcp.rosters import Rosters  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+
+
+def _empty_index(teams=None):
+    return Rosters()
+
+
+def run(stub, max_in_flight: int, indexed: bool) -> tuple:
+    client.configure(max_in_flight=max_in_flight)
+    cache.get_cache().clear()
+
+    get_athlete_index = tools._get_athlete_index
+    if indexed:
+        tools._fetch_rosters_data_structured()  # steady state: rosters cached
+    else:
+        tools._get_athlete_index = _empty_index
+
+    client.reset_connection_stats()
+    stub.request_count = 0
+    try:
+        start = time.perf_counter()
+        rankings = tools._fetch_rankings_data_structured()
+        return time.perf_counter() - start, len(rankings)
+    finally:
+        tools._get_athlete_index = get_athlete_index
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--max-in-flight", type=int, default=client.MAX_IN_FLIGHT)
+    args = parser.parse_args()
+
+    stub = StubServer(latency=args.latency).start()
+    tools.SITE_API_BASE = stub.site_api_base
+    tools.CORE_API_BASE = stub.core_api_base
+    snapshot.SNAPSHOT_PATH = ""  # measure the network path, not the disk snapshot
+    client.configure(rate_limit=0)  # the upstream rate limit is not under test
+
+    print(f"Stub latency: {args.latency * 1000:.0f} ms/request\n")
+    modes = (
+        ("serial", 1, False),
+        ("concurrent", args.max_in_flight, False),
+        ("indexed", args.max_in_flight, True),
+    )
+    for label, max_in_flight, indexed in modes:
+        elapsed, count = run(stub, max_in_flight, indexed)
+        print(
+            f"{label:>10} (max_in_flight={max_in_flight:>2}): "
+            f"{elapsed:6.2f}s  {count} players  {stub.request_count} requests"
+        )
+        for host, stats in client.get_connection_stats().items():
+            print(
+                f"{'':>12}{host}: {stats['connections_opened']} connections opened, "
+                f"{stats['connections_reused']} reused"
+            )
+
+    stub.shutdown()
+
+
+if __name__ == "__main__":
+    main()
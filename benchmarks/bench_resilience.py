@@ -0,0 +1,98 @@
+"""
+Benchmark: circuit breaker and rate limiter under an upstream outage and a burst
+Runs against a local stub server that can be switched to failing every request
+
+Outage: the scoreboard is cached with a 1 s TTL, the cache entry expires,
+then every stub request answers 500. Repeated get_nba_scores calls are
+timed with the breaker effectively disabled and enabled - disabled, each
+call waits out its retries and errors; enabled, the breaker opens after a
+few failures and calls return the stale scoreboard at once.
+
+Burst: a cold get_nba_recommendation_data with a tight rate limit, showing
+how long requests queued for tokens.
+
+Usage:
+    python benchmarks/bench_resilience.py [--latency 0.05] [--calls 10]
+        [--rate 20] [--burst 10]
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sport_suggest_mcp import client, snapshot, tools  # noqa: E402
+from sport_suggest_mcp.cache import get_cache  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+
+
+def outage(stub: StubServer, calls: int, label: str, breaker_failures: int):
+    client.configure(breaker_failures=breaker_failures, breaker_reset=60)
+    stub.fail_pattern = None
+    get_cache().clear()
+    tools.get_nba_scores()
+    time.sleep(1.1)
+
+    stub.fail_pattern = re.compile(".")
+    before = stub.request_count
+    errors = 0
+    started = time.perf_counter()
+    for _ in range(calls):
+        errors += tools.get_nba_scores().startswith("Error")
+    elapsed = time.perf_counter() - started
+
+    breakers = client.get_breaker_stats()
+    state = next(iter(breakers.values()))["state"] if breakers else "-"
+    print(
+        f"{label:>10}:"
+        f" {elapsed:6.2f}s for {calls} calls, {stub.request_count - before:3d} upstream"
+        f" requests, {errors:2d} errors, breaker {state}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--calls", type=int, default=10)
+    parser.add_argument("--rate", type=float, default=20)
+    parser.add_argument("--burst", type=float, default=10)
+    args = parser.parse_args()
+
+    stub = StubServer(latency=args.latency).start()
+    tools.SITE_API_BASE = stub.site_api_base
+    tools.CORE_API_BASE = stub.core_api_base
+    snapshot.SNAPSHOT_PATH = ""
+    client.configure(rate_limit=0)  # the upstream rate limit is not under test
+    client.ENDPOINT_TTLS["scoreboard"] = 1
+
+    print(f"outage: every request answers 500, stub latency {args.latency * 1000:.0f} ms\n")
+    default_failures = client.BREAKER_FAILURES
+    outage(stub, args.calls, "no breaker", breaker_failures=10**9)
+    outage(stub, args.calls, "breaker", breaker_failures=default_failures)
+
+    stub.fail_pattern = None
+    # New breakers too - the host is still open from the outage
+    client.configure(
+        rate_limit=args.rate, rate_burst=args.burst, breaker_failures=default_failures
+    )
+    get_cache().clear()
+    started = time.perf_counter()
+    tools.get_nba_recommendation_data(compact=True)
+    elapsed = time.perf_counter() - started
+
+    stats = client.get_rate_limit_stats()
+    print(
+        f"\nburst: cold get_nba_recommendation_data at {args.rate:.0f} req/s"
+        f" (burst {args.burst:.0f}): {elapsed:.2f}s, {stats['acquired']} requests,"
+        f" {stats['waited']} waited {stats['wait_seconds']:.2f}s in total"
+        f" (max {stats['max_wait_seconds']:.2f}s)"
+    )
+
+    stub.shutdown()
+
+
+if __name__ == "__main__":
+    main()
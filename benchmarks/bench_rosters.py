@@ -0,0 +1,85 @@
+"""
+Benchmark: roster cache hits and roster model memory
+
+Loads every roster once from a local stub server, then times warm calls
+(the roster cache is hot) for each roster view and measures the memory of
+the cached rows, the Rosters model built from them, and the structured
+team_rosters dict.
+
+Usage:
+    python benchmarks/bench_rosters.py [--iterations 2000]
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sport_suggest_mcp import client, snapshot, tools  # noqa: E402
+from sport_suggest_mcp.rosters import Rosters  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+
+
+def timed(label: str, fn, iterations: int):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    per_call = (time.perf_counter() - start) / iterations
+    print(f"{label:>34}: {per_call * 1e6:8.1f} us")
+
+
+def allocated(build) -> int:
+    """Bytes still allocated by build()'s result"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return after - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    stub = StubServer(latency=0).start()
+    tools.SITE_API_BASE = stub.site_api_base
+    snapshot.SNAPSHOT_PATH = ""
+    client.configure(rate_limit=0)  # the upstream rate limit is not under test
+
+    rows = tools._load_rosters()
+    tools._get_rosters()  # warm the cache
+    stub.shutdown()
+
+    model = Rosters.from_rows(rows)
+    print(f"{len(model.teams)} teams, {len(model.players)} players\n")
+
+    pair = {"T01", "T02"}
+    timed("_fetch_rosters_data_structured()", tools._fetch_rosters_data_structured, args.iterations)
+    timed("  ... (2 teams)", lambda: tools._fetch_rosters_data_structured(pair), args.iterations)
+    timed("get_nba_rosters()", tools.get_nba_rosters, args.iterations)
+    timed("_get_athlete_index (2 teams)", lambda: tools._get_athlete_index(pair), args.iterations)
+    timed("Rosters.from_rows (per refresh)", lambda: Rosters.from_rows(rows), args.iterations // 10)
+
+    def structured():
+        fresh = Rosters.from_rows(rows)
+        return fresh, {abbr: team.structured() for abbr, team in fresh.teams.items()}
+
+    rows_bytes = allocated(lambda: json.loads(json.dumps(rows)))
+    model_bytes = allocated(lambda: Rosters.from_rows(rows))
+    structured_bytes = allocated(structured) - model_bytes
+
+    print()
+    print(f"{'cached rows':>34}: {rows_bytes / 1024:8.1f} KB")
+    print(f"{'Rosters model + indexes':>34}: {model_bytes / 1024:8.1f} KB")
+    print(f"{'structured team_rosters':>34}: {structured_bytes / 1024:8.1f} KB")
+    print(f"{'model per player':>34}: {model_bytes / len(model.players):8.0f} B")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark: date-ranged schedule lookups, cold vs warm
+
+Fetches a week of scoreboards from a local stub server through
+get_nba_scores(date, end_date). The cold lookup requests every day in one
+concurrent round; the warm one is served from the per-day cache.
+
+Usage:
+    python benchmarks/bench_schedule.py [--days 7] [--latency 0.1]
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sport_suggest_mcp import client, snapshot, tools  # noqa: E402
+from sport_suggest_mcp.cache import get_cache  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--latency", type=float, default=0.1)
+    args = parser.parse_args()
+
+    stub = StubServer(latency=args.latency).start()
+    tools.SITE_API_BASE = stub.site_api_base
+    snapshot.SNAPSHOT_PATH = ""
+    client.configure(rate_limit=0)  # the upstream rate limit is not under test
+    get_cache().clear()
+
+    # A range straddling today: past days are final, the rest upcoming
+    start = datetime.now() - timedelta(days=args.days // 2)
+    date = start.strftime("%Y-%m-%d")
+    end_date = (start + timedelta(days=args.days - 1)).strftime("%Y-%m-%d")
+
+    print(f"{date} .. {end_date}, stub latency {args.latency * 1000:.0f} ms\n")
+    for label in ("cold", "warm"):
+        for status in (None, "final"):
+            before = stub.request_count
+            started = time.perf_counter()
+            result = tools.get_nba_scores(date=date, end_date=end_date, status=status)
+            elapsed = time.perf_counter() - started
+
+            print(
+                f"{label:>5} {status or 'all':>5}: {elapsed * 1000:7.1f} ms"
+                f"  {stub.request_count - before:3d} requests  {result.splitlines()[0]}"
+            )
+
+    stub.shutdown()
+
+
+if __name__ == "__main__":
+    main()
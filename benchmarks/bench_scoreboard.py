@@ -0,0 +1,73 @@
+"""
+Microbenchmark: scoreboard parse time and per-game memory
+
+Uses the full-slate fixture in benchmarks/fixtures (15 games in ESPN's
+scoreboard shape). Times JSON decoding, parsing into Game records, a
+memoized re-parse and both renderers, then measures the memory held by a
+parsed Game against the game dict it replaces and the raw event.
+
+Usage:
+    python benchmarks/bench_scoreboard.py [--iterations 2000]
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sport_suggest_mcp import scoreboard  # noqa: E402
+
+FIXTURE = Path(__file__).resolve().parent / "fixtures" / "scoreboard_full_slate.json"
+
+
+def timed(label: str, fn, iterations: int):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    per_call = (time.perf_counter() - start) / iterations
+    print(f"{label:>28}: {per_call * 1e6:9.1f} us")
+
+
+def held_bytes(build, copies: int = 200) -> float:
+    """Average bytes kept alive by one build() result"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [build() for _ in range(copies)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return (after - before) / copies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    raw = FIXTURE.read_bytes()
+    data = json.loads(raw)
+    events = data["events"]
+    games = scoreboard.parse_scoreboard(data)
+    n = len(events)
+
+    print(f"{FIXTURE.name}: {len(raw) / 1024:.1f} KB, {n} games\n")
+
+    timed("json.loads", lambda: json.loads(raw), args.iterations // 10)
+    timed("parse (cold)", lambda: [scoreboard.parse_event(e) for e in events], args.iterations)
+    timed("parse (memoized)", lambda: scoreboard.parse_scoreboard(data), args.iterations)
+    timed("render JSON dicts", lambda: [g.to_dict() for g in games], args.iterations)
+    timed("render text", lambda: "".join(map(scoreboard.render_text, games)), args.iterations)
+
+    event = events[0]
+    print()
+    print(f"{'Game record':>28}: {held_bytes(lambda: scoreboard.parse_event(event)):9.0f} bytes/game")
+    print(f"{'game dict':>28}: {held_bytes(lambda: scoreboard.parse_event(event).to_dict()):9.0f} bytes/game")
+    print(f"{'raw event':>28}: {held_bytes(lambda: json.loads(json.dumps(event))):9.0f} bytes/game")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Benchmark: server cold start
+Times importing the server and a fresh process's replies to initialize, tools/list and a first tool call
+
+Each iteration spawns `python -m sport_suggest_mcp.server` the way an MCP
+client does and speaks newline-delimited JSON-RPC over its stdio: the time
+from spawn to the initialize reply, to the first tools/list reply, and to
+the reply of a first tools/call (get_server_stats, which needs no network
+but loads the tool modules). Import time of sport_suggest_mcp.server is
+measured separately in fresh interpreters, along with whether requests and
+tools were loaded by the import.
+
+--budget fails the run (exit 1) if the median time to the tools/list reply
+exceeds that many milliseconds.
+
+Usage:
+    python benchmarks/bench_startup.py [--iterations 10] [--budget MS]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC = str(Path(__file__).resolve().parents[1] / "src")
+
+IMPORT_SNIPPET = """
+import sys, time
+started = time.perf_counter()
+import sport_suggest_mcp.server
+elapsed = time.perf_counter() - started
+print(elapsed, "requests" in sys.modules, "sport_suggest_mcp.tools" in sys.modules)
+"""
+
+# Protocol version string is not checked against the server's; any the SDK
+# supports gets the same reply
+MESSAGES = (
+    (
+        "initialize",
+        {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "initialize",
+            "params": {
+                "protocolVersion": "2025-06-18",
+                "capabilities": {},
+                "clientInfo": {"name": "bench_startup", "version": "0"},
+            },
+        },
+    ),
+    (None, {"jsonrpc": "2.0", "method": "notifications/initialized"}),
+    ("tools/list", {"jsonrpc": "2.0", "id": 2, "method": "tools/list"}),
+    (
+        "first tools/call",
+        {
+            "jsonrpc": "2.0",
+            "id": 3,
+            "method": "tools/call",
+            "params": {"name": "get_server_stats", "arguments": {}},
+        },
+    ),
+)
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = SRC + os.pathsep + env.get("PYTHONPATH", "")
+    env["SPORT_SUGGEST_SNAPSHOT_PATH"] = ""
+    env["SPORT_SUGGEST_STATS_TOOL"] = "1"
+    return env
+
+
+def time_import(env: dict) -> tuple:
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET], env=env, capture_output=True, text=True, check=True
+    ).stdout.split()
+    return float(output[0]), output[1] == "True", output[2] == "True"
+
+
+def time_session(env: dict) -> dict:
+    """Seconds from spawn to each reply"""
+    timings = {}
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "sport_suggest_mcp.server"],
+        env=env,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    try:
+        for label, message in MESSAGES:
+            process.stdin.write(json.dumps(message) + "\n")
+            process.stdin.flush()
+            if label is None:
+                continue
+            reply = json.loads(process.stdout.readline())
+            if "error" in reply:
+                raise RuntimeError(f"{label} failed: {reply['error']}")
+            timings[label] = time.perf_counter() - started
+    finally:
+        process.stdin.close()
+        process.wait(timeout=10)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--budget", type=float, help="Max median ms to the tools/list reply")
+    args = parser.parse_args()
+
+    env = _env()
+
+    imports = [time_import(env) for _ in range(args.iterations)]
+    _, loads_requests, loads_tools = imports[-1]
+    print(
+        f"import sport_suggest_mcp.server: {statistics.median(i[0] for i in imports) * 1000:6.1f} ms"
+        f" (median; loads requests: {loads_requests}, tools: {loads_tools})\n"
+    )
+
+    sessions = [time_session(env) for _ in range(args.iterations)]
+    print("from process spawn to the reply of:")
+    for label, _ in MESSAGES:
+        if label is None:
+            continue
+        samples = [session[label] for session in sessions]
+        print(
+            f"{label:>17}: {statistics.median(samples) * 1000:6.1f} ms median,"
+            f" {min(samples) * 1000:6.1f} ms min"
+        )
+
+    if args.budget is not None:
+        median_ms = statistics.median(session["tools/list"] for session in sessions) * 1000
+        if median_ms > args.budget:
+            print(f"\ntools/list reply {median_ms:.1f} ms is over the {args.budget:.0f} ms budget")
+            sys.exit(1)
+        print(f"\ntools/list reply within the {args.budget:.0f} ms budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Load test: many sessions subscribed to the same live game
+
+Connects N in-memory MCP client sessions to the server, subscribes each to
+nba://scoreboard and one nba://game/{id}, then scores a basket in that game
+on the stub server every poll interval. Upstream scoreboard requests should
+grow with elapsed polls, not with the number of subscribers.
+
+Usage:
+    python benchmarks/bench_subscriptions.py [--sessions 20] [--rounds 5]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from contextlib import AsyncExitStack
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from mcp.shared.memory import create_connected_server_and_client_session  # noqa: E402
+from mcp.types import ResourceUpdatedNotification, ServerNotification  # noqa: E402
+
+from sport_suggest_mcp import client, live, server, snapshot, tools  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+
+INTERVAL = 0.2
+
+
+async def run(sessions: int, rounds: int, stub: StubServer):
+    received = []
+
+    async def on_message(message):
+        if isinstance(message, ServerNotification) and isinstance(
+            message.root, ResourceUpdatedNotification
+        ):
+            received.append(str(message.root.params.uri))
+
+    async with AsyncExitStack() as stack:
+        clients = [
+            await stack.enter_async_context(
+                create_connected_server_and_client_session(
+                    server.server, message_handler=on_message
+                )
+            )
+            for _ in range(sessions)
+        ]
+
+        scoreboard = await clients[0].read_resource("nba://scoreboard")
+        game_id = json.loads(scoreboard.contents[0].text)["games"][0]["game_id"]
+
+        for session in clients:
+            await session.subscribe_resource("nba://scoreboard")
+            await session.subscribe_resource(f"nba://game/{game_id}")
+
+        before = stub.request_count
+        for _ in range(rounds):
+            # Five ticks bring the basket round to the first game again
+            for _ in range(5):
+                stub.advance()
+            await asyncio.sleep(INTERVAL)
+        await asyncio.sleep(2 * INTERVAL)
+
+        upstream = stub.request_count - before
+        for session in clients:
+            await session.unsubscribe_resource("nba://scoreboard")
+            await session.unsubscribe_resource(f"nba://game/{game_id}")
+
+    return upstream, received
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    stub = StubServer(latency=0.01).start()
+    tools.SITE_API_BASE = stub.site_api_base
+    snapshot.SNAPSHOT_PATH = ""
+    client.configure(rate_limit=0)  # the upstream rate limit is not under test
+    live.MIN_POLL_INTERVAL = 0
+    server._subscriptions.interval = INTERVAL
+
+    upstream, received = asyncio.run(run(args.sessions, args.rounds, stub))
+
+    print(f"{args.sessions} sessions, {args.rounds} score changes, poll every {INTERVAL}s\n")
+    print(f"upstream scoreboard requests: {upstream}")
+    print(f"notifications delivered:      {len(received)}")
+    print(f"hub stats:                    {server._subscriptions.stats()}")
+    stub.shutdown()
+
+
+if __name__ == "__main__":
+    main()
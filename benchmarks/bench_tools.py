@@ -0,0 +1,182 @@
+"""
+Benchmark: latency, upstream requests and peak memory of every public tool
+Calls each tool through server.call_tool against the stub server, cold and warm
+
+Cold calls start from an empty cache (no disk snapshot, no live poller);
+warm calls reuse what the previous call cached. For each tool and mode this
+reports p50/p95 latency, stub requests per call, calls that returned an
+error, and the tracemalloc peak of one extra traced call (tracing is kept
+out of the timed runs). --fixtures replays a recording made by record_fixtures.py,
+--failure-rate / --jitter inject upstream failures and latency noise.
+
+--save writes the results as JSON; --baseline compares against such a file
+and exits 1 if any p95 or peak memory regressed by more than --threshold.
+
+Usage:
+    python benchmarks/bench_tools.py [--iterations 10] [--latency 0.02]
+        [--jitter 0] [--failure-rate 0] [--fixtures DIR] [--rate-limit 0]
+        [--save FILE] [--baseline FILE] [--threshold 0.25]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sport_suggest_mcp import client, live, server, snapshot, tools  # noqa: E402
+from sport_suggest_mcp.cache import get_cache  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+
+CALLS = (
+    ("get_nba_scores", {}),
+    ("get_nba_score_updates", {}),
+    ("get_nba_rosters", {}),
+    ("get_nba_player_rankings", {}),
+    ("get_nba_recommendation_data", {}),
+    ("get_nba_recommendation_data", {"compact": True}),
+    ("get_nba_recommendation_data", {"summary": True}),
+)
+
+MODES = ("cold", "warm")
+
+
+def _label(name: str, arguments: dict) -> str:
+    flags = ",".join(key for key, value in arguments.items() if value is True)
+    return f"{name}[{flags}]" if flags else name
+
+
+def _percentile(samples: list, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, round(fraction * (len(ordered) - 1)))]
+
+
+def _reset():
+    """Forget everything cached, including the live scoreboard pollers"""
+    get_cache().clear()
+    live._pollers.clear()
+
+
+def _call(name: str, arguments: dict) -> str:
+    return asyncio.run(server.call_tool(name, arguments))[0].text
+
+
+def measure(stub: StubServer, name: str, arguments: dict, mode: str, iterations: int):
+    """Timings, request counts and peak memory for one tool in one mode"""
+    latencies, requests, errors = [], [], 0
+
+    if mode == "warm":
+        _call(name, arguments)
+
+    for _ in range(iterations):
+        if mode == "cold":
+            _reset()
+        before = stub.request_count
+        started = time.perf_counter()
+        result = _call(name, arguments)
+        latencies.append(time.perf_counter() - started)
+        requests.append(stub.request_count - before)
+        errors += result.startswith("Error")
+
+    if mode == "cold":
+        _reset()
+    tracemalloc.start()
+    _call(name, arguments)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p95_ms": round(_percentile(latencies, 0.95) * 1000, 2),
+        "requests": round(statistics.mean(requests), 1),
+        "errors": errors,
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """Lines describing every p95 / peak memory regression beyond threshold"""
+    regressions = []
+    for key, result in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+        for metric in ("p95_ms", "peak_kb"):
+            if result[metric] > previous[metric] * (1 + threshold):
+                regressions.append(
+                    f"{key} {metric}: {previous[metric]} -> {result[metric]}"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--fixtures")
+    parser.add_argument("--rate-limit", type=float, default=0)
+    parser.add_argument("--save")
+    parser.add_argument("--baseline")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    args = parser.parse_args()
+
+    stub = StubServer(
+        latency=args.latency,
+        jitter=args.jitter,
+        failure_rate=args.failure_rate,
+        fixtures=args.fixtures,
+    ).start()
+    tools.SITE_API_BASE = stub.site_api_base
+    tools.CORE_API_BASE = stub.core_api_base
+    snapshot.SNAPSHOT_PATH = ""
+    # Back-to-back cold runs would otherwise be paced by the upstream rate limit
+    client.configure(backoff_base=0.01, rate_limit=args.rate_limit)
+
+    print(
+        f"stub latency {args.latency * 1000:.0f} ms (+{args.jitter * 1000:.0f} jitter),"
+        f" failure rate {args.failure_rate:.0%},"
+        f" {'fixtures ' + args.fixtures if args.fixtures else 'synthetic data'},"
+        f" {args.iterations} iterations\n"
+    )
+    print(
+        f"{'tool':>40} {'mode':>4} {'p50 ms':>8} {'p95 ms':>8}"
+        f" {'requests':>8} {'errors':>6} {'peak KB':>8}"
+    )
+
+    results = {}
+    for name, arguments in CALLS:
+        for mode in MODES:
+            key = f"{_label(name, arguments)} {mode}"
+            result = results[key] = measure(stub, name, arguments, mode, args.iterations)
+            print(
+                f"{_label(name, arguments):>40} {mode:>4} {result['p50_ms']:8.1f}"
+                f" {result['p95_ms']:8.1f} {result['requests']:8.1f}"
+                f" {result['errors']:6d} {result['peak_kb']:8.0f}"
+            )
+
+    print(f"\nstub: {stub.request_count} requests, {stub.failure_count} injected failures")
+    stub.shutdown()
+
+    if args.save:
+        Path(args.save).write_text(json.dumps(results, indent=2) + "\n")
+        print(f"saved results to {args.save}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = compare(results, baseline, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+        print(f"no regressions beyond {args.threshold:.0%} of {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Record ESPN responses for replay by the stub server
+Runs every public tool against the real API and saves each response body
+
+Every URL the tools fetch (scoreboard, teams, rosters, leaders, athletes,
+team refs, injuries) is written to DIR/<path>[@<query>].json - the layout
+StubServer(fixtures=DIR) replays. Needs network access; re-run to refresh
+the recording.
+
+Usage:
+    python benchmarks/record_fixtures.py [--out benchmarks/fixtures/espn]
+"""
+
+import argparse
+import sys
+import threading
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sport_suggest_mcp import client, snapshot, tools  # noqa: E402
+from sport_suggest_mcp.cache import get_cache  # noqa: E402
+from stub_server import fixture_path  # noqa: E402
+
+DEFAULT_OUT = Path(__file__).resolve().parent / "fixtures" / "espn"
+
+CALLS = (
+    (tools.get_nba_scores, {}),
+    (tools.get_nba_rosters, {}),
+    (tools.get_nba_player_rankings, {}),
+    (tools.get_nba_recommendation_data, {"compact": True}),
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--out", default=str(DEFAULT_OUT))
+    args = parser.parse_args()
+
+    out = Path(args.out)
+    recorded = {}
+    lock = threading.Lock()
+    request = client._request
+
+    def recording_request(url, timeout, headers=None):
+        response = request(url, timeout, headers)
+        if response.status_code == 200:
+            parts = urlsplit(url)
+            path = fixture_path(out, parts.path, parse_qs(parts.query))
+            with lock:
+                recorded[path] = response.content
+        return response
+
+    client._request = recording_request
+    snapshot.SNAPSHOT_PATH = ""
+    get_cache().clear()
+
+    for tool, arguments in CALLS:
+        result = tool(**arguments)
+        print(f"{tool.__name__:>28}: {len(result):7d} bytes")
+
+    total = 0
+    for path, content in recorded.items():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+        total += len(content)
+
+    print(f"\nrecorded {len(recorded)} responses ({total / 1024:.0f} KB) to {out}")
+
+
+if __name__ == "__main__":
+    main()
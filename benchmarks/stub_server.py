@@ -0,0 +1,365 @@
+"""
+Local stub of the ESPN endpoints used by sport_suggest_mcp
+Serves synthetic or recorded responses with injected latency and failures
+
+With fixtures=DIR, responses recorded by record_fixtures.py are replayed
+(ESPN hosts inside them are rewritten to the stub); anything not recorded
+falls back to the synthetic routes. Every request waits latency seconds
+plus up to jitter more; failure_rate answers a random share of requests
+with 503, and fail_pattern always fails matching paths with 500.
+
+Responses carry an ETag and honor If-None-Match unless etag=False. Calling
+advance() scores a basket in one live game, so scoreboard pollers see a
+change.
+"""
+
+import hashlib
+import json
+import random
+import re
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import parse_qs, urlencode, urlsplit
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+SITE_PREFIX = "/apis/site/v2/sports/basketball/nba"
+CORE_PREFIX = "/v2/sports/basketball/leagues/nba"
+SEASON_PREFIX = f"{CORE_PREFIX}/seasons/2026"
+
+NUM_TEAMS = 30
+NUM_LEADERS = 50
+ROSTER_SIZE = 15
+NUM_GAMES = 10
+
+# ESPN hosts whose URLs inside recorded bodies point back at the stub
+ESPN_HOSTS = (
+    "https://site.api.espn.com",
+    "http://site.api.espn.com",
+    "https://sports.core.api.espn.com",
+    "http://sports.core.api.espn.com",
+)
+
+
+def fixture_path(root, path: str, query: dict = None) -> Path:
+    """Where the response for path (+ query) is recorded under root"""
+    name = path.strip("/")
+    if query:
+        name += "@" + urlencode(sorted(query.items()), doseq=True)
+    return Path(root) / f"{name}.json"
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(
+        self,
+        latency: float = 0.05,
+        etag: bool = True,
+        jitter: float = 0.0,
+        failure_rate: float = 0.0,
+        fail_pattern: str = None,
+        fixtures: str = None,
+        seed: int = 0,
+    ):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.latency = latency
+        self.etag = etag
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.fail_pattern = re.compile(fail_pattern) if fail_pattern else None
+        self.fixtures = Path(fixtures) if fixtures else None
+        self.random = random.Random(seed)
+        self.request_count = 0
+        self.failure_count = 0
+        self.bytes_sent = 0
+        self.tick = 0
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    @property
+    def site_api_base(self) -> str:
+        return f"{self.base_url}{SITE_PREFIX}"
+
+    @property
+    def core_api_base(self) -> str:
+        return f"{self.base_url}{CORE_PREFIX}"
+
+    def advance(self):
+        """Two points for the next live game in turn"""
+        with self.lock:
+            self.tick += 1
+
+    def start(self):
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return self
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        url = urlsplit(self.path)
+
+        with server.lock:
+            server.request_count += 1
+            delay = server.latency + server.random.uniform(0, server.jitter)
+            status = None
+            if server.fail_pattern and server.fail_pattern.search(url.path):
+                status = 500
+            elif server.failure_rate and server.random.random() < server.failure_rate:
+                status = 503
+            if status is not None:
+                server.failure_count += 1
+
+        time.sleep(delay)
+
+        if status is not None:
+            self.send_empty(status)
+            return
+
+        query = parse_qs(url.query)
+        payload = self.replay(url.path, query)
+        if payload is None:
+            body = self.route(url.path, query)
+            if body is None:
+                self.send_empty(404)
+                return
+            payload = json.dumps(body).encode()
+
+        etag = f'"{hashlib.md5(payload).hexdigest()}"'
+
+        if server.etag and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        if server.etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(payload)
+        with server.lock:
+            server.bytes_sent += len(payload)
+
+    def send_empty(self, status: int):
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def replay(self, path: str, query: dict):
+        """Recorded response body for path, or None if not recorded"""
+        root = self.server.fixtures
+        if root is None:
+            return None
+
+        # Core API $refs carry ?lang=en&region=us - fall back to the bare path
+        for candidate in (fixture_path(root, path, query), fixture_path(root, path)):
+            if candidate.is_file():
+                break
+        else:
+            return None
+
+        text = candidate.read_text()
+        for host in ESPN_HOSTS:
+            text = text.replace(host, self.server.base_url)
+
+        # The league-wide injuries recording answers team-filtered requests
+        if path.endswith("/injuries") and "team" in query and candidate.name == "injuries.json":
+            wanted = set(query["team"])
+            body = json.loads(text)
+            body["injuries"] = [
+                entry
+                for entry in body.get("injuries", [])
+                if _injury_team(entry) in wanted
+            ]
+            return json.dumps(body).encode()
+
+        return text.encode()
+
+    def route(self, path: str, query: dict):
+        base = self.server.base_url
+
+        if path == f"{SEASON_PREFIX}/types/2/leaders":
+            leaders = [
+                {
+                    "value": 100 - i * 1.5,
+                    "athlete": {"$ref": f"{base}{SEASON_PREFIX}/athletes/{_leader_id(i)}"},
+                }
+                for i in range(NUM_LEADERS)
+            ]
+            return {"categories": [{"name": "NBARating", "leaders": leaders}]}
+
+        match = re.fullmatch(rf"{SEASON_PREFIX}/athletes/(\d+)", path)
+        if match:
+            athlete_id = int(match.group(1))
+            team_id = _athlete_team(athlete_id)
+            return {
+                "id": str(athlete_id),
+                "fullName": f"Player {athlete_id}",
+                "team": {"$ref": f"{base}{SEASON_PREFIX}/teams/{team_id}"},
+            }
+
+        match = re.fullmatch(rf"{SEASON_PREFIX}/teams/(\d+)", path)
+        if match:
+            team_id = int(match.group(1))
+            return {"id": str(team_id), "abbreviation": f"T{team_id:02d}"}
+
+        if path == f"{SITE_PREFIX}/teams":
+            teams = [
+                {
+                    "team": {
+                        "id": str(team_id),
+                        "abbreviation": f"T{team_id:02d}",
+                        "displayName": f"Team {team_id}",
+                    }
+                }
+                for team_id in range(1, NUM_TEAMS + 1)
+            ]
+            return {"sports": [{"leagues": [{"teams": teams}]}]}
+
+        match = re.fullmatch(rf"{SITE_PREFIX}/teams/(\d+)/roster", path)
+        if match:
+            team_id = int(match.group(1))
+            athletes = []
+            for i in range(ROSTER_SIZE):
+                athlete_id = team_id * 100 + i
+                athlete = {
+                    "id": str(athlete_id),
+                    "fullName": f"Player {athlete_id}",
+                    "jersey": str(i),
+                    "position": {"abbreviation": "GFC"[i % 3]},
+                    "injuries": [],
+                }
+                if i % 7 == 0:
+                    athlete["injuries"] = [{"status": "Out"}]
+                athletes.append(athlete)
+            return {"athletes": athletes}
+
+        if path == f"{SITE_PREFIX}/scoreboard":
+            day = query.get("dates", [datetime.now().strftime("%Y%m%d")])[0]
+            return {"events": [_event(i, day, self.server.tick) for i in range(NUM_GAMES)]}
+
+        if path == f"{SITE_PREFIX}/injuries":
+            injuries = [
+                {
+                    "athlete": {
+                        "displayName": f"Player {int(abbr[1:]) * 100}",
+                        "links": [
+                            {
+                                "href": "https://www.espn.com/nba/player/_/id/"
+                                f"{int(abbr[1:]) * 100}/player-{int(abbr[1:]) * 100}"
+                            }
+                        ],
+                        "team": {"abbreviation": abbr},
+                        "position": {"abbreviation": "G"},
+                    },
+                    "status": "Out",
+                    "details": {"type": "Knee", "returnDate": "2026-01-01"},
+                    "shortComment": f"{abbr} player out",
+                    "longComment": f"{abbr} player out with a knee injury",
+                }
+                for abbr in query.get("team", [])
+            ]
+            return {"injuries": injuries}
+
+        return None
+
+
+def _injury_team(entry: dict):
+    """Team abbreviation of an injuries entry (flat or grouped per team)"""
+    if "athlete" in entry:
+        return entry["athlete"].get("team", {}).get("abbreviation")
+    return entry.get("abbreviation") or entry.get("team", {}).get("abbreviation")
+
+
+def _leader_id(rank: int) -> int:
+    """Athlete id for a leaderboard slot - every 10th leader is not on a roster"""
+    if rank % 10 == 9:
+        return 9000 + rank
+    return (rank % NUM_TEAMS + 1) * 100 + rank // NUM_TEAMS
+
+
+def _athlete_team(athlete_id: int) -> int:
+    """Team id for an athlete (roster ids are team_id * 100 + slot)"""
+    if athlete_id >= 9000:
+        return athlete_id % NUM_TEAMS + 1
+    return athlete_id // 100
+
+
+def _event(index: int, day: str, tick: int = 0) -> dict:
+    """
+    A scoreboard event between teams 2*index+1 (away) and 2*index+2 (home)
+    Games on past days are final, today every other game is live and tick
+    baskets have been scored round-robin across the live games
+    """
+    away_id, home_id = 2 * index + 1, 2 * index + 2
+    today = datetime.now().strftime("%Y%m%d")
+    completed = day < today
+    live = day == today and index % 2 == 0
+
+    home_score, away_score = 0, 0
+    if completed:
+        home_score, away_score = 100 + index, 96
+    elif live:
+        baskets = sum(1 for t in range(1, tick + 1) if 2 * t % NUM_GAMES == index)
+        home_score, away_score = 50 + index + 2 * baskets, 48
+
+    def competitor(team_id, home_away, score):
+        return {
+            "homeAway": home_away,
+            "score": str(score),
+            "records": [{"summary": f"{team_id}-{30 - team_id}"}],
+            "team": {
+                "id": str(team_id),
+                "abbreviation": f"T{team_id:02d}",
+                "displayName": f"Team {team_id}",
+            },
+        }
+
+    return {
+        "id": f"{day}{index:02d}",
+        "shortName": f"T{away_id:02d} @ T{home_id:02d}",
+        "date": f"{day[:4]}-{day[4:6]}-{day[6:]}T00:00Z",
+        "competitions": [
+            {
+                "status": {
+                    "period": 2 if live else 4 if completed else 0,
+                    "displayClock": "5:00" if live else "0.0",
+                    "type": {
+                        "name": (
+                            "STATUS_IN_PROGRESS" if live
+                            else "STATUS_FINAL" if completed
+                            else "STATUS_SCHEDULED"
+                        ),
+                        "detail": (
+                            "2nd Quarter" if live else "Final" if completed else "7:00 PM ET"
+                        ),
+                        "completed": completed,
+                    },
+                },
+                "competitors": [
+                    competitor(home_id, "home", home_score),
+                    competitor(away_id, "away", away_score),
+                ],
+                "broadcasts": [{"names": ["ESPN" if index % 3 == 0 else "LOCAL"]}],
+                "venue": {"fullName": f"Arena {home_id}"},
+            }
+        ],
+    }
@@ -0,0 +1,317 @@
+"""
+TTL cache for ESPN responses and derived data
+Entries expire after a per-entry TTL and the backend is LRU size-bounded
+
+Backends are swappable: MemoryBackend (default) keeps entries in process,
+DiskBackend keeps them in a SQLite file so they survive restarts.
+
+Entries can also carry a stale window: once expired they are still served
+by get_or_load while a single background refresh replaces them.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from .singleflight import SingleFlight
+
+
+# Sentinel for "not in cache" (None is a legitimate cached value)
+MISSING = object()
+
+DEFAULT_MAX_ENTRIES = int(os.environ.get("SPORT_SUGGEST_CACHE_MAX_ENTRIES", 2048))
+
+# Background stale-while-revalidate refreshes run here
+_refresh_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cache-refresh")
+
+
+class MemoryBackend:
+    """In-process LRU store of {key: (value, expires_at, stale_until)}"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+
+    def get(self, key: str):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, value, expires_at: float, stale_until: float) -> int:
+        """Store an entry and return how many LRU entries were evicted"""
+        self._entries[key] = (value, expires_at, stale_until)
+        self._entries.move_to_end(key)
+
+        evicted = 0
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            evicted += 1
+        return evicted
+
+    def delete(self, key: str):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class DiskBackend:
+    """SQLite-backed LRU store - values must be JSON serializable"""
+
+    def __init__(self, path: str, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " stale_until REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str):
+        row = self._conn.execute(
+            "SELECT value, expires_at, stale_until FROM entries WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+
+        self._conn.execute(
+            "UPDATE entries SET accessed_at = ? WHERE key = ?", (time.time(), key)
+        )
+        self._conn.commit()
+        return json.loads(row[0]), row[1], row[2]
+
+    def set(self, key: str, value, expires_at: float, stale_until: float) -> int:
+        """Store an entry and return how many LRU entries were evicted"""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+            (key, json.dumps(value), expires_at, stale_until, time.time()),
+        )
+
+        evicted = 0
+        overflow = len(self) - self.max_entries
+        if overflow > 0:
+            evicted = self._conn.execute(
+                "DELETE FROM entries WHERE key IN ("
+                " SELECT key FROM entries ORDER BY accessed_at LIMIT ?)",
+                (overflow,),
+            ).rowcount
+
+        self._conn.commit()
+        return evicted
+
+    def delete(self, key: str):
+        self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+        self._conn.commit()
+
+    def clear(self):
+        self._conn.execute("DELETE FROM entries")
+        self._conn.commit()
+
+    def __len__(self):
+        return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+
+class TTLCache:
+    """
+    Thread-safe TTL cache on top of a swappable backend
+
+    TTLs are given per entry, either as seconds or as a callable that takes
+    the value and returns seconds (e.g. a shorter TTL for live scoreboards).
+    """
+
+    def __init__(self, backend=None):
+        self.backend = backend if backend is not None else MemoryBackend()
+        self._lock = threading.RLock()
+        self._refreshing = set()
+        self._flights = SingleFlight()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "stale_hits": 0,
+            "refreshes": 0,
+            "refresh_errors": 0,
+        }
+
+    def _lookup(self, key: str):
+        """Return (value, is_fresh), or (MISSING, False) once past the stale window"""
+        entry = self.backend.get(key)
+        if entry is None:
+            return MISSING, False
+
+        value, expires_at, stale_until = entry
+        now = time.time()
+        if now >= stale_until:
+            self.backend.delete(key)
+            self._stats["expirations"] += 1
+            return MISSING, False
+
+        return value, now < expires_at
+
+    def get(self, key: str):
+        """Return the cached value, or MISSING if absent or expired"""
+        with self._lock:
+            value, fresh = self._lookup(key)
+
+            if not fresh:
+                self._stats["misses"] += 1
+                return MISSING
+
+            self._stats["hits"] += 1
+            return value
+
+    def peek(self, key: str):
+        """
+        Return the cached value even if expired (but still inside its stale
+        window), or MISSING - without counting a hit or miss
+        """
+        with self._lock:
+            value, _ = self._lookup(key)
+            return value
+
+    def set(self, key: str, value, ttl, stale_ttl: float = 0, stored_at: float = None):
+        """
+        Store a value for ttl seconds (ttl may be a callable of the value)
+
+        With stale_ttl, the entry is kept that much longer after expiring so
+        get_or_load can serve it while refreshing. stored_at backdates the
+        entry (e.g. when restoring a value saved earlier).
+        """
+        if callable(ttl):
+            ttl = ttl(value)
+        if ttl <= 0:
+            return
+
+        expires_at = (stored_at or time.time()) + ttl
+        if expires_at + stale_ttl <= time.time():
+            return
+
+        with self._lock:
+            self._stats["evictions"] += self.backend.set(
+                key, value, expires_at, expires_at + stale_ttl
+            )
+
+    def get_or_load(self, key: str, loader, ttl, stale_ttl: float = 0):
+        """
+        Return the cached value, calling loader() to fill it on a miss
+
+        With stale_ttl, an expired entry still inside its stale window is
+        returned immediately and loader() runs in the background to replace
+        it - only one background refresh per key runs at a time.
+
+        Concurrent misses for the same key share one loader() call.
+
+        None results are returned but not cached, and loader exceptions
+        propagate without touching the cache.
+        """
+        with self._lock:
+            value, fresh = self._lookup(key)
+
+            if fresh:
+                self._stats["hits"] += 1
+                return value
+
+            if value is not MISSING:
+                self._stats["stale_hits"] += 1
+                if key not in self._refreshing:
+                    self._refreshing.add(key)
+                    _refresh_executor.submit(
+                        self._refresh, key, loader, ttl, stale_ttl
+                    )
+                return value
+
+            self._stats["misses"] += 1
+
+        def load():
+            value = loader()
+            if value is not None:
+                self.set(key, value, ttl, stale_ttl)
+            return value
+
+        return self._flights.do(key, load)
+
+    def _refresh(self, key: str, loader, ttl, stale_ttl: float):
+        """Background refresh for get_or_load - failures keep the stale entry"""
+        try:
+            value = loader()
+            if value is not None:
+                self.set(key, value, ttl, stale_ttl)
+            with self._lock:
+                self._stats["refreshes"] += 1
+        except Exception:
+            with self._lock:
+                self._stats["refresh_errors"] += 1
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def delete(self, key: str):
+        with self._lock:
+            self.backend.delete(key)
+
+    def clear(self):
+        with self._lock:
+            self.backend.clear()
+
+    def stats(self) -> dict:
+        """Hit/miss/eviction/refresh/coalesced counters plus current entry count"""
+        with self._lock:
+            return {
+                **self._stats,
+                "coalesced": self._flights.stats()["coalesced"],
+                "entries": len(self.backend),
+            }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> TTLCache:
+    """
+    Shared cache used by all fetchers
+
+    Uses a DiskBackend under $SPORT_SUGGEST_CACHE_DIR when that variable is
+    set, otherwise an in-memory backend.
+    """
+    global _cache
+
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                cache_dir = os.environ.get("SPORT_SUGGEST_CACHE_DIR")
+                if cache_dir:
+                    backend = DiskBackend(os.path.join(cache_dir, "cache.sqlite3"))
+                else:
+                    backend = MemoryBackend()
+                _cache = TTLCache(backend)
+
+    return _cache
+
+
+def set_backend(backend):
+    """Swap the shared cache's backend (existing entries are dropped)"""
+    global _cache
+
+    with _cache_lock:
+        _cache = TTLCache(backend)
@@ -0,0 +1,94 @@
+"""
+Circuit breaker
+Stops sending requests to an upstream host that keeps failing
+
+After failure_threshold consecutive failures the breaker opens and every
+request to that host fails immediately (CircuitOpenError) instead of
+waiting out its timeout. After reset_timeout seconds one trial request is
+let through (half-open): success closes the breaker, failure opens it
+again for another reset_timeout.
+"""
+
+import threading
+import time
+
+import requests
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of sending a request while the host's breaker is open"""
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for one host
+
+    Args:
+        failure_threshold: Consecutive failures that open the breaker
+        reset_timeout: Seconds to stay open before a trial request
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+        self._stats = {"opened": 0, "rejected": 0}
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now (half-open lets one through)"""
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            self._stats["rejected"] += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or (
+                self._state == CLOSED and self._failures >= self.failure_threshold
+            ):
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
+                self._stats["opened"] += 1
+
+    def stats(self) -> dict:
+        """state, consecutive_failures, opened (times) and rejected (requests)"""
+        with self._lock:
+            return {
+                "state": self._current_state(),
+                "consecutive_failures": self._failures,
+                **self._stats,
+            }
@@ -0,0 +1,566 @@
+"""
+HTTP client for ESPN's APIs
+Every upstream fetch in tools.py goes through here
+
+All requests share one keep-alive session, so repeat requests to
+site.api.espn.com and sports.core.api.espn.com reuse pooled connections
+instead of paying a new TCP+TLS handshake each time. Responses for known
+endpoints are cached with per-endpoint TTLs (see ENDPOINT_TTLS). Bodies
+are decoded with decode.loads, and large documents are projected down to
+the fields tools.py reads (see ENDPOINT_FIELDS) before they are cached.
+
+Every request attempt first passes its host's circuit breaker and then
+takes a token from one shared token bucket (RATE_LIMIT per second,
+RATE_BURST back to back). While a host's breaker is open, requests fail at
+once without taking a token, and cached endpoints serve their last response
+(kept STALE_IF_OPEN_TTL past expiry) instead.
+"""
+
+import hashlib
+import os
+import random
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from . import decode, metrics
+from .cache import MISSING, get_cache
+from .circuit import CircuitBreaker, CircuitOpenError
+from .ratelimit import TokenBucket
+from .singleflight import SingleFlight
+
+
+# Connection pool sizing (connections kept alive per host)
+POOL_MAXSIZE = int(os.environ.get("SPORT_SUGGEST_POOL_MAXSIZE", 32))
+
+# Upper bound on concurrent upstream requests for a single fan-out
+MAX_IN_FLIGHT = int(os.environ.get("SPORT_SUGGEST_MAX_IN_FLIGHT", 16))
+
+# Seconds to wait for a TCP connection (the read timeout is per call)
+CONNECT_TIMEOUT = float(os.environ.get("SPORT_SUGGEST_CONNECT_TIMEOUT", 3.05))
+
+# Retries on timeouts, connection errors and 5xx responses
+MAX_RETRIES = int(os.environ.get("SPORT_SUGGEST_MAX_RETRIES", 2))
+BACKOFF_BASE = float(os.environ.get("SPORT_SUGGEST_BACKOFF_BASE", 0.2))
+
+RETRY_STATUSES = {500, 502, 503, 504}
+
+# Upstream request rate shared by every fetcher (requests/second, 0: off)
+RATE_LIMIT = float(os.environ.get("SPORT_SUGGEST_RATE_LIMIT", 50))
+RATE_BURST = float(os.environ.get("SPORT_SUGGEST_RATE_BURST", 60))
+
+# Per-host circuit breaker: consecutive failed attempts that open it, and
+# seconds before a trial request
+BREAKER_FAILURES = int(os.environ.get("SPORT_SUGGEST_BREAKER_FAILURES", 5))
+BREAKER_RESET = float(os.environ.get("SPORT_SUGGEST_BREAKER_RESET", 30))
+
+# Responses that count as a failure for the breaker (besides timeouts and
+# connection errors) - the host is struggling or throttling us
+BREAKER_STATUSES = RETRY_STATUSES | {429}
+
+# How long an expired endpoint response is kept to serve while its host's
+# breaker is open
+STALE_IF_OPEN_TTL = float(os.environ.get("SPORT_SUGGEST_STALE_IF_OPEN", 60 * 60))
+
+LIVE_STATUSES = {"STATUS_IN_PROGRESS", "STATUS_HALFTIME", "STATUS_END_PERIOD"}
+
+
+def _scoreboard_ttl(data: dict) -> float:
+    """15 seconds while any game is live, a minute otherwise"""
+    for event in data.get("events", []):
+        for competition in event.get("competitions", []):
+            if competition.get("status", {}).get("type", {}).get("name") in LIVE_STATUSES:
+                return 15
+    return 60
+
+
+# Cache TTL (seconds, or a callable of the decoded response) per endpoint
+ENDPOINT_TTLS = {
+    "scoreboard": _scoreboard_ttl,
+    "injuries": 5 * 60,
+    "leaders": 60 * 60,
+    "athlete": 24 * 60 * 60,
+    "team": 24 * 60 * 60,
+    "teams": 24 * 60 * 60,
+    # Parsed rosters are cached for 24h in tools.py; raw responses only
+    # need to outlive a single refresh
+    "roster": 60 * 60,
+}
+
+# Fields kept from each endpoint's response (a decode.project shape) -
+# only what scoreboard.parse_event / the scoreboard TTLs and
+# tools._load_rosters read. Endpoints not listed are cached whole.
+SCOREBOARD_FIELDS = {
+    "events": [
+        {
+            "id": True,
+            "shortName": True,
+            "date": True,
+            "competitions": [
+                {
+                    "status": {
+                        "period": True,
+                        "displayClock": True,
+                        "type": {"name": True, "detail": True, "completed": True},
+                    },
+                    "competitors": [
+                        {
+                            "homeAway": True,
+                            "score": True,
+                            "records": [{"summary": True}],
+                            "team": {"displayName": True, "abbreviation": True},
+                        }
+                    ],
+                    "venue": {"fullName": True},
+                    "broadcasts": [{"names": True}],
+                }
+            ],
+        }
+    ]
+}
+
+ENDPOINT_FIELDS = {
+    "scoreboard": SCOREBOARD_FIELDS,
+    "teams": {
+        "sports": [
+            {
+                "leagues": [
+                    {
+                        "teams": [
+                            {"team": {"id": True, "abbreviation": True, "displayName": True}}
+                        ]
+                    }
+                ]
+            }
+        ]
+    },
+    "roster": {
+        "athletes": [
+            {
+                "id": True,
+                "fullName": True,
+                "jersey": True,
+                "position": {"abbreviation": True},
+                "injuries": [{"status": True}],
+            }
+        ]
+    },
+}
+
+_session = None
+_session_lock = threading.Lock()
+
+# Per-host counters: {host: {"requests", "connections_opened", "retries"}}
+_stats = defaultdict(lambda: {"requests": 0, "connections_opened": 0, "retries": 0})
+_stats_lock = threading.Lock()
+
+# Concurrent identical requests share one upstream fetch
+_flights = SingleFlight()
+
+_limiter = TokenBucket(RATE_LIMIT, RATE_BURST)
+
+_breakers = {}  # {host: CircuitBreaker}
+_breakers_lock = threading.Lock()
+
+
+def _get_breaker(host: str) -> CircuitBreaker:
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = _breakers[host] = CircuitBreaker(BREAKER_FAILURES, BREAKER_RESET)
+        return breaker
+
+
+def _count(host: str, field: str):
+    with _stats_lock:
+        _stats[host][field] += 1
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _new_conn(self):
+        _count(self.host, "connections_opened")
+        return super()._new_conn()
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _new_conn(self):
+        _count(self.host, "connections_opened")
+        return super()._new_conn()
+
+
+class _CountingAdapter(HTTPAdapter):
+    """HTTPAdapter whose pools report every new connection they open"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+
+def _get_session() -> requests.Session:
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                adapter = _CountingAdapter(
+                    pool_connections=4, pool_maxsize=POOL_MAXSIZE
+                )
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+
+    return _session
+
+
+def configure(
+    pool_maxsize: int = None,
+    max_in_flight: int = None,
+    connect_timeout: float = None,
+    max_retries: int = None,
+    backoff_base: float = None,
+    rate_limit: float = None,
+    rate_burst: float = None,
+    breaker_failures: int = None,
+    breaker_reset: float = None,
+):
+    """
+    Override client settings at runtime
+
+    Changing the pool size drops the current session; the next request
+    builds a new one with the updated pools. Changing the rate limit
+    replaces the token bucket, and changing breaker settings resets every
+    breaker (both start fresh).
+    """
+    global POOL_MAXSIZE, MAX_IN_FLIGHT, CONNECT_TIMEOUT, MAX_RETRIES, BACKOFF_BASE
+    global RATE_LIMIT, RATE_BURST, BREAKER_FAILURES, BREAKER_RESET, _limiter
+
+    if max_in_flight is not None:
+        MAX_IN_FLIGHT = max_in_flight
+    if connect_timeout is not None:
+        CONNECT_TIMEOUT = connect_timeout
+    if max_retries is not None:
+        MAX_RETRIES = max_retries
+    if backoff_base is not None:
+        BACKOFF_BASE = backoff_base
+    if rate_limit is not None or rate_burst is not None:
+        RATE_LIMIT = RATE_LIMIT if rate_limit is None else rate_limit
+        RATE_BURST = RATE_BURST if rate_burst is None else rate_burst
+        _limiter = TokenBucket(RATE_LIMIT, RATE_BURST)
+    if breaker_failures is not None or breaker_reset is not None:
+        BREAKER_FAILURES = BREAKER_FAILURES if breaker_failures is None else breaker_failures
+        BREAKER_RESET = BREAKER_RESET if breaker_reset is None else breaker_reset
+        with _breakers_lock:
+            _breakers.clear()
+    if pool_maxsize is not None:
+        POOL_MAXSIZE = pool_maxsize
+        close()
+
+
+def close():
+    """Close pooled connections (a new session is created on next use)"""
+    global _session
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+
+
+def get_connection_stats() -> dict:
+    """
+    Per-host request and connection counters
+
+    Returns:
+        Dict of {host: {"requests", "connections_opened", "connections_reused",
+        "retries"}} - connections_reused is how many requests went out on an
+        already-open keep-alive connection
+    """
+    with _stats_lock:
+        return {
+            host: {
+                **counters,
+                "connections_reused": max(
+                    counters["requests"] - counters["connections_opened"], 0
+                ),
+            }
+            for host, counters in _stats.items()
+        }
+
+
+def reset_connection_stats():
+    """Zero all per-host counters"""
+    with _stats_lock:
+        _stats.clear()
+
+
+def get_coalescing_stats() -> dict:
+    """
+    Request coalescing counters
+
+    Returns:
+        Dict with "calls" (fetches that reached the single-flight layer,
+        i.e. cache misses) and "coalesced" (how many of those joined an
+        identical in-flight request instead of making their own)
+    """
+    return _flights.stats()
+
+
+def get_breaker_stats() -> dict:
+    """
+    Circuit breaker state per host
+
+    Returns:
+        Dict of {host: {"state", "consecutive_failures", "opened", "rejected"}}
+        - opened counts trips, rejected the requests failed fast while open
+    """
+    with _breakers_lock:
+        breakers = dict(_breakers)
+    return {host: breaker.stats() for host, breaker in breakers.items()}
+
+
+def get_rate_limit_stats() -> dict:
+    """
+    Shared token bucket settings and counters
+
+    Returns:
+        Dict with "rate", "burst", "acquired", "waited" (requests that had
+        to wait for a token), "wait_seconds" and "max_wait_seconds"
+    """
+    return _limiter.stats()
+
+
+def _backoff(attempt: int) -> float:
+    """Exponential backoff with full jitter"""
+    return random.uniform(0, BACKOFF_BASE * (2**attempt))
+
+
+def get_json(
+    url: str, timeout: float = 10, endpoint: str = None, fields: dict = None
+) -> dict:
+    """
+    Fetch a URL and decode its JSON body
+
+    Timeouts, connection errors and 5xx responses are retried up to
+    MAX_RETRIES times with jittered exponential backoff. Concurrent calls
+    for the same URL share a single request and its result.
+
+    Args:
+        url: URL to fetch
+        timeout: Read timeout in seconds
+        endpoint: Key into ENDPOINT_TTLS - when given, the response is served
+            from and stored in the shared cache. Cached responses are shared,
+            so callers must not mutate them.
+        fields: decode.project shape to keep (default ENDPOINT_FIELDS of the
+            endpoint, if any)
+
+    Raises:
+        requests.exceptions.RequestException on network, HTTP or decode errors
+    """
+    if fields is None and endpoint is not None:
+        fields = ENDPOINT_FIELDS.get(endpoint)
+
+    if endpoint is None:
+        return _flights.do(url, lambda: _fetch_json(url, timeout, fields))
+
+    cache = get_cache()
+    data = cache.get(url)
+    if data is MISSING:
+        metrics.count_upstream(url, cache="miss")
+        data = _flights.do(url, lambda: _fetch_and_cache(url, timeout, endpoint, fields))
+    else:
+        metrics.count_upstream(url, cache="hit")
+    return data
+
+
+def _fetch_and_cache(url: str, timeout: float, endpoint: str, fields: dict = None) -> dict:
+    """Fetch and cache a response, or serve the expired one while the breaker is open"""
+    cache = get_cache()
+    try:
+        data = _fetch_json(url, timeout, fields)
+    except CircuitOpenError:
+        data = cache.peek(url)
+        if data is MISSING:
+            raise
+        metrics.count_upstream(url, cache="stale")
+        return data
+
+    cache.set(url, data, ENDPOINT_TTLS[endpoint], STALE_IF_OPEN_TTL)
+    return data
+
+
+def _fetch_json(url: str, timeout: float, fields: dict = None) -> dict:
+    """Fetch and decode a URL with retries, bypassing the cache"""
+    return _decode(_request(url, timeout).content, fields)
+
+
+def _decode(content: bytes, fields: dict = None):
+    """
+    Decode a response body, keeping only fields (a decode.project shape) if given
+
+    Raises:
+        requests.exceptions.JSONDecodeError on invalid JSON, like Response.json()
+    """
+    try:
+        data = decode.loads(content)
+    except ValueError as e:
+        raise requests.exceptions.JSONDecodeError(
+            getattr(e, "msg", str(e)), getattr(e, "doc", ""), getattr(e, "pos", 0)
+        )
+
+    return data if fields is None else decode.project(data, fields)
+
+
+def get_json_if_changed(
+    url: str, validators: dict = None, timeout: float = 10, fields: dict = None
+):
+    """
+    Conditionally fetch a URL, decoding the body only if it changed
+
+    Sends If-None-Match / If-Modified-Since from the validators of the
+    previous fetch. Servers that ignore them still answer 200 with the full
+    body; a digest of that body is compared instead, so an unchanged
+    response is never decoded. Bypasses the cache.
+
+    Args:
+        url: URL to fetch
+        validators: Validators returned by the previous call (None at first)
+        timeout: Read timeout in seconds
+        fields: decode.project shape to keep from a changed response
+
+    Returns:
+        (data, validators) tuple - data is None if the response is unchanged
+
+    Raises:
+        requests.exceptions.RequestException on network, HTTP or decode errors
+    """
+    validators = validators or {}
+
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+
+    response = _request(url, timeout, headers)
+    if response.status_code == 304:
+        return None, validators
+
+    digest = hashlib.blake2b(response.content, digest_size=16).hexdigest()
+    new_validators = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "digest": digest,
+    }
+    if digest == validators.get("digest"):
+        return None, new_validators
+
+    return _decode(response.content, fields), new_validators
+
+
+def _request(url: str, timeout: float, headers: dict = None) -> requests.Response:
+    """
+    GET a URL with retries on timeouts, connection errors and 5xx responses
+
+    Each attempt is refused with CircuitOpenError while the host's breaker
+    is open, and otherwise waits for a rate limit token - refused attempts
+    never take one.
+    """
+    session = _get_session()
+    host = urlsplit(url).hostname or ""
+    breaker = _get_breaker(host)
+
+    with metrics.upstream_span(url) as span:
+        attempt = 0
+        while True:
+            if not breaker.allow():
+                span.set(status="circuit_open")
+                raise CircuitOpenError(f"Circuit open for {host}, not requesting {url}")
+            _limiter.acquire()
+
+            _count(host, "requests")
+            try:
+                response = _send(session, breaker, url, headers, timeout)
+                span.set(status=response.status_code, attempts=attempt + 1)
+                if response.status_code in RETRY_STATUSES and attempt < MAX_RETRIES:
+                    response.close()
+                    raise requests.exceptions.RetryError(
+                        f"{response.status_code} from {url}"
+                    )
+                response.raise_for_status()
+                span.set(bytes=len(response.content))
+                return response
+            except (
+                requests.exceptions.Timeout,
+                requests.exceptions.ConnectionError,
+                requests.exceptions.RetryError,
+            ):
+                if attempt >= MAX_RETRIES:
+                    raise
+                _count(host, "retries")
+                time.sleep(_backoff(attempt))
+                attempt += 1
+
+
+def _send(session, breaker: CircuitBreaker, url: str, headers: dict, timeout: float):
+    """One GET attempt, reporting its outcome to the host's breaker"""
+    try:
+        response = session.get(url, headers=headers, timeout=(CONNECT_TIMEOUT, timeout))
+    except Exception:
+        breaker.record_failure()
+        raise
+
+    if response.status_code in BREAKER_STATUSES:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+    return response
+
+
+def get_json_many(
+    urls,
+    timeout: float = 5,
+    max_in_flight: int = None,
+    endpoint: str = None,
+    fields: dict = None,
+) -> dict:
+    """
+    Fetch many URLs concurrently with a bounded number of requests in flight
+
+    Duplicate URLs are fetched once. Failures do not abort the batch - the
+    exception is stored in place of the decoded body so callers can keep
+    their per-entry fallback behavior.
+
+    Args:
+        urls: Iterable of URLs (None entries are ignored)
+        timeout: Per-request timeout in seconds
+        max_in_flight: Concurrency cap (defaults to MAX_IN_FLIGHT)
+        endpoint: Cache key into ENDPOINT_TTLS (see get_json)
+        fields: decode.project shape to keep (see get_json)
+
+    Returns:
+        Dict of {url: decoded JSON or Exception}
+    """
+    unique_urls = list(dict.fromkeys(url for url in urls if url))
+    if not unique_urls:
+        return {}
+
+    def fetch(url):
+        try:
+            return get_json(url, timeout=timeout, endpoint=endpoint, fields=fields)
+        except requests.exceptions.RequestException as e:
+            return e
+
+    workers = min(max_in_flight or MAX_IN_FLIGHT, len(unique_urls))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(fetch, unique_urls)
+        return dict(zip(unique_urls, results))
@@ -0,0 +1,63 @@
+"""
+JSON decoding
+Fast parser when available, plus field projection for large ESPN payloads
+
+loads() uses orjson when it is installed (the "fast" extra) and the
+standard library json module otherwise. project() keeps only the fields a
+parser actually reads, described by a shape:
+
+    {"athletes": [{"fullName": True, "position": {"abbreviation": True}}]}
+
+True keeps a value whole, a dict keeps those keys of an object, and a
+one-element list applies its shape to every item of an array. A roster or
+scoreboard is projected right after decoding, so the cache holds the few
+fields tools.py needs instead of ESPN's full document.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def loads(content):
+    """
+    Decode JSON bytes or str
+
+    Raises:
+        json.JSONDecodeError (orjson's error is a subclass) on invalid input
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def project(value, shape):
+    """
+    The parts of a decoded value selected by shape (see the module docstring)
+
+    Values whose type does not match the shape (e.g. null where an object
+    is expected) are kept as they are, so parsers see the same defaults.
+    """
+    if shape is True:
+        return value
+
+    if isinstance(shape, dict):
+        if not isinstance(value, dict):
+            return value
+        return {
+            key: project(value[key], sub_shape)
+            for key, sub_shape in shape.items()
+            if key in value
+        }
+
+    if isinstance(value, list):
+        item_shape = shape[0]
+        return [project(item, item_shape) for item in value]
+
+    return value
@@ -0,0 +1,204 @@
+"""
+Live scoreboard poller with a change feed
+Lets clients poll for what changed instead of re-reading the whole scoreboard
+
+Each poll is a conditional request (see client.get_json_if_changed), so an
+unchanged scoreboard is neither re-downloaded (where ESPN honors ETag /
+Last-Modified) nor re-parsed. Changed responses are reduced to a small
+per-game state (scores, period, clock, status) and diffed against the
+previous one; every game that changed is stamped with a new sequence
+number. Clients pass back the cursor from their last call and only get
+games stamped after it.
+"""
+
+import os
+import threading
+import time
+import uuid
+
+from .cache import get_cache
+from .client import ENDPOINT_TTLS, SCOREBOARD_FIELDS, get_json_if_changed
+from .scoreboard import Game, parse_scoreboard
+
+
+# Polls closer together than this reuse the last result
+MIN_POLL_INTERVAL = float(os.environ.get("SPORT_SUGGEST_MIN_POLL_INTERVAL", 5))
+
+
+def _game_state(game: Game) -> dict:
+    """Reduce a parsed game to the fields the change feed tracks"""
+    return {
+        "game_id": game.game_id,
+        "game_name": game.name,
+        "status": game.status_name.removeprefix("STATUS_").lower(),
+        "period": game.period,
+        "clock": game.clock,
+        "away_team": game.away.abbreviation,
+        "away_score": game.away.score,
+        "home_team": game.home.abbreviation,
+        "home_score": game.home.score,
+    }
+
+
+class ScoreboardPoller:
+    """
+    Polls one scoreboard URL and keeps a sequence-numbered change log
+
+    Cursors are "<generation>:<sequence>" strings. The generation is random
+    per poller, so a cursor from before a restart is recognized as unknown
+    and answered with the full state.
+    """
+
+    def __init__(self, url: str, min_interval: float = None):
+        self.url = url
+        self.min_interval = MIN_POLL_INTERVAL if min_interval is None else min_interval
+        self.generation = uuid.uuid4().hex[:8]
+
+        self._lock = threading.Lock()
+        self._validators = None
+        self._last_poll = 0.0
+        self._sequence = 0
+        self._games = {}  # {game_id: state}
+        self._changed_at = {}  # {game_id: sequence of its last change}
+        self._removed_at = {}  # {game_id: sequence it left the scoreboard}
+        self._removed_teams = {}  # {game_id: (away, home) of a removed game}
+        self._stats = {"polls": 0, "not_modified": 0, "changed": 0}
+
+    @property
+    def cursor(self) -> str:
+        return f"{self.generation}:{self._sequence}"
+
+    def poll(self, force: bool = False) -> bool:
+        """
+        Fetch the scoreboard if it may have changed and apply it
+
+        Returns:
+            True if any game changed
+
+        Raises:
+            requests.exceptions.RequestException if the scoreboard fails
+        """
+        with self._lock:
+            now = time.monotonic()
+            if not force and self._last_poll and now - self._last_poll < self.min_interval:
+                return False
+            self._last_poll = now
+
+            data, self._validators = get_json_if_changed(
+                self.url, self._validators, timeout=10, fields=SCOREBOARD_FIELDS
+            )
+            self._stats["polls"] += 1
+
+            if data is None:
+                self._stats["not_modified"] += 1
+                return False
+
+            # Keep the shared cache current so get_nba_scores doesn't refetch
+            get_cache().set(self.url, data, ENDPOINT_TTLS["scoreboard"])
+
+            return self._apply(data)
+
+    def _apply(self, data: dict) -> bool:
+        """Diff a decoded scoreboard against the current state (lock held)"""
+        games = {game.game_id: _game_state(game) for game in parse_scoreboard(data)}
+
+        changed = [
+            game_id
+            for game_id, state in games.items()
+            if self._games.get(game_id) != state
+        ]
+        removed = self._games.keys() - games.keys()
+
+        if changed or removed:
+            self._sequence += 1
+            for game_id in changed:
+                self._changed_at[game_id] = self._sequence
+                self._removed_at.pop(game_id, None)
+                self._removed_teams.pop(game_id, None)
+            for game_id in removed:
+                self._changed_at.pop(game_id, None)
+                self._removed_at[game_id] = self._sequence
+                state = self._games[game_id]
+                self._removed_teams[game_id] = (state["away_team"], state["home_team"])
+            self._stats["changed"] += 1
+
+        self._games = games
+        return bool(changed or removed)
+
+    def changes_since(self, cursor: str = None, teams: set = None) -> dict:
+        """
+        Games that changed after cursor
+
+        Args:
+            cursor: Cursor from a previous call; None or an unknown cursor
+                returns every game
+            teams: Only games involving these team abbreviations (removed
+                and unchanged count only those games too)
+
+        Returns:
+            Dict with "cursor" (pass it back next time), "full" (True when
+            every game is included), "games" (list of game states),
+            "removed" (ids of games that left the scoreboard) and
+            "unchanged" (number of games left out)
+        """
+        with self._lock:
+            since = self._parse_cursor(cursor)
+            full = since is None
+
+            watched = [
+                (game_id, state)
+                for game_id, state in self._games.items()
+                if not teams or state["away_team"] in teams or state["home_team"] in teams
+            ]
+            games = [
+                state
+                for game_id, state in watched
+                if full or self._changed_at.get(game_id, 0) > since
+            ]
+            removed = [
+                game_id
+                for game_id, sequence in self._removed_at.items()
+                if not full
+                and sequence > since
+                and (not teams or not teams.isdisjoint(self._removed_teams[game_id]))
+            ]
+
+            return {
+                "cursor": self.cursor,
+                "full": full,
+                "games": games,
+                "removed": removed,
+                "unchanged": len(watched) - len(games),
+            }
+
+    def _parse_cursor(self, cursor: str):
+        """Sequence number of a cursor from this poller, else None"""
+        if not cursor:
+            return None
+
+        generation, _, sequence = cursor.partition(":")
+        if generation != self.generation or not sequence.isdigit():
+            return None
+
+        sequence = int(sequence)
+        if sequence > self._sequence:
+            return None
+        return sequence
+
+    def stats(self) -> dict:
+        """Poll counters: polls, not_modified (unchanged responses), changed"""
+        with self._lock:
+            return dict(self._stats)
+
+
+_pollers = {}
+_pollers_lock = threading.Lock()
+
+
+def get_poller(url: str) -> ScoreboardPoller:
+    """Shared poller for a scoreboard URL"""
+    with _pollers_lock:
+        poller = _pollers.get(url)
+        if poller is None:
+            poller = _pollers[url] = ScoreboardPoller(url)
+        return poller
@@ -0,0 +1,172 @@
+"""
+Per-game matchup summaries
+Precomputes what the LLM would otherwise work out by cross-referencing lists
+
+For each game: which ranked players are active, questionable or out (from
+an index over the rankings, matchup injuries and roster injury flags), the
+teams' win percentages and the gap between them, and whether the game is on
+national TV. Joining here is O(games + injuries + rankings) instead of a
+name-by-name scan of every list in the prompt.
+
+Players are joined on ESPN athlete id where both sides have one, and on
+(team, name) otherwise.
+"""
+
+
+# Broadcast names that count as national TV (compared upper-case)
+NATIONAL_BROADCASTS = {
+    "ABC",
+    "AMAZON PRIME VIDEO",
+    "ESPN",
+    "ESPN2",
+    "NBA TV",
+    "NBC",
+    "PEACOCK",
+    "PRIME VIDEO",
+    "TBS",
+    "TNT",
+}
+
+# Injury statuses (lower-case) by availability bucket; anything else,
+# including no injury at all, counts as active
+OUT_STATUSES = {"out", "suspension", "suspended", "inactive"}
+QUESTIONABLE_STATUSES = {"questionable", "doubtful", "day-to-day", "game-time decision"}
+
+
+def availability(status: str) -> str:
+    """Bucket an injury status: "active", "questionable" or "out" """
+    if not status:
+        return "active"
+    status = status.lower()
+    if status in OUT_STATUSES:
+        return "out"
+    if status in QUESTIONABLE_STATUSES:
+        return "questionable"
+    return "active"
+
+
+def win_pct(record: str):
+    """Win percentage of a "W-L" record summary, or None if unparseable"""
+    try:
+        wins, losses = (int(part) for part in record.split("-")[:2])
+    except (AttributeError, ValueError):
+        return None
+    games = wins + losses
+    return round(wins / games, 3) if games else None
+
+
+def is_national(broadcasts) -> bool:
+    return any(name.upper() in NATIONAL_BROADCASTS for name in broadcasts)
+
+
+def build_star_index(rankings: list) -> dict:
+    """{team_abbr: [ranking dict, ...]} in rank order"""
+    stars = {}
+    for player in rankings:
+        stars.setdefault(player["team"], []).append(player)
+    return stars
+
+
+def build_injury_index(games: list, rosters=None) -> tuple:
+    """
+    Injury statuses as ({athlete_id: status}, {(team_abbr, player_name): status})
+
+    A team's matchup injury report is current, so a player missing from it
+    is active whatever the roster says. Roster injury flags (rosters.Rosters,
+    refreshed daily and possibly older) are only used for the teams of games
+    whose matchup_injuries could not be fetched (carry an "error").
+
+    Args:
+        games: Game dicts with matchup_injuries
+        rosters: Roster model for the fallback, or None
+    """
+    by_id = {}
+    by_name = {}
+
+    unreported = {
+        game[side]["abbreviation"]
+        for game in games
+        if "error" in game.get("matchup_injuries", {})
+        for side in ("away_team", "home_team")
+    }
+
+    for team_abbr in unreported if rosters is not None else ():
+        team = rosters.teams.get(team_abbr)
+        if team is None:
+            continue
+        for player in team.players:
+            if player.injured:
+                if player.id is not None:
+                    by_id[player.id] = player.injury_status
+                by_name[(team_abbr, player.name)] = player.injury_status
+
+    for game in games:
+        for injury in game.get("matchup_injuries", {}).get("injuries", []):
+            if injury.get("player_id") is not None:
+                by_id[injury["player_id"]] = injury["status"]
+            by_name[(injury["team"], injury["player_name"])] = injury["status"]
+
+    return by_id, by_name
+
+
+def injury_status(injuries: tuple, player_id, team_abbr: str, name: str):
+    """Injury status in a build_injury_index index (by id, else by name), or None"""
+    by_id, by_name = injuries
+    if player_id is not None and player_id in by_id:
+        return by_id[player_id]
+    return by_name.get((team_abbr, name))
+
+
+def summarize_game(game: dict, stars: dict, injuries: dict) -> dict:
+    """
+    Summary for one game dict (see tools._fetch_games_data_structured)
+
+    Args:
+        game: Game dict
+        stars: Index from build_star_index
+        injuries: Index from build_injury_index
+
+    Returns:
+        Dict with "stars" ({"active", "questionable", "out"} lists of
+        ranked players), "active_stars", "best_active_rank", "win_pct"
+        ({"away", "home"}), "win_pct_gap" and "national_broadcast"
+    """
+    buckets = {"active": [], "questionable": [], "out": []}
+
+    for side in ("away_team", "home_team"):
+        team_abbr = game[side]["abbreviation"]
+        for player in stars.get(team_abbr, ()):
+            status = injury_status(injuries, player.get("id"), team_abbr, player["name"])
+            entry = {"rank": player["rank"], "name": player["name"], "team": team_abbr}
+            bucket = availability(status)
+            if bucket != "active":
+                entry["status"] = status
+            buckets[bucket].append(entry)
+
+    for entries in buckets.values():
+        entries.sort(key=lambda entry: entry["rank"])
+
+    away_pct = win_pct(game["away_team"]["record"])
+    home_pct = win_pct(game["home_team"]["record"])
+    gap = None
+    if away_pct is not None and home_pct is not None:
+        gap = round(abs(away_pct - home_pct), 3)
+
+    return {
+        "stars": buckets,
+        "active_stars": len(buckets["active"]),
+        "best_active_rank": buckets["active"][0]["rank"] if buckets["active"] else None,
+        "win_pct": {"away": away_pct, "home": home_pct},
+        "win_pct_gap": gap,
+        "national_broadcast": is_national(game.get("broadcast", [])),
+    }
+
+
+def summarize_games(games: list, rankings: list, rosters=None) -> dict:
+    """
+    {game_id: summary} for every game, sharing one star and injury index
+    (rosters: the rosters.Rosters model for build_injury_index, or None)
+    """
+    stars = build_star_index(rankings)
+    injuries = build_injury_index(games, rosters)
+    return {game["game_id"]: summarize_game(game, stars, injuries) for game in games}
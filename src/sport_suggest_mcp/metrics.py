@@ -0,0 +1,274 @@
+"""
+In-process instrumentation
+Timing spans for tool calls and upstream requests, folded into histograms
+
+Every tool call (server.py) and upstream HTTP request (client.py) is timed
+as a span. Spans are aggregated per name into log-bucketed latency
+histograms (count, mean, min, max, approximate p50/p95/p99) plus counters
+for their status, cache and error fields and the bytes they moved.
+Upstream spans are named by URL template - numeric path segments become
+{id} and query values are dropped - so one histogram covers an endpoint
+rather than a single athlete.
+
+SPORT_SUGGEST_LOG=1 also writes each span to stderr as one JSON object per
+line. SPORT_SUGGEST_METRICS=0 turns instrumentation off: span() then hands
+back a shared no-op object after a single flag check.
+"""
+
+import json
+import os
+import re
+import sys
+import threading
+import time
+from bisect import bisect_left
+from functools import lru_cache
+from urllib.parse import parse_qsl, urlsplit
+
+
+ENABLED = os.environ.get("SPORT_SUGGEST_METRICS", "1").lower() not in ("0", "false", "no")
+LOG_SPANS = os.environ.get("SPORT_SUGGEST_LOG", "0").lower() in ("1", "true", "yes")
+
+# Histogram bucket upper bounds in milliseconds (the last bucket is open)
+BUCKET_BOUNDS_MS = (
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+    30000,
+)
+
+# Span fields whose values are counted per span name
+COUNTED_FIELDS = ("status", "cache", "error")
+
+_NUMERIC_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+class Histogram:
+    """Latency histogram over BUCKET_BOUNDS_MS"""
+
+    __slots__ = ("count", "total", "min", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+
+    def add(self, ms: float):
+        self.count += 1
+        self.total += ms
+        if self.min is None or ms < self.min:
+            self.min = ms
+        if self.max is None or ms > self.max:
+            self.max = ms
+        self.buckets[bisect_left(BUCKET_BOUNDS_MS, ms)] += 1
+
+    def percentile(self, fraction: float):
+        """Upper bound of the bucket holding the fraction-th sample (capped at max)"""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for index, hits in enumerate(self.buckets):
+            seen += hits
+            if seen >= rank and hits:
+                if index < len(BUCKET_BOUNDS_MS):
+                    return min(BUCKET_BOUNDS_MS[index], self.max)
+                break
+        return self.max
+
+    def summary(self) -> dict:
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count, 3),
+            "min_ms": round(self.min, 3),
+            "p50_ms": round(self.percentile(0.5), 3),
+            "p95_ms": round(self.percentile(0.95), 3),
+            "p99_ms": round(self.percentile(0.99), 3),
+            "max_ms": round(self.max, 3),
+        }
+
+
+class _Series:
+    """Histogram plus field counters for one span name"""
+
+    __slots__ = ("histogram", "counters", "bytes")
+
+    def __init__(self):
+        self.histogram = Histogram()
+        self.counters = {}
+        self.bytes = 0
+
+    def summary(self) -> dict:
+        summary = self.histogram.summary()
+        if self.counters:
+            summary["counts"] = dict(sorted(self.counters.items()))
+        if self.bytes:
+            summary["bytes"] = self.bytes
+        return summary
+
+
+_series = {}  # {(kind, name): _Series}
+_lock = threading.Lock()
+
+
+class Span:
+    """
+    A timed operation - use as a context manager
+
+    Fields set with set() (or passed to span()) are counted (COUNTED_FIELDS),
+    summed ("bytes") and logged. An exception escaping the block is recorded
+    as the "error" field and re-raised.
+    """
+
+    __slots__ = ("kind", "name", "fields", "start")
+
+    def __init__(self, kind: str, name: str, fields: dict):
+        self.kind = kind
+        self.name = name
+        self.fields = fields
+        self.start = None
+
+    def set(self, **fields):
+        self.fields.update(fields)
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        ms = (time.perf_counter() - self.start) * 1000
+        if exc_type is not None and "error" not in self.fields:
+            self.fields["error"] = exc_type.__name__
+        _record(self.kind, self.name, ms, self.fields)
+        return False
+
+
+class _NoopSpan:
+    """Stands in for Span while instrumentation is disabled"""
+
+    __slots__ = ()
+
+    def set(self, **fields):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP = _NoopSpan()
+
+
+def span(kind: str, name: str, **fields):
+    """
+    Time a block as a span
+
+    Args:
+        kind: Span family, e.g. "tool" or "upstream"
+        name: Series within the family (tool name, URL template)
+        **fields: Initial fields (status, cache, bytes, ...)
+    """
+    if not ENABLED:
+        return _NOOP
+    return Span(kind, name, fields)
+
+
+def upstream_span(url: str, **fields):
+    """span("upstream", url_template(url)) - the template is only built when enabled"""
+    if not ENABLED:
+        return _NOOP
+    return Span("upstream", url_template(url), fields)
+
+
+def count(kind: str, name: str, **fields):
+    """Record an untimed event (e.g. a cache hit) against a span series"""
+    if not ENABLED:
+        return
+    _record(kind, name, None, fields)
+
+
+def count_upstream(url: str, **fields):
+    """count("upstream", url_template(url), ...) - the template is only built when enabled"""
+    if not ENABLED:
+        return
+    _record("upstream", url_template(url), None, fields)
+
+
+@lru_cache(maxsize=1024)
+def url_template(url: str) -> str:
+    """
+    Series name for an upstream URL: host and path with numeric segments as
+    {id}, plus the query keys only - e.g. .../teams/{id}/roster, .../scoreboard?dates
+    """
+    parts = urlsplit(url)
+    template = parts.netloc + _NUMERIC_SEGMENT.sub("/{id}", parts.path)
+    keys = sorted({key for key, _ in parse_qsl(parts.query)})
+    if keys:
+        template += "?" + "&".join(keys)
+    return template
+
+
+def _record(kind: str, name: str, ms, fields: dict):
+    with _lock:
+        series = _series.get((kind, name))
+        if series is None:
+            series = _series[(kind, name)] = _Series()
+        if ms is not None:
+            series.histogram.add(ms)
+        for field in COUNTED_FIELDS:
+            value = fields.get(field)
+            if value is not None:
+                counter = f"{field}={value}"
+                series.counters[counter] = series.counters.get(counter, 0) + 1
+        series.bytes += fields.get("bytes") or 0
+
+    if LOG_SPANS:
+        line = {"ts": round(time.time(), 3), "kind": kind, "name": name}
+        if ms is not None:
+            line["ms"] = round(ms, 3)
+        line.update(fields)
+        sys.stderr.write(json.dumps(line, default=str) + "\n")
+
+
+def configure(enabled: bool = None, log: bool = None):
+    """Turn instrumentation and span logging on or off at runtime"""
+    global ENABLED, LOG_SPANS
+
+    if enabled is not None:
+        ENABLED = enabled
+    if log is not None:
+        LOG_SPANS = log
+
+
+def snapshot() -> dict:
+    """{kind: {name: summary}} for every series recorded so far"""
+    with _lock:
+        result = {}
+        for (kind, name), series in sorted(_series.items()):
+            result.setdefault(kind, {})[name] = series.summary()
+        return result
+
+
+def reset():
+    """Drop every recorded series"""
+    with _lock:
+        _series.clear()
@@ -0,0 +1,66 @@
+"""
+Token-bucket rate limiter
+Caps the request rate of every fetcher sharing the bucket
+
+The bucket holds up to burst tokens and refills at rate tokens per second.
+Each request takes one token; when the bucket is empty the caller sleeps
+until its token is due. Tokens are reserved under the lock (the balance
+may go negative), so waiting callers are served in arrival order without
+re-polling.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket
+
+    Args:
+        rate: Tokens added per second (0 or less disables limiting)
+        burst: Bucket capacity - requests allowed back to back
+    """
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = max(burst, 1)
+
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._stats = {"acquired": 0, "waited": 0, "wait_seconds": 0.0, "max_wait_seconds": 0.0}
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until it is available; returns seconds waited"""
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self._stats["acquired"] += 1
+            if wait:
+                self._stats["waited"] += 1
+                self._stats["wait_seconds"] += wait
+                self._stats["max_wait_seconds"] = max(self._stats["max_wait_seconds"], wait)
+
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    def stats(self) -> dict:
+        """acquired, waited (requests that had to wait), wait_seconds, max_wait_seconds"""
+        with self._lock:
+            return {
+                "rate": self.rate,
+                "burst": self.burst,
+                **{
+                    key: round(value, 3) if isinstance(value, float) else value
+                    for key, value in self._stats.items()
+                },
+            }
@@ -0,0 +1,229 @@
+"""
+Roster data model
+Slotted, interned player/team records with lookup indexes, built once per roster refresh
+
+Rosters are cached (and snapshotted to disk) as plain JSON rows - see
+Rosters.from_rows. from_rows turns those rows into Player and Team records
+plus the indexes every view needs: team -> players, player id -> player,
+team id -> abbreviation. get_model memoizes that per cached value, so a
+cache hit is a dictionary lookup instead of a rebuild, and per-team views
+(display text, structured dicts) are built at most once per refresh.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+
+
+# Roster row values (cached entries) whose models are kept, by identity
+MODEL_MEMO_SIZE = 16
+
+# Team subsets (Rosters.subset views) kept per model
+SUBSET_MEMO_SIZE = 32
+
+# Team roster states
+ROSTER_OK = "ok"
+ROSTER_EMPTY = "empty"
+ROSTER_UNAVAILABLE = "unavailable"
+
+# Players listed in a team's display text before "... and N more"
+DISPLAY_PLAYERS = 12
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class Player:
+    """One rostered player"""
+
+    __slots__ = ("id", "name", "jersey", "position", "team", "injury_status")
+
+    def __init__(
+        self,
+        id: str,
+        name: str,
+        jersey: str,
+        position: str,
+        team: str,
+        injury_status: str = None,
+    ):
+        self.id = id
+        self.name = name
+        self.jersey = jersey
+        self.position = position
+        self.team = team
+        self.injury_status = injury_status
+
+    @property
+    def injured(self) -> bool:
+        return self.injury_status is not None
+
+    def display(self) -> str:
+        text = f"#{self.jersey} {self.name}" if self.jersey else self.name
+        if self.position:
+            text += f" ({self.position})"
+        if self.injured:
+            text += f" - {self.injury_status}"
+        return text
+
+
+class Team:
+    """A team and its roster"""
+
+    __slots__ = ("id", "abbreviation", "name", "status", "players", "_display", "_structured")
+
+    def __init__(self, id: str, abbreviation: str, name: str, status: str = ROSTER_OK):
+        self.id = id
+        self.abbreviation = abbreviation
+        self.name = name
+        self.status = status
+        self.players = []
+        self._display = None
+        self._structured = None
+
+    def display(self) -> str:
+        """get_nba_rosters text block (built once)"""
+        if self._display is None:
+            header = f"**{self.name} ({self.abbreviation})**"
+            if self.status == ROSTER_UNAVAILABLE:
+                text = f"{header} - Roster unavailable\n\n"
+            elif self.status == ROSTER_EMPTY:
+                text = f"{header} - No roster data\n\n"
+            else:
+                text = f"{header}\n"
+                if self.players:
+                    shown = ", ".join(p.display() for p in self.players[:DISPLAY_PLAYERS])
+                    text += f"  Players: {shown}"
+                    if len(self.players) > DISPLAY_PLAYERS:
+                        text += f" ... and {len(self.players) - DISPLAY_PLAYERS} more"
+                    text += "\n"
+                text += "\n"
+            self._display = text
+        return self._display
+
+    def structured(self) -> list:
+        """
+        Player dicts for get_nba_recommendation_data (built once)
+        Shared between calls - callers must not mutate them
+        """
+        if self._structured is None:
+            self._structured = [
+                {
+                    "name": player.name,
+                    "injured": player.injured,
+                    "injury_status": player.injury_status,
+                }
+                for player in self.players
+            ]
+        return self._structured
+
+
+class Rosters:
+    """
+    Every loaded team roster plus lookup indexes
+
+    Attributes:
+        teams: {team_abbr: Team} in league order
+        players: {athlete_id: Player}
+        team_abbrs: {team_id: team_abbr}
+        last_updated: ISO timestamp of the fetch
+    """
+
+    __slots__ = ("teams", "players", "team_abbrs", "last_updated", "_subsets", "_subsets_lock")
+
+    def __init__(self, teams: dict = None, last_updated: str = None):
+        self.teams = teams or {}
+        self.last_updated = last_updated
+        self.players = {}
+        self.team_abbrs = {}
+        self._subsets = OrderedDict()  # {frozenset of abbrs: Rosters}
+        self._subsets_lock = threading.Lock()
+
+        for team in self.teams.values():
+            if team.id is not None:
+                self.team_abbrs[team.id] = team.abbreviation
+            for player in team.players:
+                if player.id is not None:
+                    self.players[player.id] = player
+
+    @classmethod
+    def from_rows(cls, rows: dict) -> "Rosters":
+        """
+        Build the model from the cached JSON rows (see tools._load_rosters):
+        {"teams": [[team_id, abbr, name, status]], "players": [[athlete_id,
+        name, jersey, position, team_abbr, injury_status]], "last_updated"}
+        """
+        teams = {}
+        for team_id, abbr, name, status in rows["teams"]:
+            abbr = _intern(abbr)
+            teams[abbr] = Team(_intern(team_id), abbr, name, status)
+
+        for athlete_id, name, jersey, position, abbr, injury_status in rows["players"]:
+            team = teams.get(abbr)
+            if team is not None:
+                team.players.append(
+                    Player(
+                        athlete_id,
+                        _intern(name),
+                        _intern(jersey),
+                        _intern(position),
+                        team.abbreviation,
+                        _intern(injury_status),
+                    )
+                )
+
+        return cls(teams, rows.get("last_updated"))
+
+    def subset(self, abbrs: set) -> "Rosters":
+        """
+        A view of only these teams, sharing the Team and Player records
+        (the SUBSET_MEMO_SIZE most recently used views are memoized)
+        """
+        key = frozenset(abbrs)
+        with self._subsets_lock:
+            subset = self._subsets.get(key)
+            if subset is not None:
+                self._subsets.move_to_end(key)
+                return subset
+
+        subset = Rosters(
+            {abbr: team for abbr, team in self.teams.items() if abbr in key},
+            self.last_updated,
+        )
+
+        with self._subsets_lock:
+            self._subsets[key] = subset
+            while len(self._subsets) > SUBSET_MEMO_SIZE:
+                self._subsets.popitem(last=False)
+
+        return subset
+
+
+_memo = OrderedDict()  # {id(rows): (rows, model)}
+_memo_lock = threading.Lock()
+
+
+def get_model(rows: dict) -> Rosters:
+    """
+    Rosters model for cached rows, built once per rows object
+
+    Memoized on the identity of rows: with the in-memory cache every hit
+    returns the same model. (A disk-backed cache decodes a new rows object
+    per read, so the model is rebuilt per call there.)
+    """
+    key = id(rows)
+    with _memo_lock:
+        entry = _memo.get(key)
+        if entry is not None and entry[0] is rows:
+            _memo.move_to_end(key)
+            return entry[1]
+
+    model = Rosters.from_rows(rows)
+
+    with _memo_lock:
+        _memo[key] = (rows, model)
+        while len(_memo) > MODEL_MEMO_SIZE:
+            _memo.popitem(last=False)
+
+    return model
@@ -0,0 +1,233 @@
+"""
+Scoreboard parsing and rendering
+One parse of ESPN's scoreboard JSON into slotted Game records, shared by
+every view (get_nba_scores text, recommendation JSON, live change feed)
+
+Parsed slates are memoized per decoded response, so a cached scoreboard is
+parsed once no matter how many tools read it.
+"""
+
+import threading
+from collections import OrderedDict
+
+from .client import LIVE_STATUSES
+
+
+# Decoded scoreboards whose parsed games are kept (by identity)
+PARSE_MEMO_SIZE = 64
+
+
+class TeamLine:
+    """One side of a game"""
+
+    __slots__ = ("name", "abbreviation", "record", "score")
+
+    def __init__(self, name: str, abbreviation: str, record: str, score: int):
+        self.name = name
+        self.abbreviation = abbreviation
+        self.record = record
+        self.score = score
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "abbreviation": self.abbreviation,
+            "record": self.record,
+            "score": self.score,
+        }
+
+
+class Game:
+    """A parsed scoreboard event"""
+
+    __slots__ = (
+        "game_id",
+        "name",
+        "date",
+        "status_name",
+        "status_detail",
+        "completed",
+        "period",
+        "clock",
+        "away",
+        "home",
+        "venue",
+        "broadcasts",
+    )
+
+    def __init__(
+        self,
+        game_id: str,
+        name: str,
+        date: str,
+        status_name: str,
+        status_detail: str,
+        completed: bool,
+        period: int,
+        clock: str,
+        away: TeamLine,
+        home: TeamLine,
+        venue: str,
+        broadcasts: tuple,
+    ):
+        self.game_id = game_id
+        self.name = name
+        self.date = date
+        self.status_name = status_name
+        self.status_detail = status_detail
+        self.completed = completed
+        self.period = period
+        self.clock = clock
+        self.away = away
+        self.home = home
+        self.venue = venue
+        self.broadcasts = broadcasts
+
+    @property
+    def is_live(self) -> bool:
+        return self.status_name in LIVE_STATUSES
+
+    def involves(self, teams: set) -> bool:
+        return self.away.abbreviation in teams or self.home.abbreviation in teams
+
+    def status_text(self) -> str:
+        """Status line used by the JSON views, e.g. "LIVE - Q3 4:12" """
+        if self.status_name == "STATUS_IN_PROGRESS":
+            return f"LIVE - Q{self.period} {self.clock}"
+        if self.status_name == "STATUS_HALFTIME":
+            return "HALFTIME"
+        if self.completed:
+            return f"FINAL - {self.status_detail}"
+        return f"UPCOMING - {self.status_detail}"
+
+    def to_dict(self) -> dict:
+        """The game dict shape of get_nba_recommendation_data"""
+        return {
+            "game_id": self.game_id,
+            "game_name": self.name,
+            "game_date": self.date,
+            "status": self.status_text(),
+            "away_team": self.away.to_dict(),
+            "home_team": self.home.to_dict(),
+            "venue": self.venue,
+            "broadcast": list(self.broadcasts),
+        }
+
+
+def _team_line(competitor: dict) -> TeamLine:
+    team = competitor["team"]
+    records = competitor.get("records") or [{}]
+    return TeamLine(
+        team["displayName"],
+        team["abbreviation"],
+        records[0].get("summary", "0-0"),
+        int(competitor.get("score") or 0),
+    )
+
+
+def parse_event(event: dict) -> Game:
+    """Parse one scoreboard event"""
+    competition = event["competitions"][0]
+    status = competition["status"]
+    status_type = status["type"]
+
+    home = away = None
+    for competitor in competition["competitors"]:
+        if competitor["homeAway"] == "home":
+            home = _team_line(competitor)
+        else:
+            away = _team_line(competitor)
+
+    broadcasts = tuple(
+        name
+        for broadcast in competition.get("broadcasts", [])
+        for name in broadcast.get("names") or ()
+    )
+
+    return Game(
+        event["id"],
+        event["shortName"],
+        event["date"],
+        status_type["name"],
+        status_type.get("detail", ""),
+        status_type["completed"],
+        status.get("period", 0),
+        status.get("displayClock", ""),
+        away,
+        home,
+        competition.get("venue", {}).get("fullName", "N/A"),
+        broadcasts,
+    )
+
+
+_memo = OrderedDict()  # {id(data): (data, games)}
+_memo_lock = threading.Lock()
+
+
+def parse_scoreboard(data: dict) -> list:
+    """
+    Parse a decoded scoreboard response into Game records
+
+    The result is memoized on the identity of data (cached responses are
+    shared and never mutated), so treat the returned list as read-only.
+    """
+    key = id(data)
+    with _memo_lock:
+        entry = _memo.get(key)
+        if entry is not None and entry[0] is data:
+            _memo.move_to_end(key)
+            return entry[1]
+
+    games = [parse_event(event) for event in data.get("events", [])]
+
+    with _memo_lock:
+        _memo[key] = (data, games)
+        while len(_memo) > PARSE_MEMO_SIZE:
+            _memo.popitem(last=False)
+
+    return games
+
+
+def render_text(game: Game) -> str:
+    """Human-readable block for one game (get_nba_scores)"""
+    if game.status_name == "STATUS_IN_PROGRESS":
+        status_text = f"🔴 LIVE - Q{game.period} {game.clock}"
+    elif game.status_name == "STATUS_HALFTIME":
+        status_text = "⏸️  HALFTIME"
+    elif game.completed:
+        status_text = f"✅ FINAL - {game.status_detail}"
+    else:
+        status_text = f"⏰ UPCOMING - {game.status_detail}"
+
+    away, home = game.away, game.home
+
+    result = "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
+    result += f"**{game.name}** (ID: {game.game_id})\n"
+    result += f"📅 {game.date}\n"
+    result += f"**Status:** {status_text}\n\n"
+
+    result += f"**Away:** {away.name} ({away.record})"
+    if away.score > 0:
+        result += f" - {away.score}"
+    result += "\n"
+
+    result += f"**Home:** {home.name} ({home.record})"
+    if home.score > 0:
+        result += f" - {home.score}"
+    result += "\n"
+
+    if away.score > 0 or home.score > 0:
+        score_diff = abs(away.score - home.score)
+        if away.score > home.score:
+            result += f"**Current Leader:** {away.abbreviation} by {score_diff}\n"
+        elif home.score > away.score:
+            result += f"**Current Leader:** {home.abbreviation} by {score_diff}\n"
+        else:
+            result += "**Score:** Tied\n"
+
+    result += f"\n**Venue:** {game.venue}\n"
+
+    if game.broadcasts:
+        result += f"**Broadcast:** {', '.join(game.broadcasts)}\n"
+
+    return result + "\n"
@@ -1,24 +1,148 @@
 import asyncio
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from mcp.server import Server
-from mcp.types import Tool, TextContent
+from mcp.server.lowlevel.helper_types import ReadResourceContents
+from mcp.types import Resource, ResourceTemplate, Tool, TextContent
 from mcp.server.stdio import stdio_server
-from .tools import (
-    get_nba_scores,
-    get_nba_rosters,
-    get_nba_player_rankings,
-    get_nba_recommendation_data,
-)
+from . import metrics
+from .subscriptions import GAME_URI_PREFIX, SCOREBOARD_URI, SubscriptionHub, is_subscribable
 
 print("Starting sport-suggest-mcp server...", file=sys.stderr, flush=True)
 
-server = Server("sport-suggest-mcp")
+# Subscriptions of a session are dropped when it closes
+server = Server("sport-suggest-mcp", lifespan=lambda _: _subscriptions.session_scope())
+
+# Tools do blocking HTTP - run them on a bounded pool, off the event loop
+TOOL_WORKERS = int(os.environ.get("SPORT_SUGGEST_TOOL_WORKERS", 8))
+_tool_executor = ThreadPoolExecutor(
+    max_workers=TOOL_WORKERS, thread_name_prefix="sport-suggest-tool"
+)
+
+# List get_server_stats as a tool (the nba://stats resource is always there)
+STATS_TOOL = os.environ.get("SPORT_SUGGEST_STATS_TOOL", "0").lower() in ("1", "true", "yes")
+
+# Resource serving the same diagnostics as get_server_stats
+STATS_URI = "nba://stats"
+
+# Filter arguments shared by several tools
+TEAMS_PROPERTY = {
+    "type": "array",
+    "items": {"type": "string"},
+    "description": 'Team abbreviations to limit results to, e.g. ["LAL", "BOS"]',
+}
+DATE_PROPERTY = {
+    "type": "string",
+    "description": "Scoreboard date as YYYY-MM-DD (default: today)",
+}
+END_DATE_PROPERTY = {
+    "type": "string",
+    "description": "Last day (YYYY-MM-DD) of a range starting at date, up to 14 days",
+}
+STATUS_PROPERTY = {
+    "type": "string",
+    "enum": ["live", "upcoming", "final"],
+    "description": "Only live, only upcoming, or only completed (final) games",
+}
+TOP_N_PROPERTY = {
+    "type": "integer",
+    "minimum": 1,
+    "maximum": 50,
+    "description": "Only the top N ranked players",
+}
+
+# One shared scoreboard poll drives notifications for every subscription
+_subscriptions = SubscriptionHub(
+    lambda: _tools().get_scoreboard_poller(), executor=_tool_executor
+)
+
+
+def _tools():
+    """
+    The tools module, imported on first use
+
+    tools pulls in requests, the HTTP client and the parsers - none of which
+    initialize or tools/list need - so they load on the first tool call or
+    resource read instead of delaying the client's first reply. Only call
+    this from the tool pool: the first import blocks for tens of ms.
+    """
+    from . import tools
+
+    return tools
+
+
+def _call_tool(name: str, kwargs: dict) -> str:
+    """Call a function of the tools module by name (runs in the tool pool)"""
+    return getattr(_tools(), name)(**kwargs)
+
+
+async def _run_tool(name: str, **kwargs) -> str:
+    """
+    Run a synchronous tool in the tool pool without blocking the event loop
+
+    The tool is looked up by name on the worker thread, so the first call
+    imports the tools module there rather than on the event loop.
+    """
+    loop = asyncio.get_running_loop()
+    with metrics.span("tool", name) as span:
+        result = await loop.run_in_executor(
+            _tool_executor, partial(_call_tool, name, kwargs)
+        )
+        span.set(bytes=len(result.encode()))
+        return result
+
+
+def _progress_reporter():
+    """
+    Progress callback for the tool call being handled, or None if the client
+    sent no progressToken
+
+    The callback runs on a tool worker thread; each notification is handed
+    to the event loop without waiting for it to be sent.
+    """
+    try:
+        context = server.request_context
+    except LookupError:
+        return None
+
+    token = context.meta.progressToken if context.meta is not None else None
+    if token is None:
+        return None
+
+    loop = asyncio.get_running_loop()
+
+    def progress(stage: str, done: int, total: int, message: str):
+        future = asyncio.run_coroutine_threadsafe(
+            context.session.send_progress_notification(
+                token,
+                done,
+                total=total,
+                message=message,
+                related_request_id=str(context.request_id),
+            ),
+            loop,
+        )
+        future.add_done_callback(_log_progress_failure)
+
+    return progress
+
+
+def _log_progress_failure(future):
+    """Report a progress notification that could not be sent"""
+    if not future.cancelled() and future.exception() is not None:
+        print(
+            f"Progress notification failed: {future.exception()!r}",
+            file=sys.stderr,
+            flush=True,
+        )
 
 
 @server.list_tools()
 async def list_tools() -> list[Tool]:
     """Return available tools."""
-    return [
+    tools = [
         Tool(
             name="get_nba_recommendation_data",
             description="""Get comprehensive NBA data for making game recommendations.
@@ -26,19 +150,22 @@ async def list_tools() -> list[Tool]:
     Returns JSON containing:
     • games: All live/upcoming games with teams, records, scores, broadcast, venue
       - Each game now includes matchup_injuries with detailed injury reports for both teams
-    • player_rankings: Top 25 players ranked by ESPN Rating (higher = better)
+    • player_rankings: Top 50 players ranked by ESPN Rating (higher = better)
     • team_rosters: Complete rosters with injury status for each player
     
     CRITICAL - INJURY CHECK WORKFLOW:
-    1. Each game object contains a "matchup_injuries" field with current injury data
-    2. Check matchup_injuries to see which players are Out/Questionable for that specific game
-    3. Cross-reference with player_rankings to see if any top-25 stars are injured
+    1. Each game object contains a "summary" whose stars field already joins the
+       rankings with that game's injury reports
+    2. Check summary.stars.out and summary.stars.questionable to see which ranked stars
+       are missing or doubtful for that specific game
+    3. Use matchup_injuries for the details (injury type, return date, descriptions)
     4. Only recommend games where the star players are healthy
     
     **DO NOT recommend a game and then correct yourself. Check injuries FIRST.**
     
     Each injury in matchup_injuries includes:
     - player_name: Full name of injured player
+    - player_id: ESPN athlete id when the report has one (also "id" in player_rankings)
     - team: Team abbreviation
     - position: Player position
     - status: "Out", "Questionable", "Day-To-Day", etc.
@@ -49,9 +176,9 @@ async def list_tools() -> list[Tool]:
     
     Example workflow:
     - Game: LAL @ MIN
-    - Check matchup_injuries for this game
-    - See: Luka Doncic (LAL) - Status: "Out", Return: "2025-11-05"
-    - Cross-check: Luka is ranked #1 in player_rankings
+    - Check summary.stars.out for this game
+    - See: {"rank": 1, "name": "Luka Doncic", "team": "LAL", "status": "Out"}
+    - Details: matchup_injuries lists Luka's return date as "2025-11-05"
     - Result: Lakers missing their top star - consider a different game
     
     Additional factors for recommendations:
@@ -60,10 +187,124 @@ async def list_tools() -> list[Tool]:
     - Game timing: Consider user's time zone preferences
     
     The data is rich enough to support any recommendation style - star power, competitiveness, 
-    broadcast quality, or any combination the user requests.""",
+    broadcast quality, or any combination the user requests.
+    
+    The precomputed "summary" of every game - use it instead of cross-referencing
+    the lists yourself:
+    - stars.active / stars.questionable / stars.out: ranked players in this game by availability
+      (rank, name, team, and status when not active)
+    - active_stars, best_active_rank: quick star-power measures
+    - win_pct (away/home) and win_pct_gap: competitive balance (smaller gap = closer matchup)
+    - national_broadcast: true when on ESPN, ABC, TNT, NBA TV, etc.
+    
+    Set summary=true to get only the games with their summaries (by far the smallest payload).
+    
+    Set compact=true for a much smaller payload: only rosters for teams playing today,
+    no long injury descriptions, and roster injuries that matchup_injuries already covers
+    are not repeated. max_bytes / max_tokens cap the compact payload size; metadata.trimmed
+    lists any sections that were cut to fit.
+    
+    Narrow the query whenever possible - filters are applied server-side, so a single-team
+    question only fetches that game's rosters, injuries and ranked players:
+    - teams: games involving these teams (rosters/rankings cover both teams in those games)
+    - date: another day's slate (YYYY-MM-DD)
+    - end_date: with date, every game from date through end_date (e.g. a whole weekend)
+    - status: "live", "upcoming" or "final" (only completed games; a date alone includes them)
+    - top_n: only the top N ranked players
+    
+    The call answers within a deadline (a few seconds by default; set deadline to change
+    it). If ESPN is slow or failing, sections that were not ready or could not be fetched
+    are served from older data or left empty, and metadata.degraded names them ("stale"
+    or "missing") - mention this to the user if it affects the recommendation.
+    
+    Clients that send a progressToken get a progress notification as each stage finishes
+    (games, matchup_injuries, player_rankings, team_rosters); the games notification
+    already lists the matching games.""",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "teams": TEAMS_PROPERTY,
+                    "date": DATE_PROPERTY,
+                    "end_date": END_DATE_PROPERTY,
+                    "status": STATUS_PROPERTY,
+                    "top_n": TOP_N_PROPERTY,
+                    "compact": {
+                        "type": "boolean",
+                        "description": "Return the compact payload (recommended)",
+                    },
+                    "summary": {
+                        "type": "boolean",
+                        "description": "Return only games with their precomputed summaries",
+                    },
+                    "max_bytes": {
+                        "type": "integer",
+                        "description": "Byte budget for the compact payload",
+                    },
+                    "max_tokens": {
+                        "type": "integer",
+                        "description": "Approximate token budget for the compact payload",
+                    },
+                    "deadline": {
+                        "type": "number",
+                        "exclusiveMinimum": 0,
+                        "description": "Seconds to wait at most before returning partial data",
+                    },
+                },
+                "required": [],
+            },
+        ),
+        Tool(
+            name="get_nba_score_updates",
+            description="""Get only what changed in live NBA games since your last call.
+            
+            Use this to follow games in progress instead of re-fetching everything. The
+            first call (no cursor) returns every game on today's scoreboard; pass the
+            returned cursor on the next call to get only the games whose score, period,
+            clock or status changed since then.
+            
+            Returns compact JSON: cursor, full (true when every game is included),
+            games (game_id, game_name, status, period, clock, away/home team and score),
+            removed (ids of games no longer on the scoreboard) and unchanged (how many
+            games were left out).""",
             inputSchema={
                 "type": "object",
-                "properties": {},
+                "properties": {
+                    "cursor": {
+                        "type": "string",
+                        "description": "Cursor returned by the previous call",
+                    },
+                    "teams": TEAMS_PROPERTY,
+                },
+                "required": [],
+            },
+        ),
+        Tool(
+            name="get_nba_scores",
+            description="""Get NBA scores and schedules as plain text.
+
+            Returns each matching game with teams, records, score or start time, status,
+            venue and broadcast - no rosters, rankings or injuries. Without filters, today's
+            live and upcoming games; with a date, every game on it, completed ones included.
+
+            Use this when:
+            - User asks for scores or results ("How did the Celtics do last night?")
+            - User asks what is on ("Which games are on this weekend?")
+
+            Filters are applied server-side:
+            - teams: only games involving these teams
+            - date: another day's slate (YYYY-MM-DD), e.g. yesterday for last night's results
+            - end_date: with date, every game from date through end_date (e.g. a whole weekend)
+            - status: "live", "upcoming" or "final" to keep only those games
+
+            For recommendations, use get_nba_recommendation_data() instead - it includes games plus everything else!""",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "teams": TEAMS_PROPERTY,
+                    "date": DATE_PROPERTY,
+                    "end_date": END_DATE_PROPERTY,
+                    "status": STATUS_PROPERTY,
+                },
                 "required": [],
             },
         ),
@@ -78,10 +319,12 @@ async def list_tools() -> list[Tool]:
             - User asks about a specific player's team ("Is LeBron on the Lakers?")
             - User asks about injuries ("Who's injured on the Lakers?")
             
+            Pass teams to fetch only those rosters.
+            
             For recommendations, use get_nba_recommendation_data() instead - it includes rosters plus everything else!""",
             inputSchema={
                 "type": "object",
-                "properties": {},
+                "properties": {"teams": TEAMS_PROPERTY},
                 "required": [],
             },
         ),
@@ -98,33 +341,155 @@ async def list_tools() -> list[Tool]:
             - User asks specifically about player rankings ("Who are the best players this season?")
             - User wants to know how a specific player ranks
             
+            Pass top_n and/or teams to limit the list (league rank is kept).
+            
             For recommendations, use get_nba_recommendation_data() instead - it includes rankings plus everything else!""",
             inputSchema={
                 "type": "object",
-                "properties": {},
+                "properties": {"teams": TEAMS_PROPERTY, "top_n": TOP_N_PROPERTY},
                 "required": [],
             },
         ),
     ]
 
+    if STATS_TOOL:
+        tools.append(
+            Tool(
+                name="get_server_stats",
+                description="Server diagnostics: latency histograms per tool and per ESPN "
+                "endpoint (status, cache hit/miss, bytes), cache, connection and "
+                "subscription counters. Not needed for recommendations.",
+                inputSchema={"type": "object", "properties": {}, "required": []},
+            )
+        )
+
+    return tools
+
+
+@server.list_resources()
+async def list_resources() -> list[Resource]:
+    """Return available resources."""
+    return [
+        Resource(
+            uri=SCOREBOARD_URI,
+            name="NBA scoreboard",
+            description="Live state of today's NBA games (status, period, clock, scores). "
+            "Subscribe to be notified whenever any game changes.",
+            mimeType="application/json",
+        ),
+        Resource(
+            uri=STATS_URI,
+            name="Server stats",
+            description="Latency histograms per tool and per ESPN endpoint, plus cache, "
+            "connection and subscription counters.",
+            mimeType="application/json",
+        ),
+    ]
+
+
+@server.list_resource_templates()
+async def list_resource_templates() -> list[ResourceTemplate]:
+    """Return available resource templates."""
+    return [
+        ResourceTemplate(
+            uriTemplate=f"{GAME_URI_PREFIX}{{game_id}}",
+            name="NBA game",
+            description="Live state of one of today's NBA games. "
+            "Subscribe to be notified when its score, period, clock or status changes.",
+            mimeType="application/json",
+        )
+    ]
+
+
+@server.read_resource()
+async def read_resource(uri) -> list[ReadResourceContents]:
+    """Read a resource."""
+    uri = str(uri)
+    if uri == SCOREBOARD_URI:
+        text = await _run_tool("get_nba_live_state")
+    elif uri == STATS_URI:
+        text = await _run_tool("get_server_stats", subscriptions=_subscriptions.stats())
+    elif uri.startswith(GAME_URI_PREFIX):
+        text = await _run_tool("get_nba_live_state", game_id=uri[len(GAME_URI_PREFIX) :])
+    else:
+        raise ValueError(f"Unknown resource: {uri}")
+    return [ReadResourceContents(content=text, mime_type="application/json")]
+
+
+@server.subscribe_resource()
+async def subscribe_resource(uri):
+    """Subscribe the calling session to resource updates."""
+    uri = str(uri)
+    if not is_subscribable(uri):
+        raise ValueError(f"Resource does not support subscriptions: {uri}")
+    if uri.startswith(GAME_URI_PREFIX):
+        # Raises ValueError if the game is not on today's scoreboard
+        await _run_tool("get_nba_live_state", game_id=uri[len(GAME_URI_PREFIX) :])
+
+    context = server.request_context
+    _subscriptions.subscribe(uri, context.session)
+    context.lifespan_context.add(context.session)
+
+
+@server.unsubscribe_resource()
+async def unsubscribe_resource(uri):
+    """Unsubscribe the calling session from resource updates."""
+    _subscriptions.unsubscribe(str(uri), server.request_context.session)
+
 
 @server.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     """Call a tool."""
+    arguments = arguments or {}
     if name == "get_nba_recommendation_data":
-        result = get_nba_recommendation_data()
+        result = await _run_tool(
+            "get_nba_recommendation_data",
+            compact=bool(arguments.get("compact", False)),
+            summary=bool(arguments.get("summary", False)),
+            max_bytes=arguments.get("max_bytes"),
+            max_tokens=arguments.get("max_tokens"),
+            teams=arguments.get("teams"),
+            date=arguments.get("date"),
+            status=arguments.get("status"),
+            top_n=arguments.get("top_n"),
+            end_date=arguments.get("end_date"),
+            deadline=arguments.get("deadline"),
+            progress=_progress_reporter(),
+        )
         return [TextContent(type="text", text=result)]
 
     elif name == "get_nba_scores":
-        result = get_nba_scores()
+        result = await _run_tool(
+            "get_nba_scores",
+            teams=arguments.get("teams"),
+            date=arguments.get("date"),
+            status=arguments.get("status"),
+            end_date=arguments.get("end_date"),
+        )
+        return [TextContent(type="text", text=result)]
+
+    elif name == "get_nba_score_updates":
+        result = await _run_tool(
+            "get_nba_score_updates",
+            cursor=arguments.get("cursor"),
+            teams=arguments.get("teams"),
+        )
         return [TextContent(type="text", text=result)]
 
     elif name == "get_nba_rosters":
-        result = get_nba_rosters()
+        result = await _run_tool("get_nba_rosters", teams=arguments.get("teams"))
         return [TextContent(type="text", text=result)]
 
     elif name == "get_nba_player_rankings":
-        result = get_nba_player_rankings()
+        result = await _run_tool(
+            "get_nba_player_rankings",
+            top_n=arguments.get("top_n"),
+            teams=arguments.get("teams"),
+        )
+        return [TextContent(type="text", text=result)]
+
+    elif name == "get_server_stats":
+        result = await _run_tool("get_server_stats", subscriptions=_subscriptions.stats())
         return [TextContent(type="text", text=result)]
 
     raise ValueError(f"Unknown tool: {name}")
@@ -132,10 +497,12 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
 
 async def async_main():
     """Async main function"""
+    options = server.create_initialization_options()
+    # The low-level server never advertises subscribe support on its own
+    options.capabilities.resources.subscribe = True
+
     async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream, write_stream, server.create_initialization_options()
-        )
+        await server.run(read_stream, write_stream, options)
 
 
 def main():
@@ -0,0 +1,60 @@
+"""
+Single-flight call coalescing
+Concurrent calls for the same key share one execution and its result
+
+Used by the HTTP client (keyed by URL) and the cache (keyed by cache key),
+so simultaneous tool calls that need the same upstream data or the same
+derived entry trigger one fetch instead of one each.
+"""
+
+import threading
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    """
+    Run fn() once per key at a time; callers arriving while it runs wait
+    for that run and get its result (or exception) instead of starting
+    their own
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}  # {key: Future of the in-flight call}
+        self._stats = {"calls": 0, "coalesced": 0}
+
+    def do(self, key, fn):
+        """
+        Call fn(), or join an in-flight call for the same key
+
+        Results are shared between all callers of one flight, so they must
+        not be mutated.
+        """
+        with self._lock:
+            self._stats["calls"] += 1
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    def stats(self) -> dict:
+        """calls (total do() calls) and coalesced (calls that joined another)"""
+        with self._lock:
+            return dict(self._stats)
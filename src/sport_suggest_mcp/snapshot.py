@@ -0,0 +1,166 @@
+"""
+Persistent on-disk snapshot of derived data (rosters, rankings, lookups)
+Lets a freshly started server answer its first call without going upstream
+
+Snapshots live in a small SQLite file. The path comes from
+$SPORT_SUGGEST_SNAPSHOT_PATH (set it to an empty string to disable) and
+defaults to $XDG_CACHE_HOME/sport-suggest-mcp/snapshot.sqlite3. Nothing is
+read until a key is first requested.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from .cache import MISSING, get_cache
+
+
+def _default_path() -> str:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "sport-suggest-mcp", "snapshot.sqlite3")
+
+
+SNAPSHOT_PATH = os.environ.get("SPORT_SUGGEST_SNAPSHOT_PATH", _default_path())
+
+_conn = None
+_lock = threading.Lock()
+
+# Keys already seeded into the cache from disk in this process
+_seeded = set()
+
+
+def _connect():
+    """Open the snapshot database on first use; None if disabled or unusable"""
+    global _conn
+
+    if _conn is None and SNAPSHOT_PATH:
+        try:
+            directory = os.path.dirname(SNAPSHOT_PATH)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(SNAPSHOT_PATH, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS snapshots ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " saved_at REAL NOT NULL)"
+            )
+            conn.commit()
+            _conn = conn
+        except (OSError, sqlite3.Error):
+            return None
+
+    return _conn
+
+
+def load(key: str, max_age: float = None):
+    """
+    Read a snapshot
+
+    Args:
+        key: Snapshot key
+        max_age: Ignore snapshots older than this many seconds
+
+    Returns:
+        (value, saved_at) tuple, or None if missing, too old or disabled
+    """
+    with _lock:
+        conn = _connect()
+        if conn is None:
+            return None
+
+        try:
+            row = conn.execute(
+                "SELECT value, saved_at FROM snapshots WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+
+    if row is None:
+        return None
+
+    value, saved_at = row
+    if max_age is not None and time.time() - saved_at > max_age:
+        return None
+
+    return json.loads(value), saved_at
+
+
+def save(key: str, value):
+    """Write a snapshot (silently skipped if snapshots are disabled)"""
+    payload = json.dumps(value)
+
+    with _lock:
+        conn = _connect()
+        if conn is None:
+            return
+
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?)",
+                (key, payload, time.time()),
+            )
+            conn.commit()
+        except sqlite3.Error:
+            pass
+
+
+def get_or_load(key: str, loader, ttl, stale_ttl: float = 0, save_if=None):
+    """
+    Shared-cache get_or_load backed by the on-disk snapshot
+
+    The first request for a key in this process seeds the cache from disk
+    (keeping the snapshot's original age, so TTL and stale-while-revalidate
+    behave as if it had never left memory). Every value loader() produces
+    is written back to disk, unless save_if(value) is false.
+
+    ttl may be a callable of the value, as for TTLCache.set.
+    """
+    cache = get_cache()
+    _seed(key, ttl, stale_ttl)
+
+    def load_and_save():
+        value = loader()
+        if value is not None and (save_if is None or save_if(value)):
+            save(key, value)
+        return value
+
+    return cache.get_or_load(key, load_and_save, ttl=ttl, stale_ttl=stale_ttl)
+
+
+def has(key: str, ttl, stale_ttl: float = 0) -> bool:
+    """
+    True if get_or_load(key, ...) would be answered without calling its
+    loader in the foreground: the cache holds key, fresh or inside its stale
+    window, once seeded from disk. ttl and stale_ttl as for get_or_load.
+    """
+    _seed(key, ttl, stale_ttl)
+    return get_cache().peek(key) is not MISSING
+
+
+def _seed(key: str, ttl, stale_ttl: float):
+    """Seed the cache with key's snapshot, once per process"""
+    if key in _seeded:
+        return
+    _seeded.add(key)
+
+    max_age = None if callable(ttl) else ttl + stale_ttl
+    snapshot = load(key, max_age=max_age)
+    if snapshot is not None:
+        value, saved_at = snapshot
+        get_cache().set(key, value, ttl, stale_ttl, stored_at=saved_at)
+
+
+def close():
+    """Close the snapshot database (reopened on next use)"""
+    global _conn
+
+    with _lock:
+        if _conn is not None:
+            _conn.close()
+        _conn = None
+        _seeded.clear()
@@ -0,0 +1,148 @@
+"""
+Resource subscriptions for live scoreboard updates
+One background poll loop drives resources/updated notifications for every subscriber
+
+Clients subscribe to nba://scoreboard or nba://game/{game_id}. While at
+least one subscription exists, a single task polls the shared
+live.ScoreboardPoller (one upstream request per interval no matter how many
+sessions or games are watched) and notifies each subscriber whose resource
+changed. The task stops when the last subscription goes away - including
+when a session closes without unsubscribing (see session_scope).
+
+live (and with it the HTTP client) is imported when the first poll loop
+starts, so importing this module stays cheap for server startup.
+"""
+
+import asyncio
+import sys
+from contextlib import asynccontextmanager
+
+
+SCOREBOARD_URI = "nba://scoreboard"
+GAME_URI_PREFIX = "nba://game/"
+
+
+def game_uri(game_id: str) -> str:
+    return f"{GAME_URI_PREFIX}{game_id}"
+
+
+def is_subscribable(uri: str) -> bool:
+    """True for nba://scoreboard and nba://game/{game_id} URIs"""
+    return uri == SCOREBOARD_URI or (
+        uri.startswith(GAME_URI_PREFIX) and len(uri) > len(GAME_URI_PREFIX)
+    )
+
+
+class SubscriptionHub:
+    """
+    Tracks {uri: sessions} subscriptions and runs the shared poll loop
+
+    Args:
+        get_poller: Returns the ScoreboardPoller to drive (looked up on
+            every poll, so the scoreboard URL can change at runtime)
+        executor: Executor the blocking poll runs on
+        interval: Seconds between polls (default live.MIN_POLL_INTERVAL)
+    """
+
+    def __init__(self, get_poller, executor=None, interval: float = None):
+        self.get_poller = get_poller
+        self.executor = executor
+        self.interval = interval
+
+        self._subscribers = {}  # {uri: set of sessions}
+        self._task = None
+        self._stats = {"polls": 0, "poll_errors": 0, "notifications": 0}
+
+    def subscribe(self, uri: str, session):
+        """
+        Raises:
+            ValueError if uri is not a subscribable resource
+        """
+        if not is_subscribable(uri):
+            raise ValueError(f"Resource does not support subscriptions: {uri}")
+
+        self._subscribers.setdefault(uri, set()).add(session)
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def unsubscribe(self, uri: str, session):
+        sessions = self._subscribers.get(uri)
+        if sessions is not None:
+            sessions.discard(session)
+            if not sessions:
+                del self._subscribers[uri]
+
+        if not self._subscribers and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def drop_session(self, session):
+        """Remove every subscription of a session"""
+        for uri in list(self._subscribers):
+            self.unsubscribe(uri, session)
+
+    @asynccontextmanager
+    async def session_scope(self):
+        """
+        Wraps one session's lifetime (e.g. as the low-level Server's
+        lifespan): yields a set to add subscribing sessions to, whose
+        subscriptions are dropped when the scope exits
+        """
+        sessions = set()
+        try:
+            yield sessions
+        finally:
+            for session in sessions:
+                self.drop_session(session)
+
+    def subscriber_count(self) -> int:
+        return sum(len(sessions) for sessions in self._subscribers.values())
+
+    def stats(self) -> dict:
+        """Poll loop counters plus current subscriptions"""
+        return {**self._stats, "subscriptions": self.subscriber_count()}
+
+    async def _run(self):
+        """Poll until the last subscription is gone"""
+        loop = asyncio.get_running_loop()
+
+        # The first lookup may import the HTTP client - keep it off the loop
+        poller = await loop.run_in_executor(self.executor, self.get_poller)
+        cursor = poller.cursor
+
+        from . import live
+
+        if self.interval is None:
+            self.interval = live.MIN_POLL_INTERVAL
+
+        while self._subscribers:
+            poller = self.get_poller()
+            try:
+                await loop.run_in_executor(self.executor, poller.poll)
+                self._stats["polls"] += 1
+            except Exception as e:
+                self._stats["poll_errors"] += 1
+                print(f"Scoreboard poll failed: {e}", file=sys.stderr, flush=True)
+            else:
+                changes = poller.changes_since(cursor)
+                cursor = changes["cursor"]
+                await self._notify(changes)
+
+            await asyncio.sleep(self.interval)
+
+    async def _notify(self, changes: dict):
+        """Send resources/updated to subscribers of everything in changes"""
+        changed_ids = [game["game_id"] for game in changes["games"]]
+        changed_ids += changes["removed"]
+        if not changed_ids:
+            return
+
+        uris = [SCOREBOARD_URI] + [game_uri(game_id) for game_id in changed_ids]
+        for uri in uris:
+            for session in list(self._subscribers.get(uri, ())):
+                try:
+                    await session.send_resource_updated(uri)
+                    self._stats["notifications"] += 1
+                except Exception:
+                    # The session has gone away - drop all its subscriptions
+                    self.drop_session(session)
@@ -5,630 +5,1066 @@ Simple data provider - let the LLM do the intelligence!
 
 import requests
 import json
+import os
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime, timedelta
 
+from . import live, metrics, snapshot
+from .cache import MISSING, get_cache
+from .client import (
+    ENDPOINT_TTLS,
+    LIVE_STATUSES,
+    SCOREBOARD_FIELDS,
+    get_breaker_stats,
+    get_coalescing_stats,
+    get_connection_stats,
+    get_json,
+    get_json_many,
+    get_rate_limit_stats,
+)
+from .matchups import summarize_games
+from .rosters import ROSTER_EMPTY, ROSTER_OK, ROSTER_UNAVAILABLE, Rosters, get_model
+from .scoreboard import parse_scoreboard, render_text
 
-# Global roster cache
-ROSTER_CACHE = {
-    "nba_display": None,
-    "nba_dict": None,
-    "nba_injuries": None,
-    "last_updated": None,
-}
 
+SITE_API_BASE = "https://site.api.espn.com/apis/site/v2/sports/basketball/nba"
+CORE_API_BASE = "http://sports.core.api.espn.com/v2/sports/basketball/leagues/nba"
 
-def get_nba_player_rankings() -> str:
+# All 30 rosters are requested in a single concurrent round
+ROSTER_MAX_IN_FLIGHT = 30
+
+# Teams packed into one injuries request (?team=A&team=B&...)
+INJURY_BATCH_SIZE = 30
+
+# Rough bytes per LLM token for compact payload token budgets
+BYTES_PER_TOKEN = 4
+
+# Parsed rosters are cached as one entry, refreshed every 24 hours
+ROSTER_CACHE_KEY = "nba:rosters:v3"
+ROSTER_TTL = 24 * 60 * 60
+
+# Resolved rankings are cached as one entry, refreshed every hour
+RANKINGS_CACHE_KEY = "nba:rankings:v2"
+RANKINGS_TTL = 60 * 60
+
+# Rankings with a leader whose athlete or team lookup failed are kept only
+# this long (and never written to the snapshot), so the misses are retried
+# soon - successful lookups stay in the HTTP cache and are not refetched
+RANKINGS_RETRY_TTL = 60
+
+# Leaderboard depth resolved for rankings
+RANKINGS_LIMIT = 50
+
+# Accepted values for the status filter ("final" includes completed games)
+GAME_STATUS_FILTERS = ("live", "upcoming", "final")
+
+# Longest date range a single schedule lookup may cover
+MAX_SCHEDULE_DAYS = 14
+
+# Per-day scoreboard cache TTLs: a past day whose games have all finished
+# never changes again; future days only move on reschedules
+FINAL_DAY_TTL = 365 * 24 * 60 * 60
+FUTURE_DAY_TTL = 10 * 60
+
+# How long an expired roster/rankings entry is still served while a
+# background refresh replaces it
+STALE_TTL = 7 * 24 * 60 * 60
+
+# Default overall time budget (seconds) of get_nba_recommendation_data -
+# sections not ready by then are served stale or marked missing (0: no limit)
+RECOMMENDATION_DEADLINE = float(os.environ.get("SPORT_SUGGEST_DEADLINE", 8))
+
+# Recommendation sections (games, rankings, rosters, injuries) are fetched
+# concurrently here; a section that misses its deadline keeps running and
+# fills the cache for the next call
+SECTION_WORKERS = int(os.environ.get("SPORT_SUGGEST_SECTION_WORKERS", 16))
+_section_executor = ThreadPoolExecutor(
+    max_workers=SECTION_WORKERS, thread_name_prefix="sport-suggest-section"
+)
+
+# _wait_for result of a section that missed the deadline
+LATE = object()
+
+# _wait_for result of a section whose fetch failed
+FAILED = object()
+
+# Stages reported to get_nba_recommendation_data's progress callback
+PROGRESS_STAGES = ("games", "matchup_injuries", "player_rankings", "team_rosters")
+
+# Games listed by name in the "games" progress message
+PROGRESS_GAMES_LISTED = 15
+
+
+def get_nba_player_rankings(top_n: int = None, teams=None) -> str:
     """
     Get top NBA players ranked by ESPN Rating
 
+    Args:
+        top_n: Only the top N players (default: top 50)
+        teams: Only players on these team abbreviations (league rank is kept)
+
     Returns:
         Formatted string with top 50 players and their ESPN ratings
     """
-    url = "http://sports.core.api.espn.com/v2/sports/basketball/leagues/nba/seasons/2026/types/2/leaders"
+    teams = _normalize_teams(teams)
 
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        leaders = _get_rankings(top_n, teams)
     except requests.exceptions.RequestException as e:
         return f"Error fetching NBA player rankings: {e}"
 
-    # Find NBA Rating category dynamically
-    categories = data.get("categories", [])
-    nba_rating_category = None
-
-    for category in categories:
-        if category.get("name") == "NBARating":
-            nba_rating_category = category
-            break
-
-    if not nba_rating_category:
+    if leaders is None:
         return "Error: NBA Rating category not found in API response"
 
-    leaders = nba_rating_category.get("leaders", [])[:50]  # Top 50
-
     result = "NBA Player Rankings (ESPN Rating):\n\n"
-    result += "Top 50 Players:\n"
+    result += f"Top {top_n or RANKINGS_LIMIT} Players"
+    if teams:
+        result += f" ({', '.join(sorted(teams))})"
+    result += ":\n"
 
-    for idx, leader in enumerate(leaders, 1):
-        rating = leader.get("value", 0)
-        athlete_ref = leader.get("athlete", {}).get("$ref")
-
-        # Fetch player details
-        try:
-            player_resp = requests.get(athlete_ref, timeout=5)
-            player_resp.raise_for_status()
-            player_data = player_resp.json()
-
-            full_name = player_data.get("fullName", "Unknown")
-            team_ref = player_data.get("team", {}).get("$ref")
-
-            # Get team abbreviation
-            team_abbr = "FA"
-            if team_ref:
-                try:
-                    team_resp = requests.get(team_ref, timeout=3)
-                    team_resp.raise_for_status()
-                    team_data = team_resp.json()
-                    team_abbr = team_data.get("abbreviation", "FA")
-                except:
-                    pass
-
-            result += f"{idx}. {full_name} ({team_abbr}) - Rating: {rating:.1f}\n"
-
-        except requests.exceptions.RequestException:
+    for idx, rating, full_name, team_abbr, _ in leaders:
+        if full_name is None:
             result += f"{idx}. Unknown Player - Rating: {rating:.1f}\n"
+        else:
+            result += f"{idx}. {full_name} ({team_abbr or 'FA'}) - Rating: {rating:.1f}\n"
 
     return result
 
 
-def get_nba_rosters() -> str:
+def get_nba_rosters(teams=None) -> str:
     """
     Get current rosters for all NBA teams (cached, refreshes every 24 hours)
 
+    Args:
+        teams: Only these team abbreviations - other rosters are not fetched
+
     Returns:
         Formatted string with all NBA team rosters
     """
-    now = datetime.now()
+    teams = _normalize_teams(teams)
 
-    # Check if cache needs refresh
-    if (
-        ROSTER_CACHE["nba_display"] is None
-        or ROSTER_CACHE["last_updated"] is None
-        or now - ROSTER_CACHE["last_updated"] > timedelta(hours=24)
-    ):
+    try:
+        rosters = _get_rosters(teams)
+    except requests.exceptions.RequestException as e:
+        return f"Error fetching NBA teams: {e}"
 
-        url = "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/teams"
+    if rosters is None or not rosters.teams:
+        return "No NBA teams found."
 
-        try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-        except requests.exceptions.RequestException as e:
-            return f"Error fetching NBA teams: {e}"
-
-        teams = data.get("sports", [{}])[0].get("leagues", [{}])[0].get("teams", [])
-
-        if not teams:
-            return "No NBA teams found."
-
-        result = "NBA Team Rosters:\n\n"
-        roster_dict = {}
-        injury_dict = {}
-
-        for team_data in teams:
-            team = team_data.get("team", {})
-            team_name = team.get("displayName", "Unknown Team")
-            team_abbr = team.get("abbreviation", "???")
-            team_id = team.get("id")
-
-            roster_url = f"https://site.api.espn.com/apis/site/v2/sports/basketball/nba/teams/{team_id}/roster"
-
-            try:
-                roster_response = requests.get(roster_url, timeout=5)
-                roster_response.raise_for_status()
-                roster_data = roster_response.json()
-            except requests.exceptions.RequestException:
-                result += f"**{team_name} ({team_abbr})** - Roster unavailable\n\n"
-                roster_dict[team_abbr] = []
-                injury_dict[team_abbr] = []
-                continue
+    return "NBA Team Rosters:\n\n" + "".join(team.display() for team in rosters.teams.values())
 
-            athletes = roster_data.get("athletes", [])
 
-            if not athletes:
-                result += f"**{team_name} ({team_abbr})** - No roster data\n\n"
-                roster_dict[team_abbr] = []
-                injury_dict[team_abbr] = []
-                continue
+def get_nba_scores(
+    teams=None, date: str = None, status: str = None, end_date: str = None
+) -> str:
+    """
+    Get current NBA scores and upcoming games - RAW DATA ONLY
+
+    Args:
+        teams: Only games involving these team abbreviations
+        date: Scoreboard date (YYYY-MM-DD or YYYYMMDD, default today) -
+            completed games on it are included unless status is given
+        status: "live", "upcoming" or "final" to keep only those games
+        end_date: Last day of a date range starting at date (at most
+            MAX_SCHEDULE_DAYS days)
+
+    Returns:
+        Formatted string with game information (no calculated metrics)
+    """
+    try:
+        teams = _normalize_teams(teams)
+        date, end_date = _normalize_date_range(date, end_date)
+        status = _normalize_status(status)
+    except ValueError as e:
+        return f"Error: {e}"
 
-            result += f"**{team_name} ({team_abbr})**\n"
+    try:
+        active_games = _fetch_active_games(date, teams, status, end_date)
+    except requests.exceptions.RequestException as e:
+        return f"Error fetching NBA scores: {e}"
+
+    if not active_games:
+        if teams or date or status:
+            return "No NBA games found matching the filters."
+        return "No live or upcoming NBA games found for today."
+
+    if status == "final":
+        result = f"Found {len(active_games)} completed NBA game(s):\n\n"
+    elif date and status is None:
+        result = f"Found {len(active_games)} NBA game(s):\n\n"
+    else:
+        result = f"Found {len(active_games)} live/upcoming NBA game(s):\n\n"
+
+    return result + "".join(render_text(game) for game in active_games)
 
-            players = []
-            player_names = []
-            injured_players = []
 
-            for athlete in athletes:
-                full_name = athlete.get("fullName", "Unknown")
-                jersey = athlete.get("jersey", "")
-                position = athlete.get("position", {}).get("abbreviation", "")
+def get_nba_score_updates(cursor: str = None, teams=None) -> str:
+    """
+    Get only the games whose score, period, clock or status changed since
+    a previous call - for cheap repeated polling during live games
+
+    Args:
+        cursor: The cursor returned by the previous call (omit on the first
+            call to get every game)
+        teams: Only games involving these team abbreviations
+
+    Returns:
+        Compact JSON with "cursor", "full", "games", "removed" and "unchanged"
+        (see live.ScoreboardPoller.changes_since)
+    """
+    teams = _normalize_teams(teams)
+    poller = get_scoreboard_poller()
 
-                # Check injury status
-                injuries = athlete.get("injuries", [])
-                is_injured = len(injuries) > 0
-                injury_status = injuries[0].get("status", "Out") if is_injured else None
+    try:
+        poller.poll()
+    except requests.exceptions.RequestException as e:
+        return f"Error fetching NBA scores: {e}"
 
-                player_names.append(full_name)
+    changes = poller.changes_since(cursor, teams)
+    return json.dumps(changes, separators=(",", ":"))
 
-                # Track injured players
-                if is_injured:
-                    injured_players.append({"name": full_name, "status": injury_status})
 
-                player_str = ""
-                if jersey:
-                    player_str += f"#{jersey} "
-                player_str += full_name
-                if position:
-                    player_str += f" ({position})"
-                if is_injured:
-                    player_str += f" - {injury_status}"
+def get_nba_live_state(game_id: str = None) -> str:
+    """
+    Get the current state of today's games (backs the nba:// resources)
 
-                players.append(player_str)
+    Args:
+        game_id: Only this game
 
-            roster_dict[team_abbr] = player_names
-            injury_dict[team_abbr] = injured_players
+    Returns:
+        Compact JSON with "cursor" and "games" (or "game" for one game) in
+        the get_nba_score_updates game format
 
-            if players:
-                result += f"  Players: {', '.join(players[:12])}"
-                if len(players) > 12:
-                    result += f" ... and {len(players) - 12} more"
-                result += "\n"
+    Raises:
+        requests.exceptions.RequestException if the scoreboard fails
+        ValueError if game_id is not on today's scoreboard
+    """
+    poller = get_scoreboard_poller()
+    poller.poll()
+    state = poller.changes_since(None)
 
-            result += "\n"
+    if game_id is None:
+        data = {"cursor": state["cursor"], "games": state["games"]}
+    else:
+        game = next((g for g in state["games"] if g["game_id"] == game_id), None)
+        if game is None:
+            raise ValueError(f"Game {game_id} is not on today's scoreboard")
+        data = {"cursor": state["cursor"], "game": game}
 
-        ROSTER_CACHE["nba_display"] = result
-        ROSTER_CACHE["nba_dict"] = roster_dict
-        ROSTER_CACHE["nba_injuries"] = injury_dict
-        ROSTER_CACHE["last_updated"] = now
+    return json.dumps(data, separators=(",", ":"))
 
-        return result
 
-    return ROSTER_CACHE["nba_display"]
+def get_scoreboard_poller() -> live.ScoreboardPoller:
+    """Shared change-feed poller for today's scoreboard"""
+    return live.get_poller(f"{SITE_API_BASE}/scoreboard")
 
 
-def get_nba_scores() -> str:
+def get_server_stats(**extra) -> str:
     """
-    Get current NBA scores and upcoming games - RAW DATA ONLY
+    Get the server's instrumentation and cache counters
+
+    Args:
+        **extra: Additional sections to include (e.g. subscription stats
+            owned by the server)
 
     Returns:
-        Formatted string with game information (no calculated metrics)
+        JSON with "spans" (per-tool and per-endpoint latency histograms and
+        status/cache/error counts, see metrics.snapshot), "cache",
+        "connections", "coalescing", "circuit_breakers", "rate_limit" and
+        "scoreboard_poller"
     """
-    url = "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard"
+    stats = {
+        "metrics_enabled": metrics.ENABLED,
+        "spans": metrics.snapshot(),
+        "cache": get_cache().stats(),
+        "connections": get_connection_stats(),
+        "coalescing": get_coalescing_stats(),
+        "circuit_breakers": get_breaker_stats(),
+        "rate_limit": get_rate_limit_stats(),
+        "scoreboard_poller": get_scoreboard_poller().stats(),
+        **extra,
+    }
+    return json.dumps(stats, indent=2)
 
-    try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-    except requests.exceptions.RequestException as e:
-        return f"Error fetching NBA scores: {e}"
 
-    events = data.get("events", [])
+# ============================================================================
+# INTERNAL HELPER FUNCTIONS (not exposed as tools)
+# ============================================================================
 
-    # Filter out completed games
-    active_events = [
-        event
-        for event in events
-        if not event["competitions"][0]["status"]["type"]["completed"]
-    ]
 
-    if not active_events:
-        return "No live or upcoming NBA games found for today."
+def _normalize_teams(teams):
+    """
+    Internal helper: Team filter as a set of upper-case abbreviations
+    Accepts a list or a comma-separated string; None/empty means no filter
+    """
+    if not teams:
+        return None
+    if isinstance(teams, str):
+        teams = teams.split(",")
+    return {team.strip().upper() for team in teams if team.strip()} or None
 
-    result = f"Found {len(active_events)} live/upcoming NBA game(s):\n\n"
 
-    for event in active_events:
-        competition = event["competitions"][0]
-        status = competition["status"]
+def _normalize_date(date: str):
+    """
+    Internal helper: Scoreboard date as YYYYMMDD (None means today)
 
-        home_team = next(
-            c for c in competition["competitors"] if c["homeAway"] == "home"
-        )
-        away_team = next(
-            c for c in competition["competitors"] if c["homeAway"] == "away"
+    Raises:
+        ValueError if the date is not YYYY-MM-DD or YYYYMMDD
+    """
+    if not date:
+        return None
+
+    for fmt in ("%Y-%m-%d", "%Y%m%d"):
+        try:
+            return datetime.strptime(date, fmt).strftime("%Y%m%d")
+        except ValueError:
+            continue
+
+    raise ValueError(f"Invalid date {date!r}, expected YYYY-MM-DD")
+
+
+def _normalize_date_range(date: str, end_date: str):
+    """
+    Internal helper: Normalize a (date, end_date) range to YYYYMMDD
+
+    end_date without date starts the range today. Returns (date, None) when
+    no end_date is given.
+
+    Raises:
+        ValueError for malformed dates, end_date before date, or ranges
+        longer than MAX_SCHEDULE_DAYS
+    """
+    date = _normalize_date(date)
+    end_date = _normalize_date(end_date)
+    if end_date is None:
+        return date, None
+
+    if date is None:
+        date = datetime.now().strftime("%Y%m%d")
+
+    days = len(_schedule_days(date, end_date))
+    if days == 0:
+        raise ValueError(f"end_date {end_date} is before date {date}")
+    if days > MAX_SCHEDULE_DAYS:
+        raise ValueError(
+            f"Date range covers {days} days, at most {MAX_SCHEDULE_DAYS} are allowed"
         )
+    return date, end_date
 
-        game_id = event["id"]
-        game_name = event["shortName"]
-        game_date = event["date"]
 
-        away_score = int(away_team.get("score", 0))
-        home_score = int(home_team.get("score", 0))
-        score_diff = abs(away_score - home_score)
+def _normalize_status(status: str):
+    """
+    Internal helper: Validate the live/upcoming status filter
 
-        away_record = away_team.get("records", [{}])[0].get("summary", "0-0")
-        home_record = home_team.get("records", [{}])[0].get("summary", "0-0")
+    Raises:
+        ValueError for anything other than GAME_STATUS_FILTERS (or None)
+    """
+    if not status:
+        return None
 
-        status_type = status["type"]["name"]
-        period = status.get("period", 0)
-        clock = status.get("displayClock", "")
+    status = status.lower()
+    if status not in GAME_STATUS_FILTERS:
+        raise ValueError(
+            f"Invalid status {status!r}, expected one of {', '.join(GAME_STATUS_FILTERS)}"
+        )
+    return status
 
-        if status_type == "STATUS_IN_PROGRESS":
-            status_text = f"🔴 LIVE - Q{period} {clock}"
-        elif status_type == "STATUS_HALFTIME":
-            status_text = f"⏸️  HALFTIME"
-        else:
-            status_text = f"⏰ UPCOMING - {status['type']['detail']}"
 
-        # Broadcasts
-        broadcasts = competition.get("broadcasts", [])
-        broadcast_names = []
-        for b in broadcasts:
-            if b.get("names"):
-                broadcast_names.extend(b["names"])
+def _fetch_active_games(
+    date: str = None, teams: set = None, status: str = None, end_date: str = None
+) -> list:
+    """
+    Internal helper: Fetch live/upcoming games, applying filters
 
-        venue = competition.get("venue", {})
-        venue_name = venue.get("fullName", "N/A")
+    Args:
+        date: YYYYMMDD scoreboard date (default today). An explicit date
+            keeps completed games too unless status says otherwise
+        teams: Only games involving these team abbreviations
+        status: "live" or "upcoming" (default both, plus completed games
+            with a date), or "final" for only completed games
+        end_date: YYYYMMDD last day of a range starting at date
 
-        # Build simple output - NO METRICS
-        result += f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-        result += f"**{game_name}** (ID: {game_id})\n"
-        result += f"📅 {game_date}\n"
-        result += f"**Status:** {status_text}\n\n"
+    Returns:
+        List of scoreboard.Game records
 
-        result += f"**Away:** {away_team['team']['displayName']} ({away_record})"
-        if away_score > 0:
-            result += f" - {away_score}"
-        result += "\n"
+    Raises:
+        requests.exceptions.RequestException if a scoreboard fails
+    """
+    if date:
+        boards = _fetch_scoreboards(_schedule_days(date, end_date or date)).values()
+    else:
+        boards = [get_json(f"{SITE_API_BASE}/scoreboard", timeout=10, endpoint="scoreboard")]
 
-        result += f"**Home:** {home_team['team']['displayName']} ({home_record})"
-        if home_score > 0:
-            result += f" - {home_score}"
-        result += "\n"
+    active_games = []
+    seen = set()
 
-        if away_score > 0 or home_score > 0:
-            if away_score > home_score:
-                result += f"**Current Leader:** {away_team['team']['abbreviation']} by {score_diff}\n"
-            elif home_score > away_score:
-                result += f"**Current Leader:** {home_team['team']['abbreviation']} by {score_diff}\n"
-            else:
-                result += f"**Score:** Tied\n"
+    for game in (game for data in boards for game in parse_scoreboard(data)):
+        # A game moved between days can show up on both scoreboards
+        if game.game_id in seen:
+            continue
+        seen.add(game.game_id)
 
-        result += f"\n**Venue:** {venue_name}\n"
+        # Completed games are only wanted when asked for - by status, or
+        # by naming a date (e.g. last night's results)
+        if status is not None or not date:
+            if game.completed != (status == "final"):
+                continue
 
-        if broadcast_names:
-            result += f"**Broadcast:** {', '.join(broadcast_names)}\n"
+        if status in ("live", "upcoming") and game.is_live != (status == "live"):
+            continue
 
-        result += "\n"
+        if teams and not game.involves(teams):
+            continue
 
-    return result
+        active_games.append(game)
 
+    return active_games
 
-# ============================================================================
-# INTERNAL HELPER FUNCTIONS (not exposed as tools)
-# ============================================================================
+
+def _schedule_days(start: str, end: str) -> list:
+    """Internal helper: YYYYMMDD days from start to end inclusive (empty if end < start)"""
+    first = datetime.strptime(start, "%Y%m%d")
+    count = (datetime.strptime(end, "%Y%m%d") - first).days + 1
+    return [(first + timedelta(days=offset)).strftime("%Y%m%d") for offset in range(count)]
 
 
-def _fetch_games_data_structured():
+def _fetch_scoreboards(days: list) -> dict:
     """
-    Internal helper: Fetch games as structured data (not formatted string)
-    Returns list of game dicts
+    Internal helper: Fetch one scoreboard per day, concurrently
+
+    Each day is cached on its own (see _scoreboard_day_ttl), so only the
+    days missing from the cache are requested - a cold week costs one
+    concurrent round, a warm one none. Successful days are cached even if
+    another day fails.
+
+    Args:
+        days: YYYYMMDD dates
+
+    Returns:
+        Dict of {day: scoreboard data} in the order given
+
+    Raises:
+        requests.exceptions.RequestException if any day's scoreboard fails
     """
-    url = "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard"
+    cache = get_cache()
+    urls = {day: f"{SITE_API_BASE}/scoreboard?dates={day}" for day in days}
+
+    boards = {day: cache.get(url) for day, url in urls.items()}
+    missing = [day for day, data in boards.items() if data is MISSING]
+
+    fetched = get_json_many(
+        (urls[day] for day in missing), timeout=10, fields=SCOREBOARD_FIELDS
+    )
+
+    error = None
+    for day in missing:
+        data = fetched[urls[day]]
+        if isinstance(data, Exception):
+            error = error or data
+            continue
+        cache.set(urls[day], data, _scoreboard_day_ttl(day, data))
+        boards[day] = data
+
+    if error is not None:
+        raise error
+
+    return boards
 
-    try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-    except requests.exceptions.RequestException as e:
-        return []
 
+def _scoreboard_day_ttl(day: str, data: dict) -> float:
+    """
+    Internal helper: Cache TTL for one day's scoreboard
+
+    Past days with every game completed are kept for FINAL_DAY_TTL, today
+    (or any day with a live game) uses the scoreboard endpoint TTL, and
+    everything else - future days, postponements - FUTURE_DAY_TTL.
+    """
+    today = datetime.now().strftime("%Y%m%d")
     events = data.get("events", [])
 
-    # Filter out completed games
-    active_events = [
-        event
+    if day < today and all(
+        event["competitions"][0]["status"]["type"]["completed"] for event in events
+    ):
+        return FINAL_DAY_TTL
+
+    if day == today or any(
+        event["competitions"][0]["status"]["type"]["name"] in LIVE_STATUSES
         for event in events
-        if not event["competitions"][0]["status"]["type"]["completed"]
-    ]
+    ):
+        return ENDPOINT_TTLS["scoreboard"](data)
 
-    games = []
+    return FUTURE_DAY_TTL
 
-    for event in active_events:
-        competition = event["competitions"][0]
-        status = competition["status"]
 
-        home_team = next(
-            c for c in competition["competitors"] if c["homeAway"] == "home"
-        )
-        away_team = next(
-            c for c in competition["competitors"] if c["homeAway"] == "away"
-        )
+def _fetch_games_data_structured(
+    teams: set = None, date: str = None, status: str = None, end_date: str = None
+):
+    """
+    Internal helper: Fetch games as structured data (not formatted string)
+    Returns list of game dicts (filters as in _fetch_active_games)
 
-        game_id = event["id"]
-        game_name = event["shortName"]
-        game_date = event["date"]
+    Raises:
+        requests.exceptions.RequestException if a scoreboard fails
+    """
+    return [game.to_dict() for game in _fetch_active_games(date, teams, status, end_date)]
 
-        away_score = int(away_team.get("score", 0))
-        home_score = int(home_team.get("score", 0))
 
-        away_record = away_team.get("records", [{}])[0].get("summary", "0-0")
-        home_record = home_team.get("records", [{}])[0].get("summary", "0-0")
+def _get_rankings(top_n: int = None, teams: set = None):
+    """
+    Internal helper: Resolved rankings from the cache (refreshes every hour)
 
-        status_type = status["type"]["name"]
-        period = status.get("period", 0)
-        clock = status.get("displayClock", "")
+    Expired rankings are served immediately while one background refresh
+    replaces them, and a restarted server starts from the on-disk snapshot,
+    so only a cold cache pays for the leaderboard fan-out.
 
-        # Determine status
-        if status_type == "STATUS_IN_PROGRESS":
-            game_status = f"LIVE - Q{period} {clock}"
-        elif status_type == "STATUS_HALFTIME":
-            game_status = "HALFTIME"
-        else:
-            game_status = f"UPCOMING - {status['type']['detail']}"
-
-        # Broadcasts
-        broadcasts = competition.get("broadcasts", [])
-        broadcast_names = []
-        for b in broadcasts:
-            if b.get("names"):
-                broadcast_names.extend(b["names"])
-
-        venue = competition.get("venue", {})
-        venue_name = venue.get("fullName", "N/A")
-
-        game_dict = {
-            "game_id": game_id,
-            "game_name": game_name,
-            "game_date": game_date,
-            "status": game_status,
-            "away_team": {
-                "name": away_team["team"]["displayName"],
-                "abbreviation": away_team["team"]["abbreviation"],
-                "record": away_record,
-                "score": away_score,
-            },
-            "home_team": {
-                "name": home_team["team"]["displayName"],
-                "abbreviation": home_team["team"]["abbreviation"],
-                "record": home_record,
-                "score": home_score,
-            },
-            "venue": venue_name,
-            "broadcast": broadcast_names,
-        }
+    top_n and teams slice the league-wide rankings whenever the cache or
+    the snapshot has them. Only when neither does are they pushed down:
+    just the top N leaders are resolved, leaders the athlete index places
+    on other teams are never fetched, and the result is not cached.
 
-        games.append(game_dict)
+    Returns:
+        List of (rank, rating, full_name, team_abbr, athlete_id) from _resolve_leaders,
+        or None if the NBA Rating category is missing
+
+    Raises:
+        requests.exceptions.RequestException if the leaders endpoint fails
+    """
+    limit = min(top_n or RANKINGS_LIMIT, RANKINGS_LIMIT)
+
+    if limit == RANKINGS_LIMIT and not teams:
+        return _get_league_rankings()
 
-    return games
+    if snapshot.has(RANKINGS_CACHE_KEY, _rankings_ttl, STALE_TTL):
+        leaders = _get_league_rankings()
+    else:
+        leaders = _load_rankings(limit, teams)
+
+    if leaders is None:
+        return None
+
+    return [
+        leader
+        for leader in leaders[:limit]
+        if not teams or leader[3] in teams
+    ]
 
 
-def _fetch_rankings_data_structured():
+def _get_league_rankings():
+    """Internal helper: All RANKINGS_LIMIT rankings through the cache and snapshot"""
+    return snapshot.get_or_load(
+        RANKINGS_CACHE_KEY,
+        _load_rankings,
+        ttl=_rankings_ttl,
+        stale_ttl=STALE_TTL,
+        save_if=_rankings_resolved,
+    )
+
+
+def _load_rankings(limit: int = RANKINGS_LIMIT, teams: set = None):
     """
-    Internal helper: Fetch player rankings as structured data
-    Returns list of player dicts
+    Internal helper: Fetch the leaderboard and resolve the top `limit` entries
+    Returns list from _resolve_leaders, or None if the category is missing
     """
-    url = "http://sports.core.api.espn.com/v2/sports/basketball/leagues/nba/seasons/2026/types/2/leaders"
+    leaders = _fetch_rating_leaders()
+    if leaders is None:
+        return None
+    return _resolve_leaders(leaders[:limit], teams)
 
-    try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-    except requests.exceptions.RequestException as e:
-        return []
 
-    # Find NBA Rating category
-    categories = data.get("categories", [])
-    nba_rating_category = None
+def _rankings_resolved(leaders) -> bool:
+    """Internal helper: True if every leader's name and team were resolved"""
+    return all(name is not None and team is not None for _, _, name, team, _ in leaders)
 
-    for category in categories:
+
+def _rankings_ttl(leaders) -> float:
+    """Internal helper: Cache TTL for resolved rankings (see RANKINGS_RETRY_TTL)"""
+    return RANKINGS_TTL if _rankings_resolved(leaders) else RANKINGS_RETRY_TTL
+
+
+def _fetch_rating_leaders():
+    """
+    Internal helper: Fetch the top RANKINGS_LIMIT entries of the NBA Rating leaderboard
+    Returns list of leader entries, or None if the category is missing
+
+    Raises:
+        requests.exceptions.RequestException if the leaders endpoint fails
+    """
+    data = get_json(
+        f"{CORE_API_BASE}/seasons/2026/types/2/leaders", timeout=10, endpoint="leaders"
+    )
+
+    # Find NBA Rating category dynamically
+    for category in data.get("categories", []):
         if category.get("name") == "NBARating":
-            nba_rating_category = category
-            break
+            return category.get("leaders", [])[:RANKINGS_LIMIT]
 
-    if not nba_rating_category:
-        return []
+    return None
 
-    leaders = nba_rating_category.get("leaders", [])[:50]  # Top 50
 
-    rankings = []
+def _resolve_leaders(leaders: list, teams: set = None) -> list:
+    """
+    Internal helper: Resolve player names and team abbreviations for leaders
+
+    Leaders only carry athlete $ref URLs, and athletes only carry team $ref
+    URLs. Both are looked up in the athlete/team index built from the
+    rosters first. Only misses (e.g. free agents) go to the network: their
+    athlete refs are fetched concurrently, then the (deduplicated) team refs
+    not found in the index.
+
+    With teams, the index covers only those teams' rosters and leaders
+    missing from it are skipped without any request. Only leaders on those
+    teams are returned.
+
+    Returns:
+        List of (rank, rating, full_name, team_abbr, athlete_id) tuples in
+        rank order. full_name is None if the athlete could not be fetched;
+        team_abbr is "FA" for players without a team and None if the team
+        could not be fetched.
+    """
+    index = _get_athlete_index(teams)
+    athlete_index = index.players
+    team_abbrs = index.team_abbrs
+
+    athlete_refs = [leader.get("athlete", {}).get("$ref") for leader in leaders]
+
+    if teams and athlete_index:
+        # The index holds those teams' full rosters, so anyone missing from
+        # it plays elsewhere and needs no lookup at all
+        keep = [_ref_id(ref, "athletes") in athlete_index for ref in athlete_refs]
+    else:
+        keep = [True] * len(leaders)
+
+    athletes = get_json_many(
+        (
+            ref
+            for ref, wanted in zip(athlete_refs, keep)
+            if wanted and _ref_id(ref, "athletes") not in athlete_index
+        ),
+        timeout=5,
+        endpoint="athlete",
+    )
+
+    team_refs = [
+        player_data.get("team", {}).get("$ref")
+        for player_data in athletes.values()
+        if isinstance(player_data, dict)
+    ]
+    team_data_by_ref = get_json_many(
+        (ref for ref in team_refs if _ref_id(ref, "teams") not in team_abbrs),
+        timeout=3,
+        endpoint="team",
+    )
+
+    resolved = []
+
+    for idx, (leader, athlete_ref, wanted) in enumerate(
+        zip(leaders, athlete_refs, keep), 1
+    ):
+        if not wanted:
+            continue
 
-    for idx, leader in enumerate(leaders, 1):
         rating = leader.get("value", 0)
-        athlete_ref = leader.get("athlete", {}).get("$ref")
+        athlete_id = _ref_id(athlete_ref, "athletes")
 
-        try:
-            player_resp = requests.get(athlete_ref, timeout=5)
-            player_resp.raise_for_status()
-            player_data = player_resp.json()
+        indexed = athlete_index.get(athlete_id)
+        if indexed is not None:
+            resolved.append((idx, rating, indexed.name, indexed.team, athlete_id))
+            continue
 
-            full_name = player_data.get("fullName", "Unknown")
-            team_ref = player_data.get("team", {}).get("$ref")
+        player_data = athletes.get(athlete_ref)
 
-            # Get team abbreviation
+        if not isinstance(player_data, dict):
+            resolved.append((idx, rating, None, None, athlete_id))
+            continue
+
+        full_name = player_data.get("fullName", "Unknown")
+        team_ref = player_data.get("team", {}).get("$ref")
+
+        # Get team abbreviation (None if the team lookup failed)
+        if team_ref is None:
             team_abbr = "FA"
-            if team_ref:
-                try:
-                    team_resp = requests.get(team_ref, timeout=3)
-                    team_resp.raise_for_status()
-                    team_data = team_resp.json()
-                    team_abbr = team_data.get("abbreviation", "FA")
-                except:
-                    pass
-
-            player_dict = {
-                "rank": idx,
-                "name": full_name,
-                "team": team_abbr,
-                "espn_rating": round(rating, 1),
-            }
+        else:
+            team_abbr = team_abbrs.get(_ref_id(team_ref, "teams"))
+        team_data = team_data_by_ref.get(team_ref)
+        if isinstance(team_data, dict):
+            team_abbr = team_data.get("abbreviation", "FA")
+
+        resolved.append((idx, rating, full_name, team_abbr, athlete_id))
+
+    if teams:
+        resolved = [entry for entry in resolved if entry[3] in teams]
 
-            rankings.append(player_dict)
+    return resolved
 
-        except requests.exceptions.RequestException:
+
+def _get_athlete_index(teams: set = None) -> Rosters:
+    """
+    Internal helper: Roster model used as the athlete/team lookup index
+
+    Args:
+        teams: Only index these teams' rosters (see _get_rosters)
+
+    Returns:
+        rosters.Rosters (players by athlete id, team_abbrs by team id);
+        empty if rosters are unavailable
+    """
+    try:
+        rosters = _get_rosters(teams)
+    except requests.exceptions.RequestException:
+        rosters = None
+
+    return Rosters() if rosters is None else rosters
+
+
+def _ref_id(ref: str, collection: str):
+    """
+    Internal helper: Pull the numeric id out of an ESPN core API $ref
+    e.g. ".../seasons/2026/athletes/1966?lang=en" -> "1966" for "athletes"
+    """
+    if not ref:
+        return None
+    match = re.search(rf"/{collection}/(\d+)", ref)
+    return match.group(1) if match else None
+
+
+def _fetch_rankings_data_structured(top_n: int = None, teams: set = None):
+    """
+    Internal helper: Fetch player rankings as structured data
+    Returns list of player dicts (filters as in _get_rankings)
+
+    Raises:
+        requests.exceptions.RequestException if the leaders endpoint fails
+    """
+    return _structure_rankings(_get_rankings(top_n, teams))
+
+
+def _stale_rankings_data_structured(top_n: int = None, teams: set = None):
+    """
+    Internal helper: Rankings from an expired cache entry or the on-disk
+    snapshot (see _stale_value), without any request
+    Returns a list as _fetch_rankings_data_structured, or None if there is nothing
+    """
+    leaders = _stale_value(RANKINGS_CACHE_KEY)
+    if leaders is None:
+        return None
+
+    limit = min(top_n or RANKINGS_LIMIT, RANKINGS_LIMIT)
+    return _structure_rankings(
+        [leader for leader in leaders[:limit] if not teams or leader[3] in teams]
+    )
+
+
+def _stale_value(key: str):
+    """
+    Internal helper: Cached value for key even if expired, else the on-disk
+    snapshot regardless of age, else None
+    """
+    value = get_cache().peek(key)
+    if value is not MISSING:
+        return value
+
+    saved = snapshot.load(key)
+    return None if saved is None else saved[0]
+
+
+def _structure_rankings(leaders) -> list:
+    """
+    Internal helper: Ranking dicts from _resolve_leaders tuples
+    (players whose details could not be fetched are skipped)
+    """
+    if not leaders:
+        return []
+
+    rankings = []
+
+    for idx, rating, full_name, team_abbr, athlete_id in leaders:
+        # Players whose details could not be fetched are skipped
+        if full_name is None:
             continue
 
+        player_dict = {
+            "rank": idx,
+            "id": athlete_id,
+            "name": full_name,
+            "team": team_abbr or "FA",
+            "espn_rating": round(rating, 1),
+        }
+
+        rankings.append(player_dict)
+
     return rankings
 
 
-def _fetch_matchup_injuries(away_abbr: str, home_abbr: str) -> dict:
+def _fetch_league_injuries(team_abbrs) -> dict:
+    """
+    Internal helper: Fetch injury reports for many teams at once
+
+    Teams are packed into as few multi-team injury requests as possible
+    (INJURY_BATCH_SIZE teams each), and the batches are fetched concurrently.
+
+    Args:
+        team_abbrs: Iterable of team abbreviations (duplicates are ignored)
+
+    Returns:
+        Dict of {team_abbr: [injury_info, ...]}. Teams whose batch could not
+        be fetched are left out, so callers can tell "no injuries" apart from
+        "no data".
+    """
+    team_abbrs = list(dict.fromkeys(team_abbrs))
+    batches = [
+        team_abbrs[i : i + INJURY_BATCH_SIZE]
+        for i in range(0, len(team_abbrs), INJURY_BATCH_SIZE)
+    ]
+    batch_urls = [
+        f"{SITE_API_BASE}/injuries?" + "&".join(f"team={abbr}" for abbr in batch)
+        for batch in batches
+    ]
+    responses = get_json_many(batch_urls, timeout=10, endpoint="injuries")
+
+    injuries_by_team = {}
+
+    for batch, batch_url in zip(batches, batch_urls):
+        data = responses.get(batch_url)
+        if not isinstance(data, dict):
+            continue
+
+        for abbr in batch:
+            injuries_by_team[abbr] = []
+
+        for injury in _flatten_injuries(data.get("injuries", [])):
+            athlete = injury.get("athlete", {})
+            team = athlete.get("team", {})
+            details = injury.get("details", {})
+
+            injury_info = {
+                "player_name": athlete.get("displayName", "Unknown"),
+                "player_id": _athlete_id(athlete),
+                "team": team.get("abbreviation", "???"),
+                "position": athlete.get("position", {}).get("abbreviation", ""),
+                "status": injury.get("status", "Unknown"),
+                "injury_type": details.get("type", "Unknown"),
+                "return_date": details.get("returnDate"),
+                "short_description": injury.get("shortComment", ""),
+                "long_description": injury.get("longComment", ""),
+            }
+
+            if injury_info["team"] in injuries_by_team:
+                injuries_by_team[injury_info["team"]].append(injury_info)
+
+    return injuries_by_team
+
+
+def _athlete_id(athlete: dict):
+    """
+    Internal helper: ESPN athlete id of an injury report's athlete - its
+    "id", else the one in its player page link (".../player/_/id/1966/...")
+    Returns None if neither is there
+    """
+    if athlete.get("id") is not None:
+        return str(athlete["id"])
+
+    for link in athlete.get("links", []):
+        match = re.search(r"/id/(\d+)", link.get("href", ""))
+        if match:
+            return match.group(1)
+
+    return None
+
+
+def _flatten_injuries(entries: list) -> list:
+    """
+    Internal helper: Flatten team-grouped injury entries into a single list
+
+    The injuries endpoint may group entries per team ({"injuries": [...]})
+    instead of returning one flat list; both shapes are accepted.
+    """
+    flat = []
+    for entry in entries:
+        if "athlete" not in entry and isinstance(entry.get("injuries"), list):
+            flat.extend(entry["injuries"])
+        else:
+            flat.append(entry)
+    return flat
+
+
+def _fetch_matchup_injuries(
+    away_abbr: str, home_abbr: str, injuries_by_team: dict = None
+) -> dict:
     """
     Fetch detailed injury data for a specific matchup using ESPN's injury API
 
     Args:
         away_abbr: Away team abbreviation (e.g., "LAL")
         home_abbr: Home team abbreviation (e.g., "MIN")
+        injuries_by_team: Optional league-wide snapshot from
+            _fetch_league_injuries - sliced in memory instead of refetching
 
     Returns:
         Dict with injury details for both teams, including return dates and descriptions
     """
-    url = f"https://site.api.espn.com/apis/site/v2/sports/basketball/nba/injuries?team={away_abbr}&team={home_abbr}"
+    if injuries_by_team is None:
+        injuries_by_team = _fetch_league_injuries([away_abbr, home_abbr])
 
-    try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-    except requests.exceptions.RequestException:
+    if away_abbr not in injuries_by_team or home_abbr not in injuries_by_team:
         return {"injuries": [], "error": "Could not fetch injury data"}
 
-    injuries = data.get("injuries", [])
-
     # Organize injuries by team
-    matchup_injuries = {"away_team": away_abbr, "home_team": home_abbr, "injuries": []}
-
-    for injury in injuries:
-        athlete = injury.get("athlete", {})
-        team = athlete.get("team", {})
-        details = injury.get("details", {})
-
-        injury_info = {
-            "player_name": athlete.get("displayName", "Unknown"),
-            "team": team.get("abbreviation", "???"),
-            "position": athlete.get("position", {}).get("abbreviation", ""),
-            "status": injury.get("status", "Unknown"),
-            "injury_type": details.get("type", "Unknown"),
-            "return_date": details.get("returnDate"),
-            "short_description": injury.get("shortComment", ""),
-            "long_description": injury.get("longComment", ""),
-        }
+    return {
+        "away_team": away_abbr,
+        "home_team": home_abbr,
+        "injuries": injuries_by_team[away_abbr] + injuries_by_team[home_abbr],
+    }
 
-        matchup_injuries["injuries"].append(injury_info)
 
-    return matchup_injuries
+def _get_rosters(teams: set = None):
+    """
+    Internal helper: Roster model from the cache (refreshes every 24 hours)
+
+    Expired rosters are served immediately while one background refresh
+    replaces them, so tool latency does not spike when the TTL runs out.
+    A restarted server starts from the on-disk snapshot.
+
+    With teams, the league-wide rosters are narrowed to those teams
+    whenever the cache or the snapshot has them; otherwise only those
+    teams' rosters are fetched (and not cached as a league-wide entry).
 
+    Returns:
+        rosters.Rosters, or None if no teams were found
 
-def _fetch_rosters_data_structured():
+    Raises:
+        requests.exceptions.RequestException if the teams list fails
     """
-    Internal helper: Fetch rosters with injury data as structured data
-    Returns dict of {team_abbr: [{"name": str, "injured": bool, "injury_status": str}]}
+    if teams and not snapshot.has(ROSTER_CACHE_KEY, ROSTER_TTL, STALE_TTL):
+        rows = _load_rosters(teams)
+        return None if rows is None else Rosters.from_rows(rows)
+
+    rows = snapshot.get_or_load(
+        ROSTER_CACHE_KEY, _load_rosters, ttl=ROSTER_TTL, stale_ttl=STALE_TTL
+    )
+    if rows is None:
+        return None
+
+    rosters = get_model(rows)
+    return rosters.subset(teams) if teams else rosters
+
+
+def _load_rosters(only: set = None):
     """
-    # Use cached rosters if available
-    if (
-        ROSTER_CACHE["nba_dict"] is not None
-        and ROSTER_CACHE["nba_injuries"] is not None
-    ):
-        # Combine roster and injury data
-        combined_rosters = {}
-        for team_abbr, players in ROSTER_CACHE["nba_dict"].items():
-            injured_map = {
-                inj["name"]: inj["status"]
-                for inj in ROSTER_CACHE["nba_injuries"].get(team_abbr, [])
-            }
+    Internal helper: Fetch and parse every NBA roster
 
-            combined_rosters[team_abbr] = [
-                {
-                    "name": player,
-                    "injured": player in injured_map,
-                    "injury_status": injured_map.get(player),
-                }
-                for player in players
-            ]
+    All team rosters are fetched concurrently, and each roster response is
+    parsed once into rows of team and player fields (see
+    rosters.Rosters.from_rows) - the JSON-serializable form that is cached
+    and snapshotted to disk.
 
-        return combined_rosters
+    Args:
+        only: Fetch just these team abbreviations instead of the whole league
 
-    # Otherwise fetch fresh
+    Returns:
+        Dict with "teams" ([team_id, abbr, name, roster status]), "players"
+        ([athlete_id, name, jersey, position, team_abbr, injury_status])
+        and "last_updated", or None if no teams were found
+
+    Raises:
+        requests.exceptions.RequestException if the teams list fails
+    """
     now = datetime.now()
 
-    url = "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/teams"
-
-    try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-    except requests.exceptions.RequestException:
-        return {}
+    data = get_json(f"{SITE_API_BASE}/teams", timeout=10, endpoint="teams")
 
     teams = data.get("sports", [{}])[0].get("leagues", [{}])[0].get("teams", [])
 
     if not teams:
-        return {}
+        return None
+
+    teams = [team_data.get("team", {}) for team_data in teams]
+    if only:
+        teams = [team for team in teams if team.get("abbreviation") in only]
 
-    roster_dict = {}
-    injury_dict = {}
+    roster_urls = [f"{SITE_API_BASE}/teams/{team.get('id')}/roster" for team in teams]
+    roster_responses = get_json_many(
+        roster_urls, timeout=5, max_in_flight=ROSTER_MAX_IN_FLIGHT, endpoint="roster"
+    )
 
-    for team_data in teams:
-        team = team_data.get("team", {})
+    team_rows = []
+    player_rows = []
+
+    for team, roster_url in zip(teams, roster_urls):
+        team_name = team.get("displayName", "Unknown Team")
         team_abbr = team.get("abbreviation", "???")
         team_id = team.get("id")
+        if team_id is not None:
+            team_id = str(team_id)
 
-        roster_url = f"https://site.api.espn.com/apis/site/v2/sports/basketball/nba/teams/{team_id}/roster"
+        roster_data = roster_responses.get(roster_url)
 
-        try:
-            roster_response = requests.get(roster_url, timeout=5)
-            roster_response.raise_for_status()
-            roster_data = roster_response.json()
-        except requests.exceptions.RequestException:
-            roster_dict[team_abbr] = []
-            injury_dict[team_abbr] = []
+        if not isinstance(roster_data, dict):
+            team_rows.append([team_id, team_abbr, team_name, ROSTER_UNAVAILABLE])
             continue
 
         athletes = roster_data.get("athletes", [])
 
         if not athletes:
-            roster_dict[team_abbr] = []
-            injury_dict[team_abbr] = []
+            team_rows.append([team_id, team_abbr, team_name, ROSTER_EMPTY])
             continue
 
-        player_list = []
-        injured_list = []
+        team_rows.append([team_id, team_abbr, team_name, ROSTER_OK])
 
         for athlete in athletes:
-            full_name = athlete.get("fullName", "Unknown")
+            athlete_id = athlete.get("id")
 
             # Check injury status
             injuries = athlete.get("injuries", [])
-            is_injured = len(injuries) > 0
-            injury_status = injuries[0].get("status", "Out") if is_injured else None
+            injury_status = injuries[0].get("status", "Out") if injuries else None
+
+            player_rows.append(
+                [
+                    str(athlete_id) if athlete_id is not None else None,
+                    athlete.get("fullName", "Unknown"),
+                    athlete.get("jersey", ""),
+                    athlete.get("position", {}).get("abbreviation", ""),
+                    team_abbr,
+                    injury_status,
+                ]
+            )
 
-            player_list.append(full_name)
+    return {"teams": team_rows, "players": player_rows, "last_updated": now.isoformat()}
 
-            if is_injured:
-                injured_list.append({"name": full_name, "status": injury_status})
 
-        roster_dict[team_abbr] = player_list
-        injury_dict[team_abbr] = injured_list
+def _fetch_rosters_data_structured(teams: set = None):
+    """
+    Internal helper: Fetch rosters with injury data as structured data
+    Returns dict of {team_abbr: [{"name": str, "injured": bool, "injury_status": str}]}
+    (only the given team abbreviations, if any). The player dicts are
+    built once per roster refresh and shared - do not mutate them.
+    """
+    try:
+        return _structure_rosters(_get_rosters(teams))
+    except requests.exceptions.RequestException:
+        return {}
+
 
-    # Cache it
-    ROSTER_CACHE["nba_dict"] = roster_dict
-    ROSTER_CACHE["nba_injuries"] = injury_dict
-    ROSTER_CACHE["last_updated"] = now
+def _stale_rosters_model(teams: set = None):
+    """
+    Internal helper: Roster model from an expired cache entry or the on-disk
+    snapshot (see _stale_value), without any request; None if there is nothing
+    """
+    rows = _stale_value(ROSTER_CACHE_KEY)
+    if rows is None:
+        return None
 
-    # Combine and return
-    combined_rosters = {}
-    for team_abbr, players in roster_dict.items():
-        injured_map = {
-            inj["name"]: inj["status"] for inj in injury_dict.get(team_abbr, [])
-        }
+    rosters = get_model(rows)
+    return rosters.subset(teams) if teams else rosters
 
-        combined_rosters[team_abbr] = [
-            {
-                "name": player,
-                "injured": player in injured_map,
-                "injury_status": injured_map.get(player),
-            }
-            for player in players
-        ]
 
-    return combined_rosters
+def _structure_rosters(rosters) -> dict:
+    """Internal helper: A roster model as _fetch_rosters_data_structured returns it"""
+    if rosters is None:
+        return {}
+    return {abbr: team.structured() for abbr, team in rosters.teams.items()}
 
 
 # ============================================================================
@@ -636,7 +1072,19 @@ def _fetch_rosters_data_structured():
 # ============================================================================
 
 
-def get_nba_recommendation_data() -> str:
+def get_nba_recommendation_data(
+    compact: bool = False,
+    max_bytes: int = None,
+    max_tokens: int = None,
+    teams=None,
+    date: str = None,
+    status: str = None,
+    top_n: int = None,
+    end_date: str = None,
+    summary: bool = False,
+    deadline: float = None,
+    progress=None,
+) -> str:
     """
     Get comprehensive NBA data for making intelligent game recommendations
 
@@ -645,6 +1093,8 @@ def get_nba_recommendation_data() -> str:
     - Current NBA player rankings (top 50 by ESPN Rating)
     - Full team rosters with injury status for each player
     - Matchup-specific injury reports for each game (with return dates and details)
+    - A precomputed summary per game: ranked players active/questionable/out,
+      win percentages and their gap, national broadcast flag
 
     This rich dataset enables intelligent recommendations based on:
     - Star power (which top-50 players are HEALTHY and playing)
@@ -652,31 +1102,432 @@ def get_nba_recommendation_data() -> str:
     - Competitive balance (team records)
     - Broadcast quality (national vs regional)
     - Game timing (live vs upcoming)
+
+    Args:
+        compact: Compact JSON with only today's teams' rosters and no
+            duplicated injury details (see _compact_recommendation_data)
+        max_bytes: Optional payload budget in bytes (compact mode only)
+        max_tokens: Optional payload budget in LLM tokens, estimated at
+            BYTES_PER_TOKEN bytes each (compact mode only)
+        teams: Only games involving these team abbreviations; rosters and
+            rankings are limited to the teams in those games
+        date: Scoreboard date (YYYY-MM-DD or YYYYMMDD, default today)
+        status: "live", "upcoming" or "final" to keep only those games
+        top_n: Only the top N ranked players
+        end_date: Last day of a date range starting at date
+        summary: Only the games with their summaries - no rankings, rosters
+            or injury lists (smallest payload; compact and budgets ignored)
+        deadline: Seconds to spend at most (default RECOMMENDATION_DEADLINE).
+            Sections not ready in time, or whose fetch failed, are served
+            from older cached data or left empty and listed in
+            metadata["degraded"]
+        progress: Optional callback progress(stage, done, total, message),
+            called from a worker thread as each of PROGRESS_STAGES finishes
+            (the "games" message already lists the games)
+    """
+    try:
+        teams = _normalize_teams(teams)
+        date, end_date = _normalize_date_range(date, end_date)
+        status = _normalize_status(status)
+        deadline = _normalize_deadline(deadline)
+    except ValueError as e:
+        return f"Error: {e}"
+
+    data = _build_recommendation_data(
+        teams, date, status, top_n, end_date, deadline, progress
+    )
+
+    if summary:
+        return _dump_with_size(_summary_recommendation_data(data), separators=(",", ":"))
+
+    if not compact:
+        return _dump_with_size(data, indent=2)
+
+    budget = max_bytes
+    if max_tokens is not None:
+        token_budget = max_tokens * BYTES_PER_TOKEN
+        budget = token_budget if budget is None else min(budget, token_budget)
+
+    return _render_compact(_compact_recommendation_data(data), budget)
+
+
+def _normalize_deadline(deadline):
     """
-    # Fetch all data
-    games = _fetch_games_data_structured()
-    rankings = _fetch_rankings_data_structured()
-    rosters = _fetch_rosters_data_structured()
+    Internal helper: Validate a deadline in seconds
+    Returns the deadline, RECOMMENDATION_DEADLINE if None, or None for no limit
+
+    Raises:
+        ValueError if the deadline is not a positive number
+    """
+    if deadline is None:
+        return RECOMMENDATION_DEADLINE or None
+
+    try:
+        deadline = float(deadline)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid deadline: {deadline!r} (expected seconds)")
+
+    if deadline <= 0:
+        raise ValueError(f"Invalid deadline: {deadline} (must be positive)")
+
+    return deadline
+
+
+def _wait_for(future, deadline_at: float = None):
+    """
+    Internal helper: Result of a section future, LATE if it is not done by
+    deadline_at (time.monotonic() value, None to wait indefinitely), or
+    FAILED if its fetch raised a request error
+    """
+    timeout = None if deadline_at is None else max(deadline_at - time.monotonic(), 0)
+    try:
+        return future.result(timeout=timeout)
+    except FutureTimeoutError:
+        # Not the builtin TimeoutError before Python 3.11
+        return LATE
+    except requests.exceptions.RequestException:
+        return FAILED
+
+
+def _wait_for_sections(futures: dict, deadline_at: float = None, on_done=None) -> dict:
+    """
+    Internal helper: Results of {section: future} as {section: result}, with
+    LATE for those not done by deadline_at and FAILED for those that raised a
+    request error (see _wait_for). on_done(section, result) is called as each
+    section finishes, in completion order.
+    """
+    sections = {future: section for section, future in futures.items()}
+    results = {}
+
+    pending = set(sections)
+    while pending:
+        timeout = None if deadline_at is None else max(deadline_at - time.monotonic(), 0)
+        done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        if not done:
+            break
+        for future in done:
+            section = sections[future]
+            results[section] = _wait_for(future)
+            if on_done is not None:
+                on_done(section, results[section])
+
+    for future in pending:
+        results[sections[future]] = LATE
+
+    return results
+
+
+def _progress_message(stage: str, result) -> str:
+    """Internal helper: Progress message for a finished recommendation stage"""
+    if result is LATE:
+        return f"{stage}: not ready before the deadline"
+    if result is FAILED:
+        return f"{stage}: could not be fetched"
+    if stage == "games":
+        listed = "; ".join(
+            f"{game['game_name']} ({game['status']})"
+            for game in result[:PROGRESS_GAMES_LISTED]
+        )
+        more = len(result) - PROGRESS_GAMES_LISTED
+        if more > 0:
+            listed += f"; ... and {more} more"
+        return f"games: {len(result)} found" + (f" - {listed}" if listed else "")
+    if stage == "matchup_injuries":
+        return f"matchup_injuries: reports for {len(result)} teams"
+    if stage == "player_rankings":
+        return f"player_rankings: {len(result)} ranked players"
+    return f"team_rosters: {0 if result is None else len(result.teams)} teams"
+
+
+def _build_recommendation_data(
+    teams: set = None,
+    date: str = None,
+    status: str = None,
+    top_n: int = None,
+    end_date: str = None,
+    deadline: float = None,
+    progress=None,
+) -> dict:
+    """
+    Internal helper: Fetch and assemble the full recommendation payload
+    Returns dict with "metadata", "games", "player_rankings" and "team_rosters"
+
+    Filters are pushed down: with teams, only the rosters, injuries and
+    rankings of teams in the matching games are requested.
+
+    The games are fetched first (they decide which teams matter), then
+    rankings, rosters and injuries concurrently. With a deadline (seconds),
+    whatever is not ready by then is degraded instead of waited for, and so
+    is whatever failed - rankings and rosters fall back to older cached
+    data, games and injuries are left empty - and listed in
+    metadata["degraded"] as {section: "stale" | "missing"}. The late
+    fetches finish in the background and fill the cache for the next call.
+
+    progress(stage, done, total, message) is called as each of
+    PROGRESS_STAGES finishes (or misses the deadline).
+    """
+    deadline_at = None if deadline is None else time.monotonic() + deadline
+    degraded = {}
+    finished = []
+
+    def report(stage, result):
+        finished.append(stage)
+        if progress is not None:
+            message = _progress_message(stage, result)
+            progress(stage, len(finished), len(PROGRESS_STAGES), message)
+
+    games = _wait_for(
+        _section_executor.submit(_fetch_games_data_structured, teams, date, status, end_date),
+        deadline_at,
+    )
+    report("games", games)
+    if games is LATE or games is FAILED:
+        games = []
+        degraded["games"] = "missing"
+
+    filters = {
+        "teams": sorted(teams or []),
+        "date": date,
+        "end_date": end_date,
+        "status": status,
+        "top_n": top_n,
+    }
+
+    if teams:
+        teams = {
+            abbr
+            for game in games
+            for abbr in (game["away_team"]["abbreviation"], game["home_team"]["abbreviation"])
+        } or teams
+
+    futures = {
+        "player_rankings": _section_executor.submit(
+            _fetch_rankings_data_structured, top_n, teams
+        ),
+        "team_rosters": _section_executor.submit(_get_rosters, teams),
+        # Fetch injuries for every team playing once, then slice per matchup
+        "matchup_injuries": _section_executor.submit(
+            _fetch_league_injuries,
+            [
+                abbr
+                for game in games
+                for abbr in (game["away_team"]["abbreviation"], game["home_team"]["abbreviation"])
+            ],
+        ),
+    }
+    results = _wait_for_sections(futures, deadline_at, report)
+    for stage, result in results.items():
+        if result is LATE:
+            report(stage, result)
+
+    rankings = results["player_rankings"]
+    if rankings is LATE or rankings is FAILED:
+        rankings = _stale_rankings_data_structured(top_n, teams)
+        degraded["player_rankings"] = "missing" if rankings is None else "stale"
+        rankings = rankings or []
+
+    roster_model = results["team_rosters"]
+    if roster_model is LATE or roster_model is FAILED:
+        roster_model = _stale_rosters_model(teams)
+        degraded["team_rosters"] = "missing" if roster_model is None else "stale"
+    rosters = _structure_rosters(roster_model)
+
+    injuries_by_team = results["matchup_injuries"]
+    injuries_late = injuries_by_team is LATE
+    if injuries_late:
+        injuries_by_team = {}
 
-    # Fetch matchup-specific injury data for each game
     for game in games:
         away_abbr = game["away_team"]["abbreviation"]
         home_abbr = game["home_team"]["abbreviation"]
 
-        matchup_injuries = _fetch_matchup_injuries(away_abbr, home_abbr)
+        matchup_injuries = _fetch_matchup_injuries(away_abbr, home_abbr, injuries_by_team)
+        if "error" in matchup_injuries:
+            degraded["matchup_injuries"] = "missing"
+            if injuries_late:
+                matchup_injuries["error"] = "Injury data not ready before the deadline"
         game["matchup_injuries"] = matchup_injuries
 
+    summaries = summarize_games(games, rankings, roster_model)
+    for game in games:
+        game["summary"] = summaries[game["game_id"]]
+
+    metadata = {
+        "fetched_at": datetime.now().isoformat(),
+        "games_count": len(games),
+        "top_players_count": len(rankings),
+        "teams_count": len(rosters),
+    }
+
+    if any(filters.values()):
+        metadata["filters"] = {key: value for key, value in filters.items() if value}
+
+    if degraded:
+        metadata["degraded"] = degraded
+        metadata["deadline_seconds"] = deadline
+
     # Combine into rich JSON
-    combined_data = {
-        "metadata": {
-            "fetched_at": datetime.now().isoformat(),
-            "games_count": len(games),
-            "top_players_count": len(rankings),
-            "teams_count": len(rosters),
-        },
+    return {
+        "metadata": metadata,
         "games": games,
         "player_rankings": rankings,
         "team_rosters": rosters,
     }
 
-    return json.dumps(combined_data, indent=2)
+
+def _compact_recommendation_data(data: dict) -> dict:
+    """
+    Internal helper: Shrink the recommendation payload without losing signal
+
+    - Only rosters for teams playing in the returned games
+    - Injuries drop long_description, injuries and rankings drop athlete
+      ids (only needed for the summaries, which are already joined)
+    - Roster players are plain names unless the roster knows about an injury
+      that matchup_injuries does not already report
+    """
+    games = []
+    reported = set()
+    playing = []
+
+    for game in data["games"]:
+        matchup = game["matchup_injuries"]
+        injuries = [
+            {
+                key: value
+                for key, value in injury.items()
+                if key not in ("long_description", "player_id")
+            }
+            for injury in matchup["injuries"]
+        ]
+        reported.update((injury["team"], injury["player_name"]) for injury in injuries)
+        playing.extend(
+            (game["away_team"]["abbreviation"], game["home_team"]["abbreviation"])
+        )
+        games.append({**game, "matchup_injuries": {**matchup, "injuries": injuries}})
+
+    rosters = {}
+    for team_abbr in dict.fromkeys(playing):
+        rosters[team_abbr] = [
+            player["name"]
+            if not player["injured"] or (team_abbr, player["name"]) in reported
+            else {"name": player["name"], "injury_status": player["injury_status"]}
+            for player in data["team_rosters"].get(team_abbr, [])
+        ]
+
+    return {
+        "metadata": {**data["metadata"], "teams_count": len(rosters), "compact": True},
+        "games": games,
+        "player_rankings": [
+            {key: value for key, value in player.items() if key != "id"}
+            for player in data["player_rankings"]
+        ],
+        "team_rosters": rosters,
+    }
+
+
+def _summary_recommendation_data(data: dict) -> dict:
+    """
+    Internal helper: Games with their precomputed summaries only
+    (see matchups.summarize_game) - no rankings, rosters or injury lists
+    """
+    return {
+        "metadata": {**data["metadata"], "summary_only": True},
+        "games": _drop_matchup_injuries(data)["games"],
+    }
+
+
+def _render_compact(data: dict, budget: int = None) -> str:
+    """
+    Internal helper: Serialize compact data, trimming it to fit a byte budget
+
+    Sections are trimmed in COMPACT_TRIM_STEPS order until the payload fits;
+    the steps applied are listed in metadata["trimmed"].
+    """
+    payload = _dump_with_size(data, separators=(",", ":"))
+    if budget is None:
+        return payload
+
+    trimmed = []
+    for step, trim in COMPACT_TRIM_STEPS:
+        if len(payload.encode()) <= budget:
+            break
+        data = trim(data)
+        trimmed.append(step)
+        data["metadata"] = {
+            **data["metadata"],
+            "top_players_count": len(data["player_rankings"]),
+            "teams_count": len(data["team_rosters"]),
+            "trimmed": trimmed,
+        }
+        payload = _dump_with_size(data, separators=(",", ":"))
+
+    if len(payload.encode()) > budget:
+        data["metadata"]["over_budget"] = True
+        payload = _dump_with_size(data, separators=(",", ":"))
+
+    return payload
+
+
+def _trim_rankings(limit: int):
+    def trim(data):
+        return {**data, "player_rankings": data["player_rankings"][:limit]}
+
+    return trim
+
+
+def _trim_short_descriptions(data: dict) -> dict:
+    games = [
+        {
+            **game,
+            "matchup_injuries": {
+                **game["matchup_injuries"],
+                "injuries": [
+                    {k: v for k, v in injury.items() if k != "short_description"}
+                    for injury in game["matchup_injuries"]["injuries"]
+                ],
+            },
+        }
+        for game in data["games"]
+    ]
+    return {**data, "games": games}
+
+
+def _drop_rosters(data: dict) -> dict:
+    return {**data, "team_rosters": {}}
+
+
+def _drop_matchup_injuries(data: dict) -> dict:
+    # Each game's summary still says which ranked players are out
+    games = [
+        {key: value for key, value in game.items() if key != "matchup_injuries"}
+        for game in data["games"]
+    ]
+    return {**data, "games": games}
+
+
+# Applied in order by _render_compact until the payload fits its budget
+COMPACT_TRIM_STEPS = [
+    ("player_rankings_top_25", _trim_rankings(25)),
+    ("injury_short_descriptions", _trim_short_descriptions),
+    ("team_rosters", _drop_rosters),
+    ("matchup_injuries", _drop_matchup_injuries),
+    ("player_rankings_top_10", _trim_rankings(10)),
+]
+
+
+def _dump_with_size(data: dict, **dump_kwargs) -> str:
+    """
+    Internal helper: json.dumps with metadata["payload_bytes"] filled in
+    The size field is part of the payload, so it is settled in a second pass
+    """
+    data["metadata"]["payload_bytes"] = 0
+    payload = json.dumps(data, **dump_kwargs)
+
+    for _ in range(3):
+        size = len(payload.encode())
+        if data["metadata"]["payload_bytes"] == size:
+            break
+        data["metadata"]["payload_bytes"] = size
+        payload = json.dumps(data, **dump_kwargs)
+
+    return payload
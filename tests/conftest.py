@@ -0,0 +1,61 @@
+"""
+Shared fixtures: every test talks to the local stub of the ESPN endpoints
+(benchmarks/stub_server.py) with a fresh cache, no disk snapshot, no live
+pollers and the client's default breakers - nothing goes to the network.
+"""
+
+import time
+
+import pytest
+
+from sport_suggest_mcp import client, live, snapshot, tools
+from sport_suggest_mcp.cache import get_cache
+from stub_server import StubServer
+
+
+@pytest.fixture(scope="session")
+def stub_server():
+    stub = StubServer(latency=0).start()
+    yield stub
+    stub.shutdown()
+
+
+@pytest.fixture
+def stub(stub_server, monkeypatch):
+    """The stub server, reset, with the tools and client pointed at it"""
+    stub_server.fail_pattern = None
+    stub_server.tick = 0
+
+    monkeypatch.setattr(tools, "SITE_API_BASE", stub_server.site_api_base)
+    monkeypatch.setattr(tools, "CORE_API_BASE", stub_server.core_api_base)
+    monkeypatch.setattr(snapshot, "SNAPSHOT_PATH", "")
+    monkeypatch.setattr(live, "MIN_POLL_INTERVAL", 0)
+
+    settings = {
+        "rate_limit": client.RATE_LIMIT,
+        "rate_burst": client.RATE_BURST,
+        "backoff_base": client.BACKOFF_BASE,
+        "breaker_failures": client.BREAKER_FAILURES,
+        "breaker_reset": client.BREAKER_RESET,
+    }
+    # Fresh breakers, fast retries and no pacing
+    client.configure(
+        rate_limit=0, backoff_base=0.001, breaker_failures=settings["breaker_failures"]
+    )
+
+    _forget_everything()
+    yield stub_server
+    _forget_everything()
+    client.configure(**settings)
+
+
+def _forget_everything():
+    # Background stale-while-revalidate refreshes would count against the
+    # next test's stub requests
+    deadline = time.monotonic() + 5
+    while get_cache()._refreshing and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+    get_cache().clear()
+    live._pollers.clear()
+    snapshot.close()
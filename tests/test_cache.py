@@ -0,0 +1,124 @@
+"""TTLCache expiry, stale-while-revalidate and load coalescing"""
+
+import threading
+import time
+
+import pytest
+
+from sport_suggest_mcp.cache import MISSING, MemoryBackend, TTLCache
+
+
+def _wait_until(condition, timeout: float = 2):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def test_entries_expire_after_their_ttl():
+    cache = TTLCache()
+    cache.set("fresh", 1, ttl=60)
+    cache.set("expired", 2, ttl=60, stored_at=time.time() - 61)
+    cache.set("callable", {"live": True}, ttl=lambda value: 5 if value["live"] else 60)
+
+    assert cache.get("fresh") == 1
+    assert cache.get("expired") is MISSING
+    assert cache.get("callable") == {"live": True}
+    assert cache.stats()["entries"] == 2
+
+
+def test_backend_evicts_least_recently_used():
+    cache = TTLCache(MemoryBackend(max_entries=2))
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    cache.get("a")
+    cache.set("c", 3, ttl=60)
+
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+    assert cache.stats()["evictions"] == 1
+
+
+def test_stale_entry_is_served_while_one_refresh_replaces_it():
+    cache = TTLCache()
+    cache.set("key", "old", ttl=60, stale_ttl=600, stored_at=time.time() - 61)
+    release = threading.Event()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        release.wait(2)
+        return "new"
+
+    assert cache.get("key") is MISSING
+    assert cache.peek("key") == "old"
+    assert cache.get_or_load("key", loader, ttl=60, stale_ttl=600) == "old"
+    assert cache.get_or_load("key", loader, ttl=60, stale_ttl=600) == "old"
+
+    release.set()
+    _wait_until(lambda: cache.get("key") == "new")
+    assert len(calls) == 1
+    assert cache.stats()["stale_hits"] == 2
+    assert cache.stats()["refreshes"] == 1
+
+
+def test_failed_refresh_keeps_the_stale_entry():
+    cache = TTLCache()
+    cache.set("key", "old", ttl=60, stale_ttl=600, stored_at=time.time() - 61)
+
+    def loader():
+        raise RuntimeError("upstream down")
+
+    assert cache.get_or_load("key", loader, ttl=60, stale_ttl=600) == "old"
+    _wait_until(lambda: cache.stats()["refresh_errors"] == 1)
+    assert cache.peek("key") == "old"
+
+
+def test_entries_past_their_stale_window_are_reloaded():
+    cache = TTLCache()
+    cache.set("key", "old", ttl=60, stale_ttl=10, stored_at=time.time() - 75)
+
+    assert cache.peek("key") is MISSING
+    assert cache.get_or_load("key", lambda: "new", ttl=60, stale_ttl=10) == "new"
+
+
+def test_concurrent_misses_share_one_load():
+    cache = TTLCache()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        started.set()
+        release.wait(2)
+        return "value"
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(cache.get_or_load("key", loader, ttl=60))
+        )
+        for _ in range(8)
+    ]
+    threads[0].start()
+    started.wait(2)
+    for thread in threads[1:]:
+        thread.start()
+    _wait_until(lambda: cache.stats()["coalesced"] == 7)
+    release.set()
+    for thread in threads:
+        thread.join(2)
+
+    assert results == ["value"] * 8
+    assert len(calls) == 1
+
+
+def test_none_and_errors_are_not_cached():
+    cache = TTLCache()
+
+    assert cache.get_or_load("key", lambda: None, ttl=60) is None
+    with pytest.raises(ZeroDivisionError):
+        cache.get_or_load("key", lambda: 1 / 0, ttl=60)
+    assert cache.peek("key") is MISSING
+    assert cache.get_or_load("key", lambda: "value", ttl=60) == "value"
@@ -0,0 +1,83 @@
+"""Circuit breaker state changes, alone and inside the HTTP client"""
+
+import re
+import time
+
+import pytest
+
+from sport_suggest_mcp import client
+from sport_suggest_mcp.cache import get_cache
+from sport_suggest_mcp.circuit import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+
+
+def test_breaker_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+
+    for _ in range(2):
+        breaker.record_failure()
+    breaker.record_success()
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state == CLOSED and breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+    assert breaker.stats()["opened"] == 1
+    assert breaker.stats()["rejected"] == 1
+
+
+def test_half_open_breaker_lets_one_trial_through():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    # A failed trial opens it again for another reset_timeout
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    time.sleep(0.06)
+
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CLOSED and breaker.allow() and breaker.allow()
+
+
+def test_open_breaker_fails_fast_without_taking_a_token(stub):
+    client.configure(breaker_failures=2, breaker_reset=60, rate_limit=1000, rate_burst=1000)
+    stub.fail_pattern = re.compile("scoreboard")
+    url = f"{stub.site_api_base}/scoreboard"
+
+    with pytest.raises(client.requests.exceptions.RequestException):
+        client.get_json(url)
+    assert client.get_breaker_stats()["127.0.0.1"]["state"] == OPEN
+
+    requests_before = stub.request_count
+    tokens_before = client.get_rate_limit_stats()["acquired"]
+    with pytest.raises(CircuitOpenError):
+        client.get_json(url)
+
+    assert stub.request_count == requests_before
+    assert client.get_rate_limit_stats()["acquired"] == tokens_before
+
+
+def test_open_breaker_serves_the_expired_response(stub):
+    client.configure(breaker_failures=1, breaker_reset=60)
+    url = f"{stub.site_api_base}/scoreboard"
+    fresh = client.get_json(url, endpoint="scoreboard")
+
+    cache = get_cache()
+    value, _, stale_until = cache.backend.get(url)
+    cache.backend.set(url, value, time.time() - 1, stale_until)
+    stub.fail_pattern = re.compile("scoreboard")
+
+    # One failed attempt opens the breaker; the retry is refused and the
+    # expired entry answered instead, and later calls send nothing at all
+    before = stub.request_count
+    assert client.get_json(url, endpoint="scoreboard") == fresh
+    assert stub.request_count == before + 1
+    assert client.get_json(url, endpoint="scoreboard") == fresh
+    assert stub.request_count == before + 1
@@ -0,0 +1,100 @@
+"""ScoreboardPoller change feed: cursors, conditional polls and removed games"""
+
+from sport_suggest_mcp import client, live
+
+
+def _poller(stub, **kwargs) -> live.ScoreboardPoller:
+    return live.ScoreboardPoller(f"{stub.site_api_base}/scoreboard", **kwargs)
+
+
+def _ids(changes: dict) -> list:
+    return [game["game_id"] for game in changes["games"]]
+
+
+def test_cursor_returns_only_games_changed_after_it(stub):
+    poller = _poller(stub)
+    assert poller.poll() is True
+
+    first = poller.changes_since(None)
+    assert first["full"] is True and len(first["games"]) == 10
+    assert first["games"][2] == {
+        "game_id": first["games"][2]["game_id"],
+        "game_name": "T05 @ T06",
+        "status": "in_progress",
+        "period": 2,
+        "clock": "5:00",
+        "away_team": "T05",
+        "away_score": 48,
+        "home_team": "T06",
+        "home_score": 52,
+    }
+
+    stub.advance()
+    assert poller.poll() is True
+    second = poller.changes_since(first["cursor"])
+    assert second["full"] is False
+    assert _ids(second) == [first["games"][2]["game_id"]]
+    assert second["games"][0]["home_score"] == 54
+    assert (second["removed"], second["unchanged"]) == ([], 9)
+
+    # Nothing after the newest cursor
+    assert poller.changes_since(second["cursor"])["games"] == []
+
+
+def test_unchanged_scoreboard_is_not_modified(stub):
+    poller = _poller(stub)
+    poller.poll()
+    cursor = poller.cursor
+
+    assert poller.poll() is False
+    assert poller.cursor == cursor
+    assert poller.stats() == {"polls": 2, "not_modified": 1, "changed": 1}
+
+
+def test_polls_inside_min_interval_reuse_the_last_result(stub):
+    poller = _poller(stub, min_interval=60)
+    poller.poll()
+    before = stub.request_count
+
+    stub.advance()
+    assert poller.poll() is False
+    assert stub.request_count == before
+    assert poller.poll(force=True) is True
+
+
+def test_unknown_cursors_get_the_full_state(stub):
+    poller = _poller(stub)
+    poller.poll()
+
+    for cursor in ("", "other:0", f"{poller.generation}:99", f"{poller.generation}:x"):
+        changes = poller.changes_since(cursor)
+        assert changes["full"] is True and len(changes["games"]) == 10
+
+
+def test_removed_games_are_reported_once_per_cursor(stub):
+    poller = _poller(stub)
+    poller.poll()
+    cursor = poller.cursor
+
+    data = client.get_json(poller.url, fields=client.SCOREBOARD_FIELDS)
+    gone = data["events"].pop(0)["id"]
+    with poller._lock:
+        assert poller._apply(data) is True
+
+    changes = poller.changes_since(cursor)
+    assert (changes["games"], changes["removed"], changes["unchanged"]) == ([], [gone], 9)
+    assert poller.changes_since(cursor, teams={"T01"})["removed"] == [gone]
+    assert poller.changes_since(cursor, teams={"T03"})["removed"] == []
+    assert poller.changes_since(changes["cursor"])["removed"] == []
+
+
+def test_teams_filter_counts_only_watched_games(stub):
+    poller = _poller(stub)
+    poller.poll()
+    cursor = poller.cursor
+    stub.advance()
+    poller.poll()
+
+    changes = poller.changes_since(cursor, teams={"T05", "T01"})
+    assert [game["away_team"] for game in changes["games"]] == ["T05"]
+    assert changes["unchanged"] == 1
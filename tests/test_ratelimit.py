@@ -0,0 +1,36 @@
+"""Token bucket pacing"""
+
+import time
+
+from sport_suggest_mcp.ratelimit import TokenBucket
+
+
+def test_burst_is_free_then_requests_are_paced():
+    bucket = TokenBucket(rate=100, burst=5)
+
+    assert [bucket.acquire() for _ in range(5)] == [0.0] * 5
+
+    started = time.monotonic()
+    waits = [bucket.acquire() for _ in range(3)]
+    elapsed = time.monotonic() - started
+
+    assert all(wait > 0 for wait in waits)
+    assert elapsed >= 0.025
+    stats = bucket.stats()
+    assert (stats["acquired"], stats["waited"]) == (8, 3)
+
+
+def test_tokens_refill_over_time():
+    bucket = TokenBucket(rate=100, burst=2)
+    bucket.acquire()
+    bucket.acquire()
+    time.sleep(0.03)
+
+    assert bucket.acquire() == 0.0
+
+
+def test_zero_rate_disables_limiting():
+    bucket = TokenBucket(rate=0, burst=1)
+
+    assert [bucket.acquire() for _ in range(100)] == [0.0] * 100
+    assert bucket.stats()["acquired"] == 0
@@ -0,0 +1,77 @@
+"""SingleFlight call coalescing"""
+
+import threading
+import time
+
+import pytest
+
+from sport_suggest_mcp.singleflight import SingleFlight
+
+
+def _join_flight(flights: SingleFlight, key, fn, count: int) -> tuple:
+    """Run count callers of flights.do(key, fn) while the first one is in flight"""
+    entered = threading.Event()
+    release = threading.Event()
+    results, errors = [], []
+
+    def leader_fn():
+        entered.set()
+        release.wait(2)
+        return fn()
+
+    def call(target):
+        try:
+            results.append(flights.do(key, target))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call, args=(leader_fn,))]
+    threads[0].start()
+    entered.wait(2)
+    threads += [threading.Thread(target=call, args=(fn,)) for _ in range(count - 1)]
+    for thread in threads[1:]:
+        thread.start()
+
+    deadline = time.monotonic() + 2
+    while flights.stats()["coalesced"] < count - 1:
+        assert time.monotonic() < deadline, "callers never joined the flight"
+        time.sleep(0.005)
+
+    release.set()
+    for thread in threads:
+        thread.join(2)
+    return results, errors
+
+
+def test_concurrent_calls_share_one_execution():
+    flights = SingleFlight()
+    calls = []
+
+    results, errors = _join_flight(flights, "url", lambda: calls.append(1) or "body", 5)
+
+    assert results == ["body"] * 5 and not errors
+    assert len(calls) == 1
+    assert flights.stats() == {"calls": 5, "coalesced": 4}
+
+
+def test_exceptions_reach_every_caller():
+    flights = SingleFlight()
+
+    def fail():
+        raise ValueError("upstream failed")
+
+    results, errors = _join_flight(flights, "url", fail, 3)
+
+    assert results == []
+    assert len(errors) == 3 and all(isinstance(e, ValueError) for e in errors)
+
+
+def test_finished_flights_are_not_reused():
+    flights = SingleFlight()
+    counter = iter(range(10))
+
+    assert flights.do("url", lambda: next(counter)) == 0
+    assert flights.do("url", lambda: next(counter)) == 1
+    with pytest.raises(KeyError):
+        flights.do("url", lambda: {}["missing"])
+    assert flights.do("url", lambda: next(counter)) == 2
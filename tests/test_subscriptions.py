@@ -0,0 +1,100 @@
+"""Resource subscriptions over in-memory MCP sessions"""
+
+import asyncio
+import json
+
+import pytest
+from mcp.shared.exceptions import McpError
+from mcp.shared.memory import create_connected_server_and_client_session
+from mcp.types import ResourceUpdatedNotification, ServerNotification
+
+from sport_suggest_mcp import server
+from sport_suggest_mcp.subscriptions import SubscriptionHub
+
+INTERVAL = 0.05
+
+
+@pytest.fixture
+def hub(stub, monkeypatch):
+    monkeypatch.setattr(server._subscriptions, "interval", INTERVAL)
+    yield server._subscriptions
+    assert server._subscriptions.subscriber_count() == 0
+
+
+async def _wait_until(condition, timeout: float = 2):
+    for _ in range(int(timeout / 0.01)):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("timed out")
+
+
+def test_hub_rejects_resources_without_updates():
+    hub = SubscriptionHub(get_poller=None)
+
+    for uri in ("nba://stats", "nba://game/", "nba://scores", "https://espn.com"):
+        with pytest.raises(ValueError):
+            hub.subscribe(uri, session=object())
+    assert hub.subscriber_count() == 0
+
+
+def test_subscribers_are_notified_of_changed_games(stub, hub):
+    received = []
+
+    async def on_message(message):
+        if isinstance(message, ServerNotification) and isinstance(
+            message.root, ResourceUpdatedNotification
+        ):
+            received.append(str(message.root.params.uri))
+
+    async def run():
+        async with create_connected_server_and_client_session(
+            server.server, message_handler=on_message
+        ) as session:
+            board = await session.read_resource("nba://scoreboard")
+            games = json.loads(board.contents[0].text)["games"]
+
+            await session.subscribe_resource("nba://scoreboard")
+            await session.subscribe_resource(f"nba://game/{games[2]['game_id']}")
+            await session.subscribe_resource(f"nba://game/{games[0]['game_id']}")
+            assert hub.subscriber_count() == 3
+
+            stub.advance()
+            await _wait_until(lambda: len(received) >= 2)
+            await asyncio.sleep(3 * INTERVAL)
+
+            await session.unsubscribe_resource("nba://scoreboard")
+            await session.unsubscribe_resource(f"nba://game/{games[2]['game_id']}")
+            await session.unsubscribe_resource(f"nba://game/{games[0]['game_id']}")
+            return games
+
+    games = asyncio.run(run())
+    assert sorted(received) == sorted(["nba://scoreboard", f"nba://game/{games[2]['game_id']}"])
+
+
+def test_invalid_subscriptions_are_refused(stub, hub):
+    async def run():
+        async with create_connected_server_and_client_session(server.server) as session:
+            for uri in ("nba://stats", "nba://game/999999", "nba://game/"):
+                with pytest.raises(McpError):
+                    await session.subscribe_resource(uri)
+
+    asyncio.run(run())
+    assert hub.subscriber_count() == 0
+
+
+def test_closing_a_session_drops_its_subscriptions(stub, hub):
+    async def run():
+        async with create_connected_server_and_client_session(server.server) as session:
+            await session.subscribe_resource("nba://scoreboard")
+            assert hub.subscriber_count() == 1
+        await _wait_until(lambda: hub.subscriber_count() == 0)
+        assert hub._task is None
+
+        # A poll already running on the tool pool may still finish
+        await asyncio.sleep(2 * INTERVAL)
+        before = stub.request_count
+        await asyncio.sleep(3 * INTERVAL)
+        return stub.request_count - before
+
+    assert asyncio.run(run()) == 0
@@ -0,0 +1,269 @@
+"""
+Tool outputs against the stub server, and the invariants the caching and
+push-down paths must keep: a filtered, cached, stale or snapshotted answer
+is byte-identical to the one computed from scratch.
+"""
+
+import json
+import re
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from sport_suggest_mcp import snapshot, tools
+from sport_suggest_mcp.cache import get_cache
+
+
+def _days_ago(days: int) -> str:
+    return (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+def _expire(key: str):
+    """Age a cache entry past its TTL (but inside its stale window)"""
+    cache = get_cache()
+    value, _, stale_until = cache.backend.get(key)
+    cache.backend.set(key, value, time.time() - 1, stale_until)
+
+
+# ----------------------------------------------------------------------------
+# get_nba_scores
+# ----------------------------------------------------------------------------
+
+
+def test_scores_default_to_todays_live_and_upcoming_games(stub):
+    result = tools.get_nba_scores()
+
+    assert result.startswith("Found 10 live/upcoming NBA game(s):")
+    assert "T01 @ T02" in result
+
+
+def test_scores_filter_by_team_and_status(stub):
+    assert tools.get_nba_scores(teams=["T03"]).startswith("Found 1 live/upcoming")
+    assert tools.get_nba_scores(status="live").startswith("Found 5 live/upcoming")
+    assert tools.get_nba_scores(status="final") == "No NBA games found matching the filters."
+
+
+def test_scores_for_a_past_date_include_completed_games(stub):
+    date = _days_ago(2)
+
+    assert tools.get_nba_scores(date=date).startswith("Found 10 NBA game(s):")
+    assert tools.get_nba_scores(date=date, status="final").startswith(
+        "Found 10 completed NBA game(s):"
+    )
+    assert tools.get_nba_scores(date=date, status="upcoming") == (
+        "No NBA games found matching the filters."
+    )
+
+
+def test_scores_reject_invalid_filters(stub):
+    assert tools.get_nba_scores(date="yesterday").startswith("Error:")
+    assert tools.get_nba_scores(status="halftime").startswith("Error:")
+
+
+def test_past_days_are_served_from_the_cache(stub):
+    date = _days_ago(3)
+    tools.get_nba_scores(date=date, end_date=_days_ago(1))
+
+    before = stub.request_count
+    tools.get_nba_scores(date=date, end_date=_days_ago(1))
+    assert stub.request_count == before
+
+
+# ----------------------------------------------------------------------------
+# Rosters and rankings
+# ----------------------------------------------------------------------------
+
+
+def test_rosters_list_every_team(stub):
+    result = tools.get_nba_rosters()
+
+    assert result.startswith("NBA Team Rosters:")
+    assert result.count("**Team ") == 30
+
+
+def test_rankings_resolve_names_and_teams(stub):
+    lines = tools.get_nba_player_rankings().splitlines()
+
+    assert lines[2] == "Top 50 Players:"
+    assert lines[3] == "1. Player 100 (T01) - Rating: 100.0"
+    assert len(lines) == 3 + 50
+
+
+def test_filtered_rosters_match_cold_warm_and_stale(stub):
+    cold = tools.get_nba_rosters(teams=["T01", "T02"])
+
+    tools.get_nba_rosters()
+    warm = tools.get_nba_rosters(teams=["T01", "T02"])
+
+    _expire(tools.ROSTER_CACHE_KEY)
+    before = stub.request_count
+    stale = tools.get_nba_rosters(teams=["T01", "T02"])
+
+    assert cold == warm == stale
+    # The stale answer came from the cache; only the background refresh
+    # (the teams list plus 30 rosters) went upstream
+    assert stub.request_count - before <= 31
+
+
+def test_filtered_rankings_match_cold_warm_and_stale(stub):
+    cold_top = tools.get_nba_player_rankings(top_n=10)
+    cold_team = tools.get_nba_player_rankings(teams=["T01"])
+
+    tools.get_nba_player_rankings()
+    assert tools.get_nba_player_rankings(top_n=10) == cold_top
+    assert tools.get_nba_player_rankings(teams=["T01"]) == cold_team
+
+    _expire(tools.RANKINGS_CACHE_KEY)
+    assert tools.get_nba_player_rankings(top_n=10) == cold_top
+
+
+def test_filtered_calls_use_the_snapshot(stub, tmp_path, monkeypatch):
+    monkeypatch.setattr(snapshot, "SNAPSHOT_PATH", str(tmp_path / "snapshot.sqlite3"))
+    rosters = tools.get_nba_rosters(teams=["T05"])
+    tools.get_nba_rosters()
+    rankings = tools.get_nba_player_rankings(top_n=5)
+    tools.get_nba_player_rankings()
+
+    # A restarted server: empty cache, snapshot on disk
+    get_cache().clear()
+    snapshot.close()
+
+    before = stub.request_count
+    assert tools.get_nba_rosters(teams=["T05"]) == rosters
+    assert tools.get_nba_player_rankings(top_n=5) == rankings
+    assert stub.request_count == before
+
+
+# ----------------------------------------------------------------------------
+# get_nba_score_updates
+# ----------------------------------------------------------------------------
+
+
+def test_score_updates_return_only_changed_games(stub):
+    first = json.loads(tools.get_nba_score_updates())
+    assert first["full"] is True
+    assert len(first["games"]) == 10
+
+    unchanged = json.loads(tools.get_nba_score_updates(first["cursor"]))
+    assert unchanged["games"] == [] and unchanged["unchanged"] == 10
+
+    stub.advance()
+    changed = json.loads(tools.get_nba_score_updates(first["cursor"]))
+    assert [game["game_id"] for game in changed["games"]] == [first["games"][2]["game_id"]]
+    assert changed["unchanged"] == 9
+
+    scoped = json.loads(tools.get_nba_score_updates(first["cursor"], teams=["T01"]))
+    assert scoped["games"] == [] and scoped["unchanged"] == 1
+
+
+# ----------------------------------------------------------------------------
+# get_nba_recommendation_data
+# ----------------------------------------------------------------------------
+
+
+def _game(data: dict, away: str) -> dict:
+    return next(game for game in data["games"] if game["away_team"]["abbreviation"] == away)
+
+
+def test_recommendation_data_joins_stars_and_injuries(stub):
+    data = json.loads(tools.get_nba_recommendation_data())
+    metadata = data["metadata"]
+
+    assert (metadata["games_count"], metadata["top_players_count"], metadata["teams_count"]) == (
+        10,
+        50,
+        30,
+    )
+    assert "degraded" not in metadata
+
+    summary = _game(data, "T01")["summary"]
+    assert summary["stars"]["out"] == [
+        {"rank": 1, "name": "Player 100", "team": "T01", "status": "Out"},
+        {"rank": 2, "name": "Player 200", "team": "T02", "status": "Out"},
+    ]
+    assert [star["rank"] for star in summary["stars"]["active"]] == [31, 32]
+    assert summary["national_broadcast"] is True
+
+
+def test_recommendation_payload_bytes_is_exact(stub):
+    for kwargs in ({}, {"compact": True}, {"summary": True}):
+        payload = tools.get_nba_recommendation_data(**kwargs)
+        assert json.loads(payload)["metadata"]["payload_bytes"] == len(payload.encode())
+
+
+def test_compact_and_summary_keep_the_summaries(stub):
+    full = json.loads(tools.get_nba_recommendation_data())
+    compact = json.loads(tools.get_nba_recommendation_data(compact=True))
+    summary = json.loads(tools.get_nba_recommendation_data(summary=True))
+
+    summaries = [game["summary"] for game in full["games"]]
+    assert [game["summary"] for game in compact["games"]] == summaries
+    assert [game["summary"] for game in summary["games"]] == summaries
+    assert set(compact["team_rosters"]) == {f"T{team:02d}" for team in range(1, 21)}
+    assert "player_rankings" not in summary
+
+
+def test_compact_trims_sections_in_order(stub):
+    steps = [step for step, _ in tools.COMPACT_TRIM_STEPS]
+    untrimmed = len(tools.get_nba_recommendation_data(compact=True).encode())
+
+    seen = []
+    for budget in (untrimmed, untrimmed - 1, 8000, 4000, 1):
+        payload = tools.get_nba_recommendation_data(compact=True, max_bytes=budget)
+        metadata = json.loads(payload)["metadata"]
+        trimmed = metadata.get("trimmed", [])
+
+        assert trimmed == steps[: len(trimmed)]
+        assert len(trimmed) >= len(seen)
+        if metadata.get("over_budget"):
+            assert trimmed == steps
+        else:
+            assert len(payload.encode()) <= budget
+        seen = trimmed
+
+    assert seen == steps
+
+
+def test_recommendation_data_degrades_failed_sections(stub):
+    stub.fail_pattern = re.compile("leaders|roster|/teams|injuries")
+
+    data = json.loads(tools.get_nba_recommendation_data())
+
+    assert data["metadata"]["degraded"] == {
+        "player_rankings": "missing",
+        "team_rosters": "missing",
+        "matchup_injuries": "missing",
+    }
+    assert data["games"][0]["matchup_injuries"]["error"] == "Could not fetch injury data"
+
+
+def test_recommendation_data_serves_stale_sections_when_fetches_fail(stub, tmp_path, monkeypatch):
+    monkeypatch.setattr(snapshot, "SNAPSHOT_PATH", str(tmp_path / "snapshot.sqlite3"))
+    fresh = json.loads(tools.get_nba_recommendation_data())
+
+    # Snapshots too old to seed the cache, and nothing cached
+    snapshot._connect().execute("UPDATE snapshots SET saved_at = 1")
+    snapshot._connect().commit()
+    get_cache().clear()
+    snapshot.close()
+
+    stub.fail_pattern = re.compile("leaders|roster|/teams")
+    data = json.loads(tools.get_nba_recommendation_data())
+
+    assert data["metadata"]["degraded"] == {"player_rankings": "stale", "team_rosters": "stale"}
+    assert data["player_rankings"] == fresh["player_rankings"]
+    assert data["team_rosters"] == fresh["team_rosters"]
+
+
+@pytest.mark.parametrize("teams", [["T01"], ["T01", "T04"]])
+def test_filtered_recommendation_data_matches_the_unfiltered_games(stub, teams):
+    full = json.loads(tools.get_nba_recommendation_data())
+    filtered = json.loads(tools.get_nba_recommendation_data(teams=teams))
+
+    expected = [
+        game
+        for game in full["games"]
+        if {game["away_team"]["abbreviation"], game["home_team"]["abbreviation"]} & set(teams)
+    ]
+    assert filtered["games"] == expected